@@ -31,7 +31,8 @@ to interface with the dotnet DLLs and to transform F# data structure into the
 """
 
 import logging
-from typing import Callable, Union
+import re
+from typing import Callable, Optional, Union
 
 # dotnet configuration
 import ansys.scadeone.core.model.dotnet  # noqa
@@ -72,6 +73,9 @@ SwanTestVersion = ParserTools.SwanTestVersion
 # dictionary of Swan versions
 VersionMap = ParserTools.VersionInfos
 
+# characters beyond the Basic Multilingual Plane
+NonBMPRe = re.compile("[\U00010000-\U0010ffff]")
+
 
 class ParserLogger(ILogger):
     """Logger class for the parser. An instance of the
@@ -125,7 +129,13 @@ class SwanParser(Parser):
     def __init__(self, logger: logging.Logger) -> None:
         self._logger = ParserLogger(logger)
 
-    def _parse(self, rule_fn: Callable, swan: SwanStorage, parse_error_ok: bool = False) -> tuple:
+    def _parse(
+        self,
+        rule_fn: Callable,
+        swan: SwanStorage,
+        parse_error_ok: bool = False,
+        content: Optional[str] = None,
+    ) -> tuple:
         """Call F# parser with a given rule
 
         Parameters
@@ -134,6 +144,10 @@ class SwanParser(Parser):
             Parser rule function
         swan : SwanStorage
             Swan code to parse
+        parse_error_ok : bool, optional
+            If True, returns None on parse error.
+        content : Optional[str], optional
+            Content of *swan*, if already read.
 
         Returns
         -------
@@ -151,7 +165,9 @@ class SwanParser(Parser):
         Parser.set_source(swan)
 
         try:
-            result = rule_fn(swan.source, swan.content(), self._logger)
+            if content is None:
+                content = swan.content()
+            result = rule_fn(swan.source, content, self._logger)
         except Reader.ParseError as e:
             if parse_error_ok:
                 return None
@@ -160,6 +176,19 @@ class SwanParser(Parser):
             raise ScadeOneException(f"Internal: {e}")
         return result
 
+    def _parse_module(self, rule_fn: Callable, of_ast: Callable, swan: SwanStorage) -> Swan.Module:
+        """Parse a module and keep its source code, to copy the unmodified declarations
+        when the module is printed."""
+        content = swan.content()
+        result = self._parse(rule_fn, swan, content=content)
+        module = of_ast(swan.name, result.Item1)
+        # The source offsets of the parser are after the version line. They count
+        # UTF-16 code units, which differ from Python characters beyond the BMP.
+        if not NonBMPRe.search(content):
+            module.source_version = content[: content.find("\n")].strip()
+            module.source_text = content[content.find("\n") + 1 :]
+        return module
+
     def module_body(self, source: SwanStorage) -> Swan.ModuleBody:
         """Parse a Swan module from a SwanStorage object.
 
@@ -184,8 +213,7 @@ class SwanParser(Parser):
         """
         if not source.check_swan_version():
             raise ScadeOneException("Invalid Swan version for module body parsing.")
-        result = self._parse(Reader.parse_body, source)
-        return moduleOfAst(source.name, result.Item1)
+        return self._parse_module(Reader.parse_body, moduleOfAst, source)
 
     def test_module(self, source: SwanStorage) -> Swan.TestModule:
         """Parse a Swan test from a SwanStorage object.
@@ -211,8 +239,7 @@ class SwanParser(Parser):
         """
         if not source.check_swant_version():
             raise ScadeOneException("Invalid Swan version for test module parsing.")
-        result = self._parse(Reader.parse_test, source)
-        return testOfAst(source.name, result.Item1)
+        return self._parse_module(Reader.parse_test, testOfAst, source)
 
     def module_interface(self, source: SwanStorage) -> Swan.ModuleInterface:
         """Parse a Swan interface from a SwanStorage object.
@@ -238,8 +265,7 @@ class SwanParser(Parser):
         """
         if not source.check_swan_version():
             raise ScadeOneException("Invalid Swan version for module interface parsing.")
-        result = self._parse(Reader.parse_interface, source)
-        return interfaceOfAst(source.name, result.Item1)
+        return self._parse_module(Reader.parse_interface, interfaceOfAst, source)
 
     def declaration(self, source: SwanStorage) -> Swan.Declaration:
         """Parse a Swan declaration:
@@ -212,6 +212,8 @@ class Model(IModel):
         else:
             raise ScadeOneException(f"Model.load_source: unexpected file kind {swan_f.path}.")
         ast.owner = self
+        # The module is the same as its source
+        ast.is_modified = False
         return ast
 
     @property
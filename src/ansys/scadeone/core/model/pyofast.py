@@ -32,7 +32,7 @@
 The PyOfAst module transforms F# AST into Python ansys.scadeone.core.swan classes.
 """
 
-from typing import Optional, Union, List, Any
+from typing import Optional, Union, List, Any, Tuple
 
 # pylint: disable-next=import-error
 from ANSYS.SONE.Infrastructure.Services.Serialization.BNF.Parsing import Ast, Raw
@@ -1608,12 +1608,28 @@ def declarationOfAst(ast):
     raise ScadeOneException(f"unexpected ast class: {type(ast)}")
 
 
+def sourceSpanOfAst(ast) -> Optional[Tuple[int, int]]:
+    """Return the source offsets of a declaration, after the version line."""
+    if ast.IsDOperator or ast.IsDSignature:
+        sp = ast.Item.OpSP
+    elif ast.IsDTestHarness:
+        sp = ast.Item.HSP
+    elif ast.IsDRaw:
+        # no source position
+        return None
+    else:
+        sp = ast.Item2
+    return (sp.SourceStart, sp.SourceEnd)
+
+
 def allDeclsOfAst(ast):
     use_list = []
     decl_list = []
 
     for decl in ast.MDecls:
         py_obj = declarationOfAst(decl)
+        py_obj.source_span = sourceSpanOfAst(decl)
+        py_obj.is_modified = False
         if isinstance(py_obj, Swan.UseDirective):
             use_list.append(py_obj)
         else:
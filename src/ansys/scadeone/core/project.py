@@ -39,7 +39,8 @@ from ansys.scadeone.core.job import Job
 from ansys.scadeone.core.svc.swan_creator.job_creator import JobFactory
 from ansys.scadeone.core.model.model import Model
 from ansys.scadeone.core.svc.swan_creator.project_creator import ProjectCreator
-from ansys.scadeone.core.svc.swan_printer import swan_to_str
+from ansys.scadeone.core.svc.swan_hash import detect_modifications, refresh_module_state
+from ansys.scadeone.core.svc.swan_printer import swan_to_files
 from ansys.scadeone.core.common.logger import LOGGER
 from ansys.scadeone.core.swan.modules import Module
 
@@ -227,7 +228,7 @@ class Project(IProject, ProjectCreator):
         self._is_modified = True
         self._version = FormatVersions.version("sproj")
 
-    def save(self) -> None:
+    def save(self, workers: int = 1, only_modified: bool = True) -> None:
         """Save the following:
 
         - Project modules
@@ -239,25 +240,44 @@ class Project(IProject, ProjectCreator):
 
         - new project, saving to the `.sproj` location
         - loaded project, saving and replacing old files
-        """
-
-        if not self._is_new:
-            self.model.load_all_modules()
-
-        for module in self.model.modules:
-            if not (source := module.source):
-                raise ScadeOneException(f"Module {module.name.as_string} has no source to save.")
-            try:
-                module_src = Path(source)
-                module_src.parent.mkdir(parents=True, exist_ok=True)
 
-                with module_src.open("w", newline="") as fd:
-                    fd.write(swan_to_str(module))
+        By default, only the modules which are new or modified since they were loaded or
+        saved are written (see :py:attr:`ansys.scadeone.core.swan.Module.is_modified`).
+        The modules which are not loaded are not modified. Each module is written to
+        a temporary file which then replaces the module file. In a loaded module,
+        the source code of the unmodified declarations is kept.
+
+        The modifications are known from
+        :py:meth:`ansys.scadeone.core.swan.SwanItem.set_modified`, which the creators
+        and the setters call. A construct modified directly must call it, else its
+        modification is not saved. Alternatively, the modifications of the modules
+        whose state was recorded by
+        :py:func:`ansys.scadeone.core.svc.swan_hash.record_module_state` are detected
+        by comparing their structural hashes, or all the loaded modules are written
+        with *only_modified* set to False.
 
-                LOGGER.info(f"Saved: {module.source}")
+        Parameters
+        ----------
+        workers : int, optional
+            Number of processes printing the modules, by default 1.
+            See :py:func:`ansys.scadeone.core.svc.swan_printer.swan_to_files`.
+        only_modified : bool, optional
+            Write only the modified modules, by default True. If False, all the loaded
+            modules are written, without keeping their source code.
+        """
 
-            except Exception as e:
-                raise ScadeOneException(f"Failed to save module {module.name.as_string}: {e}")
+        if only_modified:
+            modules = [module for module in self.model.modules if detect_modifications(module)]
+        else:
+            modules = self.model.modules
+        timings = swan_to_files(modules, workers, keep_source=only_modified)
+        for module in modules:
+            module.is_modified = False
+            if not only_modified:
+                # the file is not the source code anymore, which must not be kept
+                module.source_text = None
+            refresh_module_state(module)
+            LOGGER.info(f"Saved: {module.source} ({timings[module.source]:.3f} s)")
 
         if self._is_new or self._is_modified:
             self._save_sproj()
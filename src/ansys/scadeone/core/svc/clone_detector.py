@@ -0,0 +1,431 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module contains the detection of duplicated logic in a model.
+
+Operator bodies, equations and diagram sub-graphs are fingerprinted with a structural
+hash where identifiers and lunums are replaced by their order of appearance. Two
+constructs which only differ by their names have the same fingerprint.
+
+- Exact clones are the constructs with the same fingerprint.
+- Near-duplicate operators have similar sets of equation and diagram object fingerprints.
+  Candidate pairs are found with MinHash signatures and locality-sensitive hashing
+  buckets, then their similarity is checked. The operators are not compared pairwise.
+"""
+
+from hashlib import blake2b
+import random
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import ansys.scadeone.core.swan as swan
+from ansys.scadeone.core.common.exception import ScadeOneException
+from ansys.scadeone.core.interfaces import IModel
+from ansys.scadeone.core.svc.swan_hash import StructuralHasher
+from ansys.scadeone.core.svc.swan_visitor import Owner, OwnerProperty
+
+__all__ = ["CloneDetector", "CloneGroup"]
+
+# Mersenne prime for MinHash permutations
+_PRIME = (1 << 61) - 1
+
+
+class _NormalizedHasher(StructuralHasher):
+    """Structural hasher where names and lunums are replaced by their order of appearance.
+
+    Pragmas and luids are ignored. The hashes are not cached, as they depend on
+    the renaming of the visited unit.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(ignore_layout=True)
+        self._names: Dict[str, str] = {}
+        #: Number of Swan objects of the hashed unit.
+        self.size = 0
+
+    def _rename(self, name: str) -> bytes:
+        if (renamed := self._names.get(name)) is None:
+            renamed = self._names[name] = f"n{len(self._names)}"
+        return renamed.encode()
+
+    def _get_digest(
+        self, swan_obj: swan.SwanItem, owner: Owner, owner_property: OwnerProperty
+    ) -> bytes:
+        self.size += 1
+        self._frames.append(blake2b(type(swan_obj).__name__.encode(), digest_size=16))
+        super(StructuralHasher, self)._visit(swan_obj, owner, owner_property)
+        return self._frames.pop().digest()
+
+    def visit_Identifier(
+        self, swan_obj: swan.Identifier, owner: Owner, owner_property: OwnerProperty
+    ) -> None:
+        self._update("value", self._rename(swan_obj.value))
+
+    def visit_Lunum(
+        self, swan_obj: swan.Lunum, owner: Owner, owner_property: OwnerProperty
+    ) -> None:
+        self._update("value", self._rename(swan_obj.value))
+
+    def visit_Pragma(
+        self, swan_obj: swan.Pragma, owner: Owner, owner_property: OwnerProperty
+    ) -> None:
+        pass
+
+    def hash_unit(self, swan_objs: Iterable[swan.SwanItem]) -> int:
+        """Return the hash of a sequence of objects, with a common renaming."""
+        for swan_obj in swan_objs:
+            self._update("unit", self._get_digest(swan_obj, None, None))
+        return int.from_bytes(self._frames[0].digest(), "big")
+
+
+def _fingerprint(swan_objs: Iterable[swan.SwanItem]) -> Tuple[int, int]:
+    # normalized hash and size of a unit
+    hasher = _NormalizedHasher()
+    return hasher.hash_unit(swan_objs), hasher.size
+
+
+class CloneGroup:
+    """Group of duplicated constructs.
+
+    Parameters
+    ----------
+    kind : str
+        Kind of the constructs: *operator*, *equation* or *diagram*
+        (a connected part of a diagram).
+    items : List[List[SwanItem]]
+        Duplicated constructs. An operator or an equation is a list of one object,
+        a diagram part is the list of its blocks and wires.
+    similarity : float
+        1.0 for exact clones, else the lowest similarity of all the pairs of constructs
+        of the group.
+    size : int
+        Number of Swan objects of the first construct.
+    exact : bool, optional
+        True for exact clones, which have the same fingerprint, by default False.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        items: List[List[swan.SwanItem]],
+        similarity: float,
+        size: int,
+        exact: bool = False,
+    ) -> None:
+        self._kind = kind
+        self._items = items
+        self._similarity = similarity
+        self._size = size
+        self._exact = exact
+
+    @property
+    def kind(self) -> str:
+        """Kind of the constructs."""
+        return self._kind
+
+    @property
+    def items(self) -> List[List[swan.SwanItem]]:
+        """Duplicated constructs."""
+        return self._items
+
+    @property
+    def similarity(self) -> float:
+        """Lowest similarity of the pairs of constructs which linked the group,
+        1.0 for exact clones.
+
+        Near duplicates can have a similarity of 1.0 too, when their equations and
+        diagram objects are the same but not their interfaces.
+        """
+        return self._similarity
+
+    @property
+    def size(self) -> int:
+        """Number of Swan objects of the first construct."""
+        return self._size
+
+    @property
+    def is_exact(self) -> bool:
+        """True for exact clones, up to the names."""
+        return self._exact
+
+    def __repr__(self) -> str:
+        return f"CloneGroup({self.kind}, {len(self.items)} items, similarity={self.similarity:.2f})"
+
+
+class CloneDetector:
+    """Detection of copy-pasted operators, equations and diagram parts.
+
+    The fingerprints are computed when the detector is created, in one pass over the operators.
+
+    Parameters
+    ----------
+    operators : Union[Model, Iterable[OperatorDefinition]]
+        Model, whose operator definitions are analyzed, or operator definitions.
+    min_size : int, optional
+        Minimal number of Swan objects of a reported operator, equation or diagram part,
+        by default 20. Smaller constructs are too common to be meaningful clones.
+    num_perm : int, optional
+        Number of MinHash permutations, by default 32.
+    bands : int, optional
+        Number of locality-sensitive hashing bands, by default 16. *num_perm* must be a
+        multiple of *bands*. More bands find more candidate pairs of low similarity.
+    seed : int, optional
+        Seed of the MinHash permutations.
+    """
+
+    def __init__(
+        self,
+        operators: Union[IModel, Iterable[swan.OperatorDefinition]],
+        min_size: int = 20,
+        num_perm: int = 32,
+        bands: int = 16,
+        seed: int = 1,
+    ) -> None:
+        if num_perm % bands != 0:
+            raise ScadeOneException("The number of permutations must be a multiple of bands.")
+        if isinstance(operators, IModel):
+            operators = operators.operator_definitions
+        self._min_size = min_size
+        self._bands = bands
+        generator = random.Random(seed)
+        self._permutations = [
+            (generator.randrange(1, _PRIME), generator.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+        self._operators: List[swan.OperatorDefinition] = []
+        # (kind, fingerprint) -> (size, items)
+        self._units: Dict[Tuple[str, int], Tuple[int, List[List[swan.SwanItem]]]] = {}
+        # features of each operator: fingerprints of its parts
+        self._features: List[Set[int]] = []
+        # fingerprint and size of each operator
+        self._fingerprints: List[Tuple[int, int]] = []
+        for operator in operators:
+            self._add_operator(operator)
+
+    # Fingerprints
+    # ------------
+
+    def _add_unit(self, kind: str, swan_objs: List[swan.SwanItem]) -> Tuple[int, int]:
+        fingerprint, size = _fingerprint(swan_objs)
+        if size >= self._min_size:
+            entry = self._units.setdefault((kind, fingerprint), (size, []))
+            entry[1].append(swan_objs)
+        return fingerprint, size
+
+    def _add_operator(self, operator: swan.OperatorDefinition) -> None:
+        self._operators.append(operator)
+        self._fingerprints.append(self._add_unit("operator", [operator]))
+        features = []
+        for equation in self._equations(operator):
+            features.append(self._add_unit("equation", [equation])[0])
+        for diagram in operator.diagrams:
+            for part in self._diagram_parts(diagram):
+                features.append(self._add_unit("diagram", part)[0])
+            for obj in diagram.objects:
+                features.append(_fingerprint([obj])[0])
+        # multiset of features as a set
+        counts: Dict[int, int] = {}
+        feature_set = set()
+        for feature in features:
+            count = counts.get(feature, 0)
+            counts[feature] = count + 1
+            feature_set.add(feature ^ count)
+        self._features.append(feature_set)
+
+    @staticmethod
+    def _equations(operator: swan.OperatorDefinition) -> Iterator[swan.Equation]:
+        body = operator.body
+        if isinstance(body, swan.Equation):
+            yield body
+        elif isinstance(body, swan.Scope):
+            for section in body.sections:
+                if isinstance(section, swan.LetSection):
+                    yield from section.equations
+
+    @staticmethod
+    def _diagram_parts(diagram: swan.Diagram) -> List[List[swan.DiagramObject]]:
+        """Return the connected parts of a diagram, objects being connected by wires."""
+        # union-find on diagram objects, indexed by position
+        parents = list(range(len(diagram.objects)))
+
+        def find(index: int) -> int:
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+
+        def union(index1: int, index2: int) -> None:
+            parents[find(index1)] = find(index2)
+
+        positions = {}
+        for index, obj in enumerate(diagram.objects):
+            for lunum in [obj.lunum] + [local.lunum for local in obj.locals]:
+                if lunum is not None:
+                    positions[lunum.value] = index
+        for index, obj in enumerate(diagram.objects):
+            if not isinstance(obj, swan.Wire):
+                continue
+            for connection in [obj.source] + obj.targets:
+                if connection.is_connected and connection.port.lunum is not None:
+                    if (position := positions.get(connection.port.lunum.value)) is not None:
+                        union(index, position)
+        parts: Dict[int, List[swan.DiagramObject]] = {}
+        for index, obj in enumerate(diagram.objects):
+            parts.setdefault(find(index), []).append(obj)
+        return list(parts.values())
+
+    # Exact clones
+    # ------------
+
+    def exact_clones(self, kind: Optional[str] = None) -> List[CloneGroup]:
+        """Return the groups of constructs with the same structure, up to the names.
+
+        Parameters
+        ----------
+        kind : Optional[str], optional
+            *operator*, *equation* or *diagram* to get only one kind of groups, by default None.
+
+        Returns
+        -------
+        List[CloneGroup]
+            Groups of clones, the largest constructs first.
+        """
+        groups = [
+            CloneGroup(unit_kind, items, 1.0, size, exact=True)
+            for (unit_kind, _), (size, items) in self._units.items()
+            if len(items) > 1 and (kind is None or kind == unit_kind)
+        ]
+        groups.sort(key=lambda group: -group.size)
+        return groups
+
+    # Near duplicates
+    # ---------------
+
+    def _signature(self, features: Set[int]) -> List[int]:
+        values = [feature & _PRIME for feature in features]
+        return [min((a * value + b) % _PRIME for value in values) for a, b in self._permutations]
+
+    def _similarity(self, index1: int, index2: int) -> float:
+        features1, features2 = self._features[index1], self._features[index2]
+        return len(features1 & features2) / len(features1 | features2)
+
+    def near_duplicates(
+        self, threshold: float = 0.8, max_bucket_size: int = 50
+    ) -> List[CloneGroup]:
+        """Return the groups of similar operators which are not exact clones.
+
+        The similarity of two operators is the Jaccard index of the fingerprints of their
+        equations and diagram objects. Candidate pairs share a bucket of the MinHash
+        signatures, their similarity is then computed. In a bucket of more than
+        *max_bucket_size* operators, each operator is only compared with the
+        *max_bucket_size* next ones, and the pairs of operators already in the same
+        group are not compared.
+
+        The groups are built by single linkage: two operators are in the same group
+        if they are linked by a chain of pairs whose similarity reaches *threshold*.
+        The similarity of a group is the lowest similarity of the pairs which linked it,
+        so it is at least *threshold*. Of the exact clones, only one operator is kept, and
+        the operators smaller than *min_size* Swan objects are not reported.
+
+        Parameters
+        ----------
+        threshold : float, optional
+            Minimal similarity of the linked pairs of operators, by default 0.8.
+        max_bucket_size : int, optional
+            Number of operators of a bucket compared with each operator, by default 50.
+
+        Returns
+        -------
+        List[CloneGroup]
+            Groups of near-duplicate operators.
+        """
+        rows = len(self._permutations) // self._bands
+        # operators with the same fingerprint are exact clones, one of them is kept
+        representatives: Dict[int, int] = {}
+        buckets: Dict[Tuple[int, tuple], List[int]] = {}
+        for index, features in enumerate(self._features):
+            if not features:
+                continue
+            fingerprint, size = self._fingerprints[index]
+            if fingerprint in representatives or size < self._min_size:
+                continue
+            representatives[fingerprint] = index
+            signature = self._signature(features)
+            for band in range(self._bands):
+                key = (band, tuple(signature[band * rows : (band + 1) * rows]))
+                buckets.setdefault(key, []).append(index)
+
+        # union-find with path compression and union by rank,
+        # with the lowest similarity of the linking pairs of each group
+        parents: Dict[int, int] = {}
+        ranks: Dict[int, int] = {}
+        similarities: Dict[int, float] = {}
+
+        def find(index: int) -> int:
+            root = index
+            while parents[root] != root:
+                root = parents[root]
+            while parents[index] != root:
+                parents[index], index = root, parents[index]
+            return root
+
+        def union(root1: int, root2: int, similarity: float) -> None:
+            if ranks[root1] < ranks[root2]:
+                root1, root2 = root2, root1
+            parents[root2] = root1
+            if ranks[root1] == ranks[root2]:
+                ranks[root1] += 1
+            similarities[root1] = min(
+                similarity, similarities.pop(root1, 1.0), similarities.pop(root2, 1.0)
+            )
+
+        rejected = set()
+        for members in buckets.values():
+            for position, index1 in enumerate(members):
+                for index2 in members[position + 1 : position + 1 + max_bucket_size]:
+                    for index in (index1, index2):
+                        if index not in parents:
+                            parents[index] = index
+                            ranks[index] = 0
+                    root1, root2 = find(index1), find(index2)
+                    if root1 == root2 or (index1, index2) in rejected:
+                        continue
+                    similarity = self._similarity(index1, index2)
+                    if similarity < threshold:
+                        rejected.add((index1, index2))
+                        continue
+                    union(root1, root2, similarity)
+
+        groups: Dict[int, List[int]] = {}
+        for index in parents:
+            groups.setdefault(find(index), []).append(index)
+        result = []
+        for root, indices in groups.items():
+            if len(indices) < 2:
+                continue
+            indices.sort()
+            operators = [[self._operators[index]] for index in indices]
+            size = self._fingerprints[indices[0]][1]
+            result.append(CloneGroup("operator", operators, similarities[root], size))
+        result.sort(key=lambda group: -group.similarity)
+        return result
@@ -211,6 +211,17 @@ the argument as next element and return it (different from
 >>> d == w
 True
 
+A block stores its content in a compact form, as a list of texts,
+op-codes for the line breaks and indentations, and other document elements.
+The texts and commands added to a block do not create document elements,
+and the items of a block added to another block are copied into it:
+
+>>> b = block("a", "@n", "b")
+>>> b.items
+['a', 1, 'b']
+>>> doc_list(b, "c", sep="@s:;").items
+['a', 1, 'b', ';', 'c']
+
 Document rendering:
 
 >>> import sys
@@ -263,7 +274,7 @@ be also derived to implement other kind of rendering.
 
 from enum import Enum, auto
 import re
-from typing import Any, Optional, Union, Callable
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from io import IOBase
 from ansys.scadeone.core.common.exception import ScadeOneException
 
@@ -271,6 +282,8 @@ from ansys.scadeone.core.common.exception import ScadeOneException
 class DElt:
     """Document base class."""
 
+    __slots__ = ("_next",)
+
     def __init__(self) -> None:
         self._next: Optional["DElt"] = None
 
@@ -295,6 +308,8 @@ class DElt:
 class DText(DElt):
     """Class to store a simple text."""
 
+    __slots__ = ("_string",)
+
     def __init__(self, string: str) -> None:
         super().__init__()
         if not isinstance(string, str):
@@ -310,33 +325,80 @@ class DText(DElt):
         return super().__repr__() + f'("{self._string}")'
 
 
+# Op-codes of the line breaks and indentations stored in a block
+#: Line break
+OP_NL = 0
+#: Line break followed by the indentation
+OP_NL_INDENT = 1
+#: Start new indentation
+OP_INDENT = 2
+#: End last indentation, including mark
+OP_UNINDENT = 3
+#: Mark last column for indentation
+OP_MARK = 4
+
+#: Item of a block: a text, an op-code or a document element
+BlockItem = Union[str, int, DElt]
+
+
 class DBlock(DElt):
-    """Class to store a block of documents (sequence of documents)."""
+    """Class to store a block of documents (sequence of documents).
+
+    The block content is stored in a compact form, as a list of items.
+    An item is a text without newlines, an op-code for a line break or
+    an indentation (*OP_NL*, *OP_NL_INDENT*, *OP_INDENT*, *OP_UNINDENT*,
+    *OP_MARK*), or another document element. Texts, line breaks and
+    indentations added to a block are stored as texts and op-codes, and the items
+    of a block added to a block are copied: a block must be complete before
+    being added to another block.
+    """
+
+    __slots__ = ("_items",)
 
     def __init__(self, doc: Optional[DElt] = None) -> None:
         super().__init__()
-        self._first = doc if doc else None
-        self._end = self._first
+        self._items: List[BlockItem] = []
+        if doc:
+            _add_doc(self._items, doc)
+
+    @property
+    def items(self) -> List[BlockItem]:
+        """Return the items of the block."""
+        return self._items
+
+    @property
+    def docs(self) -> List[DElt]:
+        """Return the items of the block as document elements."""
+        return [_item_doc(item) for item in self._items]
 
     @property
     def doc(self) -> Optional[DElt]:
         """Return the first document of the block."""
-        return self._first
+        return _item_doc(self._items[0]) if self._items else None
 
     def __lshift__(self, doc) -> "DBlock":
         """<< operator: Add doc to the end of the block and return the block."""
-        doc = to_doc(doc)
-        if not self._end:
-            self._first = doc
-            self._end = doc
-        else:
-            self._end = self._end.cons(doc)
+        if isinstance(doc, str):
+            if not doc:
+                pass
+            elif doc[0] == "@":
+                self._items.extend(_command_items(doc))
+            elif doc.find("\n") != -1:
+                self._items.extend(_text_items(doc, True))
+            else:
+                self._items.append(doc)
+        elif isinstance(doc, DElt):
+            _add_doc(self._items, doc)
+        elif doc is not None:
+            raise ScadeOneException(f"DBlock: document or string expected, got {type(doc)}")
         return self
 
 
 class DLineBreak(DElt):
     """Class to store a line break."""
 
+    __slots__ = ("_with_indent",)
+
     def __init__(self, with_indent=True) -> None:
         super().__init__()
         self._with_indent = with_indent
@@ -366,6 +428,8 @@ class EIndentation(Enum):
 class DIndent(DElt):
     """Class to store an indentation."""
 
+    __slots__ = ("_indent",)
+
     def __init__(self, indent: EIndentation) -> None:
         super().__init__()
         self._indent = indent
@@ -379,6 +443,71 @@ class DIndent(DElt):
         return super().__repr__() + f"({self._indent})"
 
 
+IndentOp = {
+    EIndentation.INDENT: OP_INDENT,
+    EIndentation.UNINDENT: OP_UNINDENT,
+    EIndentation.MARK: OP_MARK,
+}
+
+
+def _add_doc(items: List[BlockItem], doc: Optional[DElt]) -> None:
+    """Add to *items* the items of *doc* and of its next documents."""
+    while doc is not None:
+        cls = doc.__class__
+        if cls is DText:
+            if doc._string:  # type: ignore
+                items.append(doc._string)  # type: ignore
+        elif cls is DLineBreak:
+            items.append(OP_NL_INDENT if doc._with_indent else OP_NL)  # type: ignore
+        elif cls is DIndent:
+            if (op := IndentOp.get(doc._indent)) is not None:  # type: ignore
+                items.append(op)
+        elif cls is DBlock:
+            items.extend(doc._items)  # type: ignore
+        else:
+            items.append(doc)
+        doc = doc.next
+
+
+def _text_items(txt: str, with_indent: bool) -> List[BlockItem]:
+    """Return the items of a text, whose newlines are replaced by line breaks."""
+    op = OP_NL_INDENT if with_indent else OP_NL
+    lines = txt.split("\n")
+    items: List[BlockItem] = [lines[0]] if lines[0] else []
+    for line in lines[1:]:
+        items.append(op)
+        if line:
+            items.append(line)
+    return items
+
+
+# Items of the shortcut strings, see _command_items()
+CommandItems: Dict[str, Tuple[BlockItem, ...]] = {}
+
+
+def _command_items(arg: str) -> Tuple[BlockItem, ...]:
+    """Return the items of a shortcut string."""
+    items = CommandItems.get(arg)
+    if items is None:
+        _items: List[BlockItem] = []
+        _add_doc(_items, to_doc(arg))
+        items = CommandItems[arg] = tuple(_items)
+    return items
+
+
+def _item_doc(item: BlockItem) -> DElt:
+    """Return a block item as a document element."""
+    if isinstance(item, str):
+        return DText(item)
+    if isinstance(item, int):
+        if item == OP_NL:
+            return DLineBreak(False)
+        if item == OP_NL_INDENT:
+            return DLineBreak(True)
+        return DIndent(next(k for k, v in IndentOp.items() if v == item))
+    return item
+
+
 def to_doc(arg: Union[DElt, str, None]) -> DElt:
     """Create a DElt:
     - If arg is already a DElt, return it
@@ -396,11 +525,8 @@ def text(txt: str, with_indent: bool = True) -> DElt:
     If text contains newlines, they are replaced by line breaks,
     with indentation if with_indent is True."""
     if txt.find("\n") != -1:
-        lines = [DText(line) for line in txt.split("\n")]
         doc = DBlock()
-        doc << lines[0]  # type: ignore
-        for line in lines[1:]:
-            doc << nl(with_indent) << line  # type: ignore
+        doc.items.extend(_text_items(txt, with_indent))
         return doc
     return DText(txt)
 
@@ -438,13 +564,11 @@ def block(first: DElt, *args) -> DElt:
     """Create a block of n-documents. A block is assimilated
     as a single document. Each internal document are rendered in sequence.
     """
-    first = to_doc(first)
-    current_doc = first
+    _block = DBlock()
+    _block << (first if first is not None else "")
     for doc in args:
-        doc = to_doc(doc)
-        current_doc.cons(doc)
-        current_doc = doc
-    return DBlock(first)
+        _block << doc
+    return _block
 
 
 def doc_list(
@@ -471,24 +595,20 @@ def doc_list(
     DElt
         The list of documents.
     """
+    _block = DBlock()
     if not docs:
-        return DBlock()
+        return _block
     _init, *_rest = docs
-    _current_doc = to_doc(_init)
     if start:
-        _first = to_doc(start)
-        _first.cons(_current_doc)
-    else:
-        _first = _current_doc
-    _sep = to_doc(sep)
+        _block << start
+    _block << _init
     for _arg in _rest:
-        _doc = to_doc(_arg)
         if sep:
-            _current_doc = _current_doc.cons(DBlock(_sep))
-        _current_doc = _current_doc.cons(_doc)
+            _block << sep
+        _block << _arg
     if last:
-        _current_doc.cons(to_doc(last))
-    return DBlock(_first)
+        _block << last
+    return _block
 
 
 def sep(char: str, newline: bool = False) -> DElt:
@@ -550,20 +670,22 @@ class Document(DBlock):
 
     *a_doc* << *d_elt* => add *d_elt* and returns *a_doc*."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
     @property
     def start_doc(self) -> DElt:
         """Return the first document."""
-        if self.doc:
-            return self.doc
+        if self.items:
+            return _item_doc(self.items[0])
         raise ScadeOneException("Document is empty")
 
     @property
     def end_doc(self) -> Optional[DElt]:
         """Return the last document."""
-        return self._end
+        return _item_doc(self.items[-1]) if self.items else None
 
 
 class Renderer:
@@ -581,15 +703,23 @@ class Renderer:
         Default indentation. Defaults to 2.
     initial_indent : int, optional
         Initial indentation. Defaults to 0.
+    fast : bool, optional
+        If True, use the fast rendering path, defaults to False.
+        The text fragments are collected and written by chunks of
+        *FlushSize* fragments, the base document elements are rendered
+        without calling the *_render_<class>* methods, and there is
+        neither loop detection nor newline checking of the texts.
     """
 
     LoopDetection = False  # Enable loop detection debug
+    FlushSize = 4096  # Number of text fragments written at once by the fast path
 
     def __init__(
         self,
         stream: Optional[IOBase] = None,
         indent: int = 2,
         initial_indent: int = 0,
+        fast: bool = False,
     ) -> None:
         self._indent = indent
         self._initial_indent = initial_indent
@@ -598,6 +728,9 @@ class Renderer:
         self._indent_stack = [initial_indent]
         self._stream = stream
         self._rendered = {}  # for loop detection
+        self._fast = fast
+        # newline followed by n spaces, for n in range(len(self._newlines))
+        self._newlines = ["\n" + " " * n for n in range(64)]
 
     def set_stream(self, stream: IOBase):
         """Set the stream to render on."""
@@ -643,7 +776,10 @@ class Renderer:
             raise ScadeOneException("Renderer: Document expected")
         try:
             self._rendered = {}
-            self._render(doc.start_doc)
+            if self._fast:
+                self._render_fast(doc)
+            else:
+                self._render(doc)
         except Exception as e:
             if not error_ok:
                 raise ScadeOneException(f"Error during rendering: ({e})") from e
@@ -702,22 +838,106 @@ class Renderer:
         del self._rendered[doc]
 
     def _render(self, doc: DElt) -> None:
-        self._start_loop_detection(doc)
-
-        def _get_render_fn(doc) -> Callable[["Renderer", DElt], None]:
-            "Auxiliary function to get the render function, which is a method of the Renderer class"
-            class_name = doc.__class__.__name__
-            func = getattr(self, f"_render_{class_name}", self._render_NoFunc)
-            return func  # type: ignore
-
-        _current_doc = doc
+        """Render a document and its next documents."""
+        _current_doc: Optional[DElt] = doc
         while _current_doc:
-            func = _get_render_fn(_current_doc)
-            func(_current_doc)  # type: ignore
+            self._render_doc(_current_doc)
             _current_doc = _current_doc.next
 
+    def _render_doc(self, doc: DElt) -> None:
+        """Render a document, without its next documents."""
+        self._start_loop_detection(doc)
+        class_name = doc.__class__.__name__
+        func = getattr(self, f"_render_{class_name}", self._render_NoFunc)
+        func(doc)
         self._end_loop_detection(doc)
 
+    def _render_op(self, op: int) -> None:
+        """Render a block op-code."""
+        if op == OP_NL:
+            self._nl(False)
+        elif op == OP_NL_INDENT:
+            self._nl(True)
+        elif op == OP_INDENT:
+            self._push_indent()
+        elif op == OP_UNINDENT:
+            self._pop_indent()
+        elif op == OP_MARK:
+            self._push_mark()
+
+    def _newline(self, indent: int) -> str:
+        """Return a newline followed by *indent* spaces."""
+        if indent >= len(self._newlines):
+            self._newlines.extend(
+                "\n" + " " * n for n in range(len(self._newlines), 2 * indent + 1)
+            )
+        return self._newlines[indent]
+
+    def _render_fast(self, doc: DBlock) -> None:
+        """Render a block with the fast path.
+
+        The items of the block and of its sub-blocks are consumed linearly,
+        with a stack of iterators, and the texts are collected in a list,
+        which is written on the stream every *FlushSize* fragments. Elements
+        which are not blocks are rendered with their *_render_<class>* method.
+        """
+        write = self._stream.write  # type: ignore # (stream is IO)
+        fragments: List[str] = []
+        append = fragments.append
+        flush_size = self.FlushSize
+        indent_stack = self._indent_stack
+        newlines = self._newlines
+        col = self._col
+        line = self._line
+        stack: List[Iterator[BlockItem]] = [iter(doc.items)]
+        try:
+            while stack:
+                for item in stack[-1]:
+                    cls = item.__class__
+                    if cls is str:
+                        append(item)  # type: ignore
+                        col += len(item)  # type: ignore
+                    elif cls is int:
+                        if item == OP_NL_INDENT:
+                            line += 1
+                            col = indent_stack[-1]
+                            append(newlines[col] if col < len(newlines) else self._newline(col))
+                            if len(fragments) >= flush_size:
+                                write("".join(fragments))
+                                fragments.clear()
+                        elif item == OP_NL:
+                            line += 1
+                            col = 0
+                            append("\n")
+                            if len(fragments) >= flush_size:
+                                write("".join(fragments))
+                                fragments.clear()
+                        elif item == OP_INDENT:
+                            indent_stack.append(indent_stack[-1] + self._indent)
+                        elif item == OP_UNINDENT:
+                            if indent_stack:
+                                indent_stack.pop()
+                            else:
+                                indent_stack.append(self._initial_indent)
+                        elif item == OP_MARK:
+                            indent_stack.append(col)
+                    elif isinstance(item, DBlock):
+                        stack.append(iter(item.items))
+                        break
+                    else:
+                        # other elements: standard rendering, with synchronized state
+                        write("".join(fragments))
+                        fragments.clear()
+                        self._col, self._line = col, line
+                        self._render_doc(item)  # type: ignore
+                        indent_stack = self._indent_stack
+                        col, line = self._col, self._line
+                else:
+                    stack.pop()
+        finally:
+            write("".join(fragments))
+            self._col, self._line = col, line
+
     def _render_NoFunc(self, doc) -> None:  # pylint: disable=C0103
         class_name = doc.__class__.__name__
         raise ScadeOneException(f"Render._render_{class_name}() does not exist")
@@ -730,7 +950,15 @@ class Renderer:
         self._write(doc.string)
 
     def _render_DBlock(self, doc: DBlock) -> None:  # pylint: disable=C0103
-        self._render(doc.doc)  # type: ignore
+        for item in doc.items:
+            if isinstance(item, str):
+                self._write(item)
+            elif isinstance(item, int):
+                self._render_op(item)
+            else:
+                self._render_doc(item)
+
+    _render_Document = _render_DBlock
 
     def _render_DLineBreak(self, doc: DLineBreak) -> None:  # pylint: disable=C0103
         self._nl(doc.with_indent)
@@ -0,0 +1,604 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains the export of operator definitions as dataflow graphs.
+
+A dataflow graph is stored as integer-indexed arrays: a node table, a CSR
+(compressed sparse row) adjacency and edge attributes. The arrays are
+:py:class:`array.array` objects which support the buffer protocol, they can be
+used with NumPy without copy, for instance with ``numpy.frombuffer(graph.indices, numpy.int32)``.
+"""
+
+from array import array
+from enum import IntEnum
+from typing import Dict, Iterable, List, Optional, Union, cast
+
+from ansys.scadeone.core import swan
+from ansys.scadeone.core.interfaces import IModel
+from ansys.scadeone.core.svc.swan_visitor import Owner, OwnerProperty, SwanVisitor
+
+__all__ = ["DataflowGraph", "NodeKind", "EdgeKind"]
+
+
+class NodeKind(IntEnum):
+    """Kind of a dataflow graph node."""
+
+    #: Operator input.
+    INPUT = 0
+    #: Operator output.
+    OUTPUT = 1
+    #: Local flow, declared in a **var** section.
+    LOCAL = 2
+    #: Textual equation: :py:class:`ExprEquation`.
+    EQUATION = 3
+    #: State machine, activate if or activate when: :py:class:`DefByCase`.
+    DEF_BY_CASE = 4
+    #: Operator call block: :py:class:`Block`.
+    BLOCK = 5
+    #: Expression block: :py:class:`ExprBlock`.
+    EXPR_BLOCK = 6
+    #: Definition block: :py:class:`DefBlock`.
+    DEF_BLOCK = 7
+    #: Group operation block: :py:class:`GroupBlock`.
+    GROUP_BLOCK = 8
+    #: Any other diagram block.
+    OTHER_BLOCK = 9
+
+
+class EdgeKind(IntEnum):
+    """Kind of a dataflow graph edge."""
+
+    #: Flow read by an equation or a block: from the flow to its reader.
+    READ = 0
+    #: Flow defined by an equation or a block: from the definition to the flow.
+    DEFINE = 1
+    #: Diagram wire: from the source block to the target block.
+    WIRE = 2
+    #: Definition nested in a def-by-case: from the def-by-case to the definition.
+    CONTROL = 3
+
+
+class _FlowReader(SwanVisitor):
+    """Visitor collecting the names of the flows read by an expression."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.names = {}
+
+    def visit_PathIdExpr(
+        self, swan_obj: swan.PathIdExpr, owner: Owner, owner_property: OwnerProperty
+    ) -> None:
+        path_id = swan_obj.path_id
+        if path_id.is_valid and len(path_id.path_id) == 1:
+            self.names[path_id.path_id[0].value] = None
+
+    def visit_LastExpr(
+        self, swan_obj: swan.LastExpr, owner: Owner, owner_property: OwnerProperty
+    ) -> None:
+        # last 'x: the identifier is a name
+        self.names[swan_obj.id.value.lstrip("'")] = None
+
+
+class _GraphBuilder:
+    """Builder of a dataflow graph: operators are added one after the other,
+    edges are stored as lists of (source, target) pairs and are converted to CSR
+    by :py:meth:`build`."""
+
+    def __init__(self) -> None:
+        self._nodes = []
+        self._node_kind = array("b")
+        self._node_operator = array("i")
+        self._operators = []
+        self._operator_indptr = array("q", [0])
+        self._edge_source = array("i")
+        self._edge_target = array("i")
+        self._edge_kind = array("b")
+        self._edge_source_adaptation = array("i")
+        self._edge_target_adaptation = array("i")
+        self._adaptations = []
+        self._adaptation_index = {}
+        self._scopes: List[Dict[str, int]] = []
+
+    # Nodes and edges
+    # ---------------
+
+    def _add_node(self, obj: swan.SwanItem, kind: NodeKind, control: Optional[int]) -> int:
+        node = len(self._nodes)
+        self._nodes.append(obj)
+        self._node_kind.append(kind)
+        self._node_operator.append(len(self._operators) - 1)
+        if control is not None:
+            self._add_edge(control, node, EdgeKind.CONTROL)
+        return node
+
+    def _add_edge(
+        self,
+        source: int,
+        target: int,
+        kind: EdgeKind,
+        source_adaptation: Optional[swan.GroupAdaptation] = None,
+        target_adaptation: Optional[swan.GroupAdaptation] = None,
+    ) -> None:
+        self._edge_source.append(source)
+        self._edge_target.append(target)
+        self._edge_kind.append(kind)
+        self._edge_source_adaptation.append(self._get_adaptation(source_adaptation))
+        self._edge_target_adaptation.append(self._get_adaptation(target_adaptation))
+
+    def _get_adaptation(self, adaptation: Optional[swan.GroupAdaptation]) -> int:
+        # Adaptations are stored once as strings, edges refer to their index
+        if adaptation is None:
+            return -1
+        text = swan.swan_to_str(adaptation)
+        index = self._adaptation_index.get(text)
+        if index is None:
+            index = len(self._adaptations)
+            self._adaptations.append(text)
+            self._adaptation_index[text] = index
+        return index
+
+    # Flows
+    # -----
+
+    def _declare(self, var: swan.Variable, kind: NodeKind) -> None:
+        if not isinstance(var, swan.VarDecl):
+            # protected variable
+            return
+        self._scopes[-1][var.id.value] = self._add_node(var, kind, None)
+
+    def _lookup(self, name: str) -> Optional[int]:
+        for scope in reversed(self._scopes):
+            if (node := scope.get(name)) is not None:
+                return node
+        return None
+
+    def _add_reads(self, expr: Optional[swan.SwanItem], node: int) -> None:
+        if expr is None:
+            return
+        reader = _FlowReader()
+        reader.visit(expr)
+        for name in reader.names:
+            if (flow := self._lookup(name)) is not None:
+                self._add_edge(flow, node, EdgeKind.READ)
+
+    def _add_defines(self, lhs: Optional[swan.EquationLHS], node: int) -> None:
+        if not isinstance(lhs, swan.EquationLHS):
+            return
+        for item in lhs.lhs_items:
+            if item.is_underscore:
+                continue
+            if (flow := self._lookup(item.id.value)) is not None:
+                self._add_edge(node, flow, EdgeKind.DEFINE)
+
+    # Swan constructs
+    # ---------------
+
+    def add_operator(self, operator: swan.OperatorDefinition) -> None:
+        self._operators.append(operator)
+        self._scopes = [{}]
+        for var in operator.inputs:
+            self._declare(var, NodeKind.INPUT)
+        for var in operator.outputs:
+            self._declare(var, NodeKind.OUTPUT)
+        body = operator.body
+        if isinstance(body, swan.Scope):
+            self._add_scope(body, None)
+        elif isinstance(body, swan.Equation):
+            self._add_equation(body, None)
+        self._operator_indptr.append(len(self._nodes))
+
+    def _add_scope(self, scope: swan.Scope, control: Optional[int]) -> None:
+        self._scopes.append({})
+        # Local flows are visible in the whole scope
+        for section in scope.sections:
+            if isinstance(section, swan.VarSection):
+                for var in section.var_decls:
+                    self._declare(var, NodeKind.LOCAL)
+            elif isinstance(section, swan.Diagram):
+                for obj in section.objects:
+                    if isinstance(obj, swan.SectionObject) and isinstance(
+                        obj.section, swan.VarSection
+                    ):
+                        for var in obj.section.var_decls:
+                            self._declare(var, NodeKind.LOCAL)
+        for section in scope.sections:
+            self._add_section(section, control)
+        self._scopes.pop()
+
+    def _add_section(self, section: swan.ScopeSection, control: Optional[int]) -> None:
+        if isinstance(section, swan.LetSection):
+            for equation in section.equations:
+                self._add_equation(equation, control)
+        elif isinstance(section, swan.Diagram):
+            self._add_diagram(section, control)
+
+    def _add_data_def(
+        self, data_def: Union[swan.Equation, swan.Scope], control: Optional[int]
+    ) -> None:
+        if isinstance(data_def, swan.Scope):
+            self._add_scope(data_def, control)
+        elif isinstance(data_def, swan.Equation):
+            self._add_equation(data_def, control)
+
+    def _add_equation(self, equation: swan.Equation, control: Optional[int]) -> None:
+        if isinstance(equation, swan.ExprEquation):
+            node = self._add_node(equation, NodeKind.EQUATION, control)
+            self._add_reads(equation.expr, node)
+            self._add_defines(equation.lhs, node)
+        elif isinstance(equation, swan.DefByCase):
+            self._add_def_by_case(equation, control)
+
+    def _add_def_by_case(self, def_by_case: swan.DefByCase, control: Optional[int]) -> None:
+        node = self._add_node(def_by_case, NodeKind.DEF_BY_CASE, control)
+        self._add_defines(def_by_case.lhs, node)
+        if isinstance(def_by_case, swan.StateMachine):
+            for item in def_by_case.items:
+                if isinstance(item, swan.State):
+                    for transition in item.in_state_strong_transition_decls:
+                        self._add_transition(transition, node)
+                    self._add_scope(item.body, node)
+                    for transition in item.in_state_weak_transition_decls:
+                        self._add_transition(transition, node)
+                elif isinstance(item, swan.Transition):
+                    self._add_transition(item, node)
+        elif isinstance(def_by_case, swan.ActivateIf):
+            self._add_if_activation(def_by_case.if_activation, node)
+        elif isinstance(def_by_case, swan.ActivateWhen):
+            self._add_reads(def_by_case.condition, node)
+            for branch in def_by_case.branches:
+                self._add_data_def(branch.data_def, node)
+
+    def _add_transition(self, transition: swan.Transition, node: int) -> None:
+        self._add_reads(transition.guard, node)
+        if transition.action is not None:
+            self._add_scope(transition.action, node)
+        if isinstance(transition.target, swan.Fork):
+            for fork_transition in transition.target.transitions:
+                self._add_transition(fork_transition, node)
+
+    def _add_if_activation(self, if_activation: swan.IfActivation, node: int) -> None:
+        for branch in if_activation.branches:
+            self._add_reads(branch.condition, node)
+            if isinstance(branch.branch, swan.IfteDataDef):
+                self._add_data_def(branch.branch.data_def, node)
+            elif isinstance(branch.branch, swan.IfteIfActivation):
+                self._add_if_activation(branch.branch.if_activation, node)
+
+    def _add_diagram(self, diagram: swan.Diagram, control: Optional[int]) -> None:
+        # lunum value -> block node. Local objects are connected through their owner.
+        blocks = {}
+        wires = []
+        for obj in diagram.objects:
+            if isinstance(obj, swan.Wire):
+                wires.append(obj)
+            elif isinstance(obj, swan.SectionObject):
+                self._add_section(obj.section, control)
+            elif isinstance(obj, swan.DefByCaseBlockBase):
+                self._add_def_by_case(obj.def_by_case, control)
+            else:
+                if isinstance(obj, swan.Block):
+                    kind = NodeKind.BLOCK
+                elif isinstance(obj, swan.ExprBlock):
+                    kind = NodeKind.EXPR_BLOCK
+                elif isinstance(obj, swan.DefBlock):
+                    kind = NodeKind.DEF_BLOCK
+                elif isinstance(obj, swan.GroupBlock):
+                    kind = NodeKind.GROUP_BLOCK
+                else:
+                    kind = NodeKind.OTHER_BLOCK
+                node = self._add_node(obj, kind, control)
+                for lunum in [obj.lunum] + [local.lunum for local in obj.locals]:
+                    if lunum is not None:
+                        blocks[lunum.value] = node
+                if isinstance(obj, swan.ExprBlock):
+                    self._add_reads(obj.expr, node)
+                elif isinstance(obj, swan.DefBlock):
+                    self._add_defines(cast(swan.EquationLHS, obj.lhs), node)
+        for wire in wires:
+            source = self._get_connected_block(wire.source, blocks)
+            if source is None:
+                continue
+            for target in wire.targets:
+                if (target_node := self._get_connected_block(target, blocks)) is None:
+                    continue
+                self._add_edge(
+                    source,
+                    target_node,
+                    EdgeKind.WIRE,
+                    wire.source.adaptation,
+                    target.adaptation,
+                )
+
+    @staticmethod
+    def _get_connected_block(connection: swan.Connection, blocks: Dict[str, int]) -> Optional[int]:
+        if not connection.is_connected or connection.port.is_self:
+            return None
+        if connection.port.lunum is None:
+            return None
+        return blocks.get(connection.port.lunum.value)
+
+    # CSR conversion
+    # --------------
+
+    def build(self) -> "DataflowGraph":
+        node_count = len(self._nodes)
+        edge_count = len(self._edge_source)
+        # counting sort of edges by source node
+        indptr = array("q", bytes(8 * (node_count + 1)))
+        for source in self._edge_source:
+            indptr[source + 1] += 1
+        for node in range(node_count):
+            indptr[node + 1] += indptr[node]
+        position = array("q", indptr[:-1])
+        indices = array("i", bytes(4 * edge_count))
+        edge_kind = array("b", bytes(edge_count))
+        source_adaptation = array("i", bytes(4 * edge_count))
+        target_adaptation = array("i", bytes(4 * edge_count))
+        for edge in range(edge_count):
+            source = self._edge_source[edge]
+            index = position[source]
+            position[source] = index + 1
+            indices[index] = self._edge_target[edge]
+            edge_kind[index] = self._edge_kind[edge]
+            source_adaptation[index] = self._edge_source_adaptation[edge]
+            target_adaptation[index] = self._edge_target_adaptation[edge]
+        return DataflowGraph(
+            nodes=self._nodes,
+            node_kind=self._node_kind,
+            node_operator=self._node_operator,
+            operators=self._operators,
+            operator_indptr=self._operator_indptr,
+            indptr=indptr,
+            indices=indices,
+            edge_kind=edge_kind,
+            edge_source_adaptation=source_adaptation,
+            edge_target_adaptation=target_adaptation,
+            adaptations=self._adaptations,
+        )
+
+
+class DataflowGraph:
+    """Dataflow graph of one or several operator definitions.
+
+    Nodes are the flows (inputs, outputs and local variables), the textual equations,
+    the def-by-case constructs and the diagram blocks. Nodes are numbered from 0, in
+    operator order: the nodes of operator *i* are in the range
+    ``operator_indptr[i]:operator_indptr[i+1]``.
+
+    Edges are stored in CSR form: the edges from node *n* are in the range
+    ``indptr[n]:indptr[n+1]`` of the edge arrays, *indices* giving the target nodes.
+
+    The arrays are :py:class:`array.array` objects with the following NumPy types:
+
+    - *node_kind*, *edge_kind*: int8, values of :py:class:`NodeKind` and :py:class:`EdgeKind`,
+    - *node_operator*, *indices*: int32,
+    - *edge_source_adaptation*, *edge_target_adaptation*: int32, index in *adaptations*,
+      -1 if no adaptation,
+    - *operator_indptr*, *indptr*: int64.
+
+    Use :py:meth:`from_operator`, :py:meth:`from_operators` or :py:meth:`from_model`
+    to build a graph.
+    """
+
+    def __init__(
+        self,
+        nodes: List[swan.SwanItem],
+        node_kind: array,
+        node_operator: array,
+        operators: List[swan.OperatorDefinition],
+        operator_indptr: array,
+        indptr: array,
+        indices: array,
+        edge_kind: array,
+        edge_source_adaptation: array,
+        edge_target_adaptation: array,
+        adaptations: List[str],
+    ) -> None:
+        self._nodes = nodes
+        self._node_kind = node_kind
+        self._node_operator = node_operator
+        self._operators = operators
+        self._operator_indptr = operator_indptr
+        self._indptr = indptr
+        self._indices = indices
+        self._edge_kind = edge_kind
+        self._edge_source_adaptation = edge_source_adaptation
+        self._edge_target_adaptation = edge_target_adaptation
+        self._adaptations = adaptations
+
+    @staticmethod
+    def from_operators(operators: Iterable[swan.OperatorDefinition]) -> "DataflowGraph":
+        """Build the dataflow graph of a list of operator definitions, in one pass.
+
+        Parameters
+        ----------
+        operators : Iterable[OperatorDefinition]
+            Operator definitions.
+
+        Returns
+        -------
+        DataflowGraph
+            Dataflow graph of the operators.
+        """
+        builder = _GraphBuilder()
+        for operator in operators:
+            builder.add_operator(operator)
+        return builder.build()
+
+    @staticmethod
+    def from_operator(operator: swan.OperatorDefinition) -> "DataflowGraph":
+        """Build the dataflow graph of an operator definition.
+
+        Parameters
+        ----------
+        operator : OperatorDefinition
+            Operator definition.
+
+        Returns
+        -------
+        DataflowGraph
+            Dataflow graph of the operator.
+        """
+        return DataflowGraph.from_operators([operator])
+
+    @staticmethod
+    def from_model(model: IModel) -> "DataflowGraph":
+        """Build the dataflow graph of all operator definitions of a model.
+
+        All modules of the model are loaded.
+
+        Parameters
+        ----------
+        model : Model
+            Model containing the operators.
+
+        Returns
+        -------
+        DataflowGraph
+            Dataflow graph of the model operators.
+        """
+        return DataflowGraph.from_operators(model.operator_definitions)
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes."""
+        return len(self._nodes)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges."""
+        return len(self._indices)
+
+    @property
+    def nodes(self) -> List[swan.SwanItem]:
+        """Swan object of each node: variable, equation or diagram object."""
+        return self._nodes
+
+    @property
+    def node_kind(self) -> array:
+        """Kind of each node, as :py:class:`NodeKind` values."""
+        return self._node_kind
+
+    @property
+    def node_operator(self) -> array:
+        """Index in *operators* of the operator of each node."""
+        return self._node_operator
+
+    @property
+    def operators(self) -> List[swan.OperatorDefinition]:
+        """Operators of the graph."""
+        return self._operators
+
+    @property
+    def operator_indptr(self) -> array:
+        """Node ranges of the operators."""
+        return self._operator_indptr
+
+    @property
+    def indptr(self) -> array:
+        """CSR row pointers: edge ranges of the nodes."""
+        return self._indptr
+
+    @property
+    def indices(self) -> array:
+        """CSR column indices: target node of each edge."""
+        return self._indices
+
+    @property
+    def edge_kind(self) -> array:
+        """Kind of each edge, as :py:class:`EdgeKind` values."""
+        return self._edge_kind
+
+    @property
+    def edge_source_adaptation(self) -> array:
+        """Source adaptation of each wire edge, as an index in *adaptations*, or -1."""
+        return self._edge_source_adaptation
+
+    @property
+    def edge_target_adaptation(self) -> array:
+        """Target adaptation of each wire edge, as an index in *adaptations*, or -1."""
+        return self._edge_target_adaptation
+
+    @property
+    def adaptations(self) -> List[str]:
+        """Group adaptations used by wires, as Swan strings."""
+        return self._adaptations
+
+    def operator_nodes(self, operator: int) -> range:
+        """Return the nodes of an operator.
+
+        Parameters
+        ----------
+        operator : int
+            Index of the operator in *operators*.
+
+        Returns
+        -------
+        range
+            Range of the operator nodes.
+        """
+        return range(self._operator_indptr[operator], self._operator_indptr[operator + 1])
+
+    def successors(self, node: int) -> array:
+        """Return the target nodes of the edges from a node.
+
+        Parameters
+        ----------
+        node : int
+            Node index.
+
+        Returns
+        -------
+        array
+            Target nodes.
+        """
+        return self._indices[self._indptr[node] : self._indptr[node + 1]]
+
+    def node_name(self, node: int) -> str:
+        """Return a name for a node: the flow name for a variable, the lunum for a block,
+        and the Swan code of the left-hand side for an equation. A def-by-case without
+        left-hand side is named by its luid or its lunum, if any.
+
+        Parameters
+        ----------
+        node : int
+            Node index.
+
+        Returns
+        -------
+        str
+            Name of the node.
+        """
+        obj = self._nodes[node]
+        if isinstance(obj, swan.VarDecl):
+            return obj.id.value
+        if isinstance(obj, swan.DiagramObject) and obj.lunum is not None:
+            return obj.lunum.value
+        if isinstance(obj, (swan.ExprEquation, swan.DefByCase)) and obj.lhs is not None:
+            return swan.swan_to_str(obj.lhs)
+        if isinstance(obj, swan.DefByCase):
+            if obj.luid is not None:
+                return str(obj.luid)
+            if obj.lunum is not None:
+                return obj.lunum.value
+        return ""
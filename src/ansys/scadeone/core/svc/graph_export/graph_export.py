@@ -0,0 +1,543 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module contains the export of diagrams, state machines and call graphs
+in Graphviz DOT or GraphML format.
+
+The graphs are written to a text stream while the Swan objects are traversed:
+no string of the whole graph is built, so that large models can be exported
+with a bounded memory.
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from enum import Enum
+from typing import Dict, Iterable, Optional, Set, TextIO, Union
+from xml.sax.saxutils import escape, quoteattr
+
+from ansys.scadeone.core import swan
+from ansys.scadeone.core.common.exception import ScadeOneException
+from ansys.scadeone.core.interfaces import IModel
+from ansys.scadeone.core.svc.swan_visitor import Owner, OwnerProperty, SwanVisitor
+
+__all__ = ["GraphExporter", "GraphFormat", "DotWriter", "GraphMLWriter"]
+
+
+class GraphFormat(Enum):
+    """Output format of the exported graphs."""
+
+    #: Graphviz DOT format.
+    DOT = "dot"
+    #: GraphML format.
+    GRAPHML = "graphml"
+
+
+class GraphWriter(ABC):
+    """Base class of the graph writers.
+
+    A writer writes the graph elements to a stream as soon as they are given.
+    Nodes and edges have a label and a kind, the kind being the Swan construct
+    they represent: *block*, *state*, *fork*, *operator*, *wire*, *strong*...
+    Clusters group nodes, they can be nested.
+
+    Parameters
+    ----------
+    stream : TextIO
+        Output stream.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    @abstractmethod
+    def start_graph(self, name: str) -> None:
+        """Write the beginning of the graph."""
+        pass
+
+    @abstractmethod
+    def end_graph(self) -> None:
+        """Write the end of the graph."""
+        pass
+
+    @abstractmethod
+    def start_cluster(self, cluster_id: str, label: str) -> None:
+        """Write the beginning of a cluster, the following nodes belong to the cluster."""
+        pass
+
+    @abstractmethod
+    def end_cluster(self) -> None:
+        """Write the end of the current cluster."""
+        pass
+
+    @abstractmethod
+    def add_node(self, node_id: str, label: str, kind: str) -> None:
+        """Write a node."""
+        pass
+
+    @abstractmethod
+    def add_edge(self, source_id: str, target_id: str, label: str, kind: str) -> None:
+        """Write an edge."""
+        pass
+
+
+class DotWriter(GraphWriter):
+    """Writer of graphs in Graphviz DOT format."""
+
+    #: Node shape depending on the node kind.
+    SHAPES = {
+        "block": "box",
+        "expr": "box",
+        "def": "box",
+        "group": "point",
+        "section": "note",
+        "state": "ellipse",
+        "initial": "doublecircle",
+        "fork": "diamond",
+        "operator": "box",
+        "declaration": "box",
+    }
+
+    def __init__(self, stream: TextIO) -> None:
+        super().__init__(stream)
+        self._indent = ""
+
+    @staticmethod
+    def quote(text: str) -> str:
+        """Quote a DOT identifier or label."""
+        text = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{text}"'
+
+    def start_graph(self, name: str) -> None:
+        self._stream.write(f"digraph {self.quote(name)} {{\n")
+        self._indent = "  "
+
+    def end_graph(self) -> None:
+        self._stream.write("}\n")
+        self._indent = ""
+
+    def start_cluster(self, cluster_id: str, label: str) -> None:
+        self._stream.write(f"{self._indent}subgraph {self.quote('cluster_' + cluster_id)} {{\n")
+        self._indent += "  "
+        self._stream.write(f"{self._indent}label={self.quote(label)};\n")
+
+    def end_cluster(self) -> None:
+        self._indent = self._indent[:-2]
+        self._stream.write(f"{self._indent}}}\n")
+
+    def add_node(self, node_id: str, label: str, kind: str) -> None:
+        shape = self.SHAPES.get(kind, "box")
+        self._stream.write(
+            f"{self._indent}{self.quote(node_id)} [label={self.quote(label)}, shape={shape}];\n"
+        )
+
+    def add_edge(self, source_id: str, target_id: str, label: str, kind: str) -> None:
+        style = ", style=dashed" if kind == "weak" else ""
+        self._stream.write(
+            f"{self._indent}{self.quote(source_id)} -> {self.quote(target_id)}"
+            f" [label={self.quote(label)}{style}];\n"
+        )
+
+
+class GraphMLWriter(GraphWriter):
+    """Writer of graphs in GraphML format.
+
+    Labels and kinds are stored as *label* and *kind* data, for nodes and edges.
+    Clusters are nodes containing a nested graph.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        super().__init__(stream)
+        self._edge_count = 0
+        self._indent = ""
+
+    def start_graph(self, name: str) -> None:
+        self._stream.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+            '  <key id="label" for="all" attr.name="label" attr.type="string"/>\n'
+            '  <key id="kind" for="all" attr.name="kind" attr.type="string"/>\n'
+            f'  <graph id={quoteattr(name)} edgedefault="directed">\n'
+        )
+        self._indent = "    "
+
+    def end_graph(self) -> None:
+        self._stream.write("  </graph>\n</graphml>\n")
+        self._indent = ""
+
+    def _write_data(self, label: str, kind: str) -> None:
+        self._stream.write(
+            f'{self._indent}  <data key="label">{escape(label)}</data>\n'
+            f'{self._indent}  <data key="kind">{escape(kind)}</data>\n'
+        )
+
+    def start_cluster(self, cluster_id: str, label: str) -> None:
+        self._stream.write(f"{self._indent}<node id={quoteattr('cluster_' + cluster_id)}>\n")
+        self._write_data(label, "cluster")
+        self._stream.write(
+            f"{self._indent}  <graph id={quoteattr('cluster_' + cluster_id + ':')}"
+            ' edgedefault="directed">\n'
+        )
+        self._indent += "    "
+
+    def end_cluster(self) -> None:
+        self._indent = self._indent[:-4]
+        self._stream.write(f"{self._indent}  </graph>\n{self._indent}</node>\n")
+
+    def add_node(self, node_id: str, label: str, kind: str) -> None:
+        self._stream.write(f"{self._indent}<node id={quoteattr(node_id)}>\n")
+        self._write_data(label, kind)
+        self._stream.write(f"{self._indent}</node>\n")
+
+    def add_edge(self, source_id: str, target_id: str, label: str, kind: str) -> None:
+        self._stream.write(
+            f'{self._indent}<edge id="e{self._edge_count}"'
+            f" source={quoteattr(source_id)} target={quoteattr(target_id)}>\n"
+        )
+        self._edge_count += 1
+        self._write_data(label, kind)
+        self._stream.write(f"{self._indent}</edge>\n")
+
+
+class _StateMachineFinder(SwanVisitor):
+    """Visitor exporting the state machines found in the visited objects."""
+
+    def __init__(self, exporter: "GraphExporter") -> None:
+        super().__init__()
+        self._exporter = exporter
+
+    def visit_StateMachine(
+        self, swan_obj: swan.StateMachine, owner: Owner, owner_property: OwnerProperty
+    ) -> None:
+        self._exporter._write_state_machine(swan_obj)
+        # nested state machines
+        super().visit_StateMachine(swan_obj, owner, owner_property)
+
+
+class _CallFinder(SwanVisitor):
+    """Visitor collecting the operator calls of an operator."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.paths = {}
+
+    def visit_NamedInstance(
+        self, swan_obj: swan.NamedInstance, owner: Owner, owner_property: OwnerProperty
+    ) -> None:
+        if swan_obj.path_id.is_valid:
+            self.paths[swan_obj.path_id.as_string] = None
+
+
+class GraphExporter:
+    """Export of Swan constructs as graphs, in DOT or GraphML format.
+
+    Each export method writes a complete graph to the stream. Node identifiers
+    are built from a counter, so that several constructs can be exported in
+    the same graph.
+
+    Parameters
+    ----------
+    stream : TextIO
+        Output stream, for instance an opened text file.
+    format : GraphFormat, optional
+        Output format, DOT by default.
+
+    Examples
+    --------
+    Export the state machines of a model:
+
+    .. code:: python
+
+        with open("state_machines.dot", "w") as stream:
+            GraphExporter(stream).export_state_machines(app.model)
+    """
+
+    def __init__(self, stream: TextIO, format: GraphFormat = GraphFormat.DOT) -> None:
+        if format == GraphFormat.DOT:
+            self._writer = DotWriter(stream)
+        elif format == GraphFormat.GRAPHML:
+            self._writer = GraphMLWriter(stream)
+        else:
+            raise ScadeOneException(f"Unknown graph format: {format}.")
+        self._cluster_count = 0
+
+    @property
+    def writer(self) -> GraphWriter:
+        """Graph writer."""
+        return self._writer
+
+    def _new_cluster_id(self) -> str:
+        self._cluster_count += 1
+        return f"c{self._cluster_count}"
+
+    # Diagrams
+    # --------
+
+    def export_diagram(self, diagram: swan.Diagram, name: str = "diagram") -> None:
+        """Export a diagram: blocks are the nodes, wires are the edges.
+
+        Parameters
+        ----------
+        diagram : Diagram
+            Diagram to export.
+        name : str, optional
+            Graph name.
+        """
+        self._writer.start_graph(name)
+        self._write_diagram(diagram, self._new_cluster_id())
+        self._writer.end_graph()
+
+    @staticmethod
+    def _block_label(obj: swan.DiagramObject) -> tuple[str, str]:
+        # label and kind of a block
+        if isinstance(obj, swan.Block):
+            if isinstance(obj.instance, swan.NamedInstance):
+                return obj.instance.path_id.as_string, "block"
+            return "block", "block"
+        if isinstance(obj, swan.ExprBlock):
+            return swan.swan_to_str(obj.expr), "expr"
+        if isinstance(obj, swan.DefBlock):
+            return swan.swan_to_str(obj.lhs), "def"
+        if isinstance(obj, swan.GroupBlock):
+            return "group", "group"
+        if isinstance(obj, swan.SectionObject):
+            return "section", "section"
+        if isinstance(obj, swan.StateMachineBlock):
+            return "automaton", "section"
+        if isinstance(obj, swan.ActivateIfBlock):
+            return "activate if", "section"
+        if isinstance(obj, swan.ActivateWhenBlock):
+            return "activate when", "section"
+        return type(obj).__name__, "section"
+
+    def _write_diagram(self, diagram: swan.Diagram, prefix: str) -> None:
+        # Nodes are written first, wires may refer to objects defined after them
+        nodes: Dict[str, str] = {}
+        for index, obj in enumerate(diagram.objects):
+            if isinstance(obj, swan.Wire):
+                continue
+            node_id = f"{prefix}_{index}"
+            label, kind = self._block_label(obj)
+            self._writer.add_node(node_id, label, kind)
+            for lunum in [obj.lunum] + [local.lunum for local in obj.locals]:
+                if lunum is not None:
+                    nodes[lunum.value] = node_id
+        for obj in diagram.objects:
+            if not isinstance(obj, swan.Wire):
+                continue
+            source = self._connection_node(obj.source, nodes)
+            if source is None:
+                continue
+            for target in obj.targets:
+                target_node = self._connection_node(target, nodes)
+                if target_node is None:
+                    continue
+                label = " ".join(
+                    swan.swan_to_str(adaptation)
+                    for adaptation in (obj.source.adaptation, target.adaptation)
+                    if adaptation is not None
+                )
+                self._writer.add_edge(source, target_node, label, "wire")
+
+    @staticmethod
+    def _connection_node(connection: swan.Connection, nodes: Dict[str, str]) -> Optional[str]:
+        if not connection.is_connected or connection.port.lunum is None:
+            return None
+        return nodes.get(connection.port.lunum.value)
+
+    # State machines
+    # --------------
+
+    def export_state_machine(
+        self, state_machine: swan.StateMachine, name: str = "state_machine"
+    ) -> None:
+        """Export a state machine: states and forks are the nodes, transitions are the edges.
+
+        Parameters
+        ----------
+        state_machine : StateMachine
+            State machine to export.
+        name : str, optional
+            Graph name.
+        """
+        self._writer.start_graph(name)
+        self._write_state_machine(state_machine)
+        self._writer.end_graph()
+
+    def export_state_machines(
+        self, items: Union[IModel, Iterable[swan.SwanItem]], name: str = "state_machines"
+    ) -> None:
+        """Export all the state machines of a model, or of a list of Swan objects,
+        in one pass. Each state machine is a cluster of the graph.
+
+        Parameters
+        ----------
+        items : Union[Model, Iterable[SwanItem]]
+            Model, whose operator definitions are exported, or Swan objects
+            containing the state machines, for instance operator definitions.
+        name : str, optional
+            Graph name.
+        """
+        if isinstance(items, IModel):
+            items = items.operator_definitions
+        finder = _StateMachineFinder(self)
+        self._writer.start_graph(name)
+        for item in items:
+            finder.visit(item)
+        self._writer.end_graph()
+
+    @staticmethod
+    def _state_machine_label(state_machine: swan.StateMachine) -> str:
+        parts = []
+        item = state_machine.owner
+        while item is not None:
+            if isinstance(item, swan.OperatorDeclarationDefinitionBase):
+                parts.append(item.get_full_path())
+                break
+            if isinstance(item, swan.State) and item.id is not None:
+                parts.append(item.id.value)
+            item = item.owner
+        label = "::".join(reversed(parts))
+        if state_machine.lunum is not None:
+            label = f"{label} {state_machine.lunum.value}" if label else state_machine.lunum.value
+        return label or "automaton"
+
+    def _write_state_machine(self, state_machine: swan.StateMachine) -> None:
+        prefix = self._new_cluster_id()
+        self._writer.start_cluster(prefix, self._state_machine_label(state_machine))
+        # state reference (identifier or lunum) -> node
+        nodes: Dict[str, str] = {}
+        for index, state in enumerate(state_machine.states):
+            node_id = f"{prefix}_s{index}"
+            refs = [ref.value for ref in (state.id, state.lunum) if ref is not None]
+            for ref in refs:
+                nodes[ref] = node_id
+            self._writer.add_node(
+                node_id, " ".join(refs), "initial" if state.is_initial else "state"
+            )
+        fork_count = 0
+        pending = deque()
+        for index, state in enumerate(state_machine.states):
+            for transition in state.in_state_strong_transition_decls:
+                pending.append((f"{prefix}_s{index}", transition))
+            for transition in state.in_state_weak_transition_decls:
+                pending.append((f"{prefix}_s{index}", transition))
+        for transition in state_machine.transition_decls:
+            if (source := self._state_node(transition.source, nodes)) is not None:
+                pending.append((source, transition))
+        while pending:
+            source, transition = pending.popleft()
+            label = self._transition_label(transition)
+            kind = "strong" if transition.is_strong else "weak"
+            if isinstance(transition.target, swan.Fork):
+                fork_count += 1
+                fork_id = f"{prefix}_f{fork_count}"
+                self._writer.add_node(fork_id, "", "fork")
+                self._writer.add_edge(source, fork_id, label, kind)
+                for fork_transition in transition.target.transitions:
+                    pending.append((fork_id, fork_transition))
+            elif (target := self._state_node(transition.target, nodes)) is not None:
+                self._writer.add_edge(source, target, label, kind)
+        self._writer.end_cluster()
+
+    @staticmethod
+    def _state_node(state_ref: Optional[swan.StateRef], nodes: Dict[str, str]) -> Optional[str]:
+        if state_ref is None:
+            return None
+        ref = state_ref.id if state_ref.id is not None else state_ref.lunum
+        return nodes.get(ref.value)
+
+    @staticmethod
+    def _transition_label(transition: swan.Transition) -> str:
+        label = "" if transition.priority is None else f"{transition.priority.value}: "
+        if transition.guard is not None:
+            label += swan.swan_to_str(transition.guard)
+        elif transition.owner is not None and isinstance(transition.owner, swan.Fork):
+            label += "else"
+        return label
+
+    # Call graphs
+    # -----------
+
+    def export_call_graph(
+        self,
+        items: Union[IModel, Iterable[swan.OperatorDefinition]],
+        name: str = "call_graph",
+    ) -> None:
+        """Export the call graph of the operator definitions of a model, or of a list
+        of operator definitions. Nodes are the operators, identified by their path,
+        and edges go from the caller to the callee.
+
+        Parameters
+        ----------
+        items : Union[Model, Iterable[OperatorDefinition]]
+            Model, whose operator definitions are exported, or operator definitions.
+        name : str, optional
+            Graph name.
+        """
+        if isinstance(items, IModel):
+            items = items.operator_definitions
+        # Only the identifiers of the written nodes are kept
+        written: Set[str] = set()
+        self._writer.start_graph(name)
+        for operator in items:
+            caller = self._write_operator_node(operator, written)
+            finder = _CallFinder()
+            finder.visit(operator)
+            for path in finder.paths:
+                callee = self._resolve_operator(path, operator)
+                if callee is None:
+                    callee_id = path
+                    if callee_id not in written:
+                        written.add(callee_id)
+                        self._writer.add_node(callee_id, path, "declaration")
+                else:
+                    callee_id = self._write_operator_node(callee, written)
+                self._writer.add_edge(caller, callee_id, "", "call")
+        self._writer.end_graph()
+
+    def _write_operator_node(
+        self, operator: swan.OperatorDeclarationDefinitionBase, written: Set[str]
+    ) -> str:
+        node_id = operator.get_full_path()
+        if node_id not in written:
+            written.add(node_id)
+            kind = "operator" if isinstance(operator, swan.OperatorDefinition) else "declaration"
+            self._writer.add_node(node_id, node_id, kind)
+        return node_id
+
+    @staticmethod
+    def _resolve_operator(
+        path: str, operator: swan.OperatorDefinition
+    ) -> Optional[swan.OperatorDeclarationDefinitionBase]:
+        # Operator called with path in the module of operator, or None if not found
+        module = operator.module
+        if module is None:
+            return None
+        try:
+            declaration = module.get_declaration(path)
+        except ScadeOneException:
+            return None
+        if isinstance(declaration, swan.OperatorDeclarationDefinitionBase):
+            return declaration
+        return None
@@ -23,8 +23,10 @@
 # cSpell: ignore vsize ndarray
 
 import abc
+import ctypes
 import numbers
-from typing import Tuple, Optional, Any, List
+import operator
+from typing import Callable, Dict, Tuple, Optional, Any, List
 
 from ansys.scadeone.core.common.exception import ScadeOneException
 import ansys.scadeone.core.svc.simdata.core as core
@@ -36,7 +38,24 @@ class SimDataFactory:
     """SimData factory class."""
 
     @classmethod
-    def load_type(cls, type_id: int) -> Optional[defs.Type]:
+    def load_type(
+        cls, type_id: int, types: Optional[Dict[int, defs.Type]] = None
+    ) -> Optional[defs.Type]:
+        """Load a type, and its sub-types, from its id
+
+        The loaded types are cached in *types* by id, if given: each type is loaded once.
+        """
+        if types is None:
+            return cls._read_type(type_id, None)
+        sd_type = types.get(type_id)
+        if sd_type is None:
+            sd_type = cls._read_type(type_id, types)
+            if sd_type is not None:
+                types[type_id] = sd_type
+        return sd_type
+
+    @classmethod
+    def _read_type(cls, type_id: int, types: Optional[Dict[int, defs.Type]]) -> Optional[defs.Type]:
         # Predefined type => return it
         predefined_type = defs.PredefinedType.get(type_id)
         if predefined_type is not None:
@@ -50,12 +69,12 @@ class SimDataFactory:
                 field_name = dll_wrap.sdt_struct_get_field_name(type_id, i)
                 field_offset = dll_wrap.sdt_struct_get_field_offset(type_id, i)
                 field_type_id = dll_wrap.sdt_struct_get_field_type(type_id, i)
-                field_type = cls.load_type(field_type_id)
+                field_type = cls.load_type(field_type_id, types)
                 fields.append(defs.StructTypeField(field_name, field_offset, field_type))
             return defs.StructType(type_id, fields, name)
         elif type_class == core.TypeClass.ARRAY:
             base_type_id = dll_wrap.sdt_array_get_base_type(type_id)
-            base_type = cls.load_type(base_type_id)
+            base_type = cls.load_type(base_type_id, types)
             dims = dll_wrap.sdt_array_get_dims(type_id)
             return defs.ArrayType(type_id, base_type, dims)
         elif type_class == core.TypeClass.ENUM:
@@ -78,7 +97,7 @@ class SimDataFactory:
                 constructor_value_type = (
                     None
                     if constructor_value_type_id == core.SDT_NONE
-                    else cls.load_type(constructor_value_type_id)
+                    else cls.load_type(constructor_value_type_id, types)
                 )
                 constructors.append(
                     defs.VariantTypeConstructor(constructor_name, constructor_value_type)
@@ -95,147 +114,18 @@ class SimDataFactory:
         cls, file: defs.FileBase, parent: Optional[defs.ElementBase], elem_id: int
     ) -> defs.ElementBase:
         elem_name = dll_wrap.sde_get_name(elem_id)
+        # the type is loaded on first access (see Element.sd_type)
         elem_type_id = dll_wrap.sde_get_type(elem_id)
-        elem_type = cls.load_type(elem_type_id)
         elem_kind = defs.ElementKind(dll_wrap.sde_get_kind(elem_id))
         elem_group_expr = dll_wrap.sde_get_group_expr(elem_id)
-        elem = Element(file, elem_id, elem_name, elem_type, elem_kind, elem_group_expr, parent)
+        elem = Element(
+            file, elem_id, elem_name, None, elem_kind, elem_group_expr, parent, elem_type_id
+        )
         return elem
 
     @classmethod
     def build_core_sd_value(cls, py_value: Any, sd_type: defs.Type) -> Optional[core.sd_value_t]:
-        if py_value is None:
-            return dll_wrap.sdd_value_create_none()
-        if isinstance(sd_type, defs.PredefinedType):
-            if sd_type.kind == defs.PredefinedTypeKind.BOOL:
-                if not isinstance(py_value, bool):
-                    raise ScadeOneException(f"invalid bool value: {py_value}")
-                return dll_wrap.sdd_value_create_predef_bool(py_value)
-            if isinstance(py_value, bool):
-                raise ScadeOneException(
-                    f"unexpected bool value for non boolean element: {py_value}"
-                )
-            match sd_type.kind:
-                case defs.PredefinedTypeKind.INT8:
-                    if not (isinstance(py_value, numbers.Integral) and -128 <= py_value <= 127):
-                        raise ScadeOneException(f"invalid int8 value: {py_value}")
-                    return dll_wrap.sdd_value_create_predef_int8(int(py_value))
-                case defs.PredefinedTypeKind.UINT8:
-                    if not (isinstance(py_value, numbers.Integral) and 0 <= py_value <= 255):
-                        raise ScadeOneException(f"invalid uint8 value: {py_value}")
-                    return dll_wrap.sdd_value_create_predef_uint8(int(py_value))
-                case defs.PredefinedTypeKind.INT16:
-                    if not (isinstance(py_value, numbers.Integral) and -32768 <= py_value <= 32767):
-                        raise ScadeOneException(f"invalid int16 value: {py_value}")
-                    return dll_wrap.sdd_value_create_predef_int16(int(py_value))
-                case defs.PredefinedTypeKind.UINT16:
-                    if not (isinstance(py_value, numbers.Integral) and 0 <= py_value <= 65535):
-                        raise ScadeOneException(f"invalid uint16 value: {py_value}")
-                    return dll_wrap.sdd_value_create_predef_uint16(int(py_value))
-                case defs.PredefinedTypeKind.INT32:
-                    if not (
-                        isinstance(py_value, numbers.Integral)
-                        and -2147483648 <= py_value <= 2147483647
-                    ):
-                        raise ScadeOneException(f"invalid int32 value: {py_value}")
-                    return dll_wrap.sdd_value_create_predef_int32(int(py_value))
-                case defs.PredefinedTypeKind.UINT32:
-                    if not (isinstance(py_value, numbers.Integral) and 0 <= py_value <= 4294967295):
-                        raise ScadeOneException(f"invalid uint32 value: {py_value}")
-                    return dll_wrap.sdd_value_create_predef_uint32(int(py_value))
-                case defs.PredefinedTypeKind.INT64:
-                    if not (
-                        isinstance(py_value, numbers.Integral)
-                        and -9223372036854775808 <= py_value <= 9223372036854775807
-                    ):
-                        raise ScadeOneException(f"invalid int64 value: {py_value}")
-                    return dll_wrap.sdd_value_create_predef_int64(int(py_value))
-                case defs.PredefinedTypeKind.UINT64:
-                    if not (
-                        isinstance(py_value, numbers.Integral)
-                        and 0 <= py_value <= 18446744073709551615
-                    ):
-                        raise ScadeOneException(f"invalid uint64 value: {py_value}")
-                    return dll_wrap.sdd_value_create_predef_uint64(int(py_value))
-                case defs.PredefinedTypeKind.FLOAT32:
-                    if not isinstance(py_value, numbers.Real):
-                        raise ScadeOneException(f"invalid float32 value: {py_value}")
-                    return dll_wrap.sdd_value_create_predef_float32(float(py_value))
-                case defs.PredefinedTypeKind.FLOAT64:
-                    if not isinstance(py_value, numbers.Real):
-                        raise ScadeOneException(f"invalid float64 value: {py_value}")
-                    return dll_wrap.sdd_value_create_predef_float64(float(py_value))
-                case defs.PredefinedTypeKind.CHAR:
-                    if not isinstance(py_value, str) or len(py_value) != 1:
-                        raise ScadeOneException(f"invalid char value: {py_value}")
-                    return dll_wrap.sdd_value_create_predef_char(py_value)
-                case _:
-                    return None
-        elif isinstance(sd_type, defs.StructType):
-            if not isinstance(py_value, (list, tuple)) or len(py_value) != len(sd_type.fields):
-                return None
-            csd_values = []
-            for py_value_item, field in zip(py_value, sd_type.fields):
-                csd_value = cls.build_core_sd_value(py_value_item, field.sd_type)
-                if csd_value is None:
-                    return None
-                csd_values.append(csd_value)
-            return dll_wrap.sdd_value_create_list(len(csd_values), csd_values)
-        elif isinstance(sd_type, defs.ArrayType):
-            # for numpy ndarray:
-            if hasattr(py_value, "shape"):
-                if list(py_value.shape) != sd_type.dims:
-                    return None
-                array_cell_type = (
-                    sd_type.base_type
-                    if len(sd_type.dims) == 1
-                    else defs.ArrayType(0, sd_type.base_type, sd_type.dims[1:])
-                )
-                csd_values = []
-                for py_value_item, i in zip(py_value, range(0, sd_type.dims[0])):
-                    csd_value = cls.build_core_sd_value(py_value_item, array_cell_type)
-                    if csd_value is None:
-                        return None
-                    csd_values.append(csd_value)
-                return dll_wrap.sdd_value_create_list(len(csd_values), csd_values)
-            elif isinstance(py_value, (list, tuple)):
-                if len(py_value) != sd_type.dims[0]:
-                    return None
-                array_cell_type = (
-                    sd_type.base_type
-                    if len(sd_type.dims) == 1
-                    else defs.ArrayType(0, sd_type.base_type, sd_type.dims[1:])
-                )
-                csd_values = []
-                for py_value_item, i in zip(py_value, range(0, sd_type.dims[0])):
-                    csd_value = cls.build_core_sd_value(py_value_item, array_cell_type)
-                    if csd_value is None:
-                        return None
-                    csd_values.append(csd_value)
-                return dll_wrap.sdd_value_create_list(len(csd_values), csd_values)
-            else:
-                return None
-        elif isinstance(sd_type, defs.EnumType):
-            return dll_wrap.sdd_value_create_enum(py_value)
-        elif isinstance(sd_type, defs.VariantType):
-            csd_value = None
-            if isinstance(py_value, tuple):
-                if len(py_value) < 1 or len(py_value) > 2:
-                    return None
-                ctor_name = py_value[0]
-                if len(py_value) == 2:
-                    ctor = sd_type.find_constructor(ctor_name)
-                    if ctor is None or ctor.value_type is None:
-                        return None
-                    csd_value = cls.build_core_sd_value(py_value[1], ctor.value_type)
-            elif isinstance(py_value, str):
-                ctor_name = py_value
-            else:
-                return None
-            return dll_wrap.sdd_value_create_variant(ctor_name, csd_value)
-        elif isinstance(sd_type, defs.ImportedType):
-            return dll_wrap.sdd_value_create_imported(py_value)
-        return None
+        return cls.compile_encoder(sd_type)(py_value)
 
     @classmethod
     def load_sd_value(cls, csd_value: core.sd_value_t) -> defs.Value:
@@ -324,10 +214,420 @@ class SimDataFactory:
             return defs.ImportedValue(byte_values)
         return defs.NoneValue()
 
+    # Predefined types: name, native type, range of integer values, value creation function,
+    # value reading function and class of the read values
+    PredefinedCodecs = {
+        defs.PredefinedTypeKind.CHAR: (
+            "char",
+            core.sd_uint8_t,
+            None,
+            dll_wrap.sdd_value_create_predef_char_wrap,
+            dll_wrap.sdd_value_get_predef_uint8,
+            defs.PredefinedCharValue,
+        ),
+        defs.PredefinedTypeKind.BOOL: (
+            "bool",
+            core.sd_bool_t,
+            None,
+            dll_wrap.sdd_value_create_predef_bool_wrap,
+            dll_wrap.sdd_value_get_predef_uint8,
+            defs.PredefinedBoolValue,
+        ),
+        defs.PredefinedTypeKind.INT8: (
+            "int8",
+            core.sd_int8_t,
+            (-(1 << 7), (1 << 7) - 1),
+            dll_wrap.sdd_value_create_predef_int8_wrap,
+            dll_wrap.sdd_value_get_predef_int8,
+            defs.PredefinedInt8Value,
+        ),
+        defs.PredefinedTypeKind.INT16: (
+            "int16",
+            core.sd_int16_t,
+            (-(1 << 15), (1 << 15) - 1),
+            dll_wrap.sdd_value_create_predef_int16_wrap,
+            dll_wrap.sdd_value_get_predef_int16,
+            defs.PredefinedInt16Value,
+        ),
+        defs.PredefinedTypeKind.INT32: (
+            "int32",
+            core.sd_int32_t,
+            (-(1 << 31), (1 << 31) - 1),
+            dll_wrap.sdd_value_create_predef_int32_wrap,
+            dll_wrap.sdd_value_get_predef_int32,
+            defs.PredefinedInt32Value,
+        ),
+        defs.PredefinedTypeKind.INT64: (
+            "int64",
+            core.sd_int64_t,
+            (-(1 << 63), (1 << 63) - 1),
+            dll_wrap.sdd_value_create_predef_int64_wrap,
+            dll_wrap.sdd_value_get_predef_int64,
+            defs.PredefinedInt64Value,
+        ),
+        defs.PredefinedTypeKind.UINT8: (
+            "uint8",
+            core.sd_uint8_t,
+            (0, (1 << 8) - 1),
+            dll_wrap.sdd_value_create_predef_uint8_wrap,
+            dll_wrap.sdd_value_get_predef_uint8,
+            defs.PredefinedUInt8Value,
+        ),
+        defs.PredefinedTypeKind.UINT16: (
+            "uint16",
+            core.sd_uint16_t,
+            (0, (1 << 16) - 1),
+            dll_wrap.sdd_value_create_predef_uint16_wrap,
+            dll_wrap.sdd_value_get_predef_uint16,
+            defs.PredefinedUInt16Value,
+        ),
+        defs.PredefinedTypeKind.UINT32: (
+            "uint32",
+            core.sd_uint32_t,
+            (0, (1 << 32) - 1),
+            dll_wrap.sdd_value_create_predef_uint32_wrap,
+            dll_wrap.sdd_value_get_predef_uint32,
+            defs.PredefinedUInt32Value,
+        ),
+        defs.PredefinedTypeKind.UINT64: (
+            "uint64",
+            core.sd_uint64_t,
+            (0, (1 << 64) - 1),
+            dll_wrap.sdd_value_create_predef_uint64_wrap,
+            dll_wrap.sdd_value_get_predef_uint64,
+            defs.PredefinedUInt64Value,
+        ),
+        defs.PredefinedTypeKind.FLOAT32: (
+            "float32",
+            core.sd_float32_t,
+            None,
+            dll_wrap.sdd_value_create_predef_float32_wrap,
+            dll_wrap.sdd_value_get_predef_float32,
+            defs.PredefinedFloat32Value,
+        ),
+        defs.PredefinedTypeKind.FLOAT64: (
+            "float64",
+            core.sd_float64_t,
+            None,
+            dll_wrap.sdd_value_create_predef_float64_wrap,
+            dll_wrap.sdd_value_get_predef_float64,
+            defs.PredefinedFloat64Value,
+        ),
+    }
+
+    @classmethod
+    def compile_encoder(
+        cls, sd_type: Optional[defs.Type]
+    ) -> Callable[[Any], Optional[core.sd_value_t]]:
+        """Compile the conversion of Python values of a type to native values
+
+        The type is analyzed once: the returned function only checks and converts a value,
+        with the functions compiled for the sub-types. It returns None if the value is
+        invalid, and raises ScadeOneException for invalid values of predefined types.
+        """
+        create_none = dll_wrap.sdd_value_create_none
+        if isinstance(sd_type, defs.PredefinedType):
+            name, c_type, int_range, create, _, _ = cls.PredefinedCodecs[sd_type.kind]
+            if sd_type.kind == defs.PredefinedTypeKind.BOOL:
+
+                def encode_bool(py_value: Any) -> Optional[core.sd_value_t]:
+                    if py_value is None:
+                        return create_none()
+                    if not isinstance(py_value, bool):
+                        raise ScadeOneException(f"invalid bool value: {py_value}")
+                    return create(core.sd_bool_true if py_value else core.sd_bool_false)
+
+                return encode_bool
+            if sd_type.kind == defs.PredefinedTypeKind.CHAR:
+
+                def encode_char(py_value: Any) -> Optional[core.sd_value_t]:
+                    if py_value is None:
+                        return create_none()
+                    if not isinstance(py_value, str) or len(py_value) != 1:
+                        raise ScadeOneException(f"invalid char value: {py_value}")
+                    return create(c_type(ord(py_value)))
+
+                return encode_char
+            if int_range is not None:
+                min_value, max_value = int_range
+
+                def encode_int(py_value: Any) -> Optional[core.sd_value_t]:
+                    if py_value is None:
+                        return create_none()
+                    if isinstance(py_value, bool):
+                        raise ScadeOneException(
+                            f"unexpected bool value for non boolean element: {py_value}"
+                        )
+                    if not (
+                        isinstance(py_value, numbers.Integral)
+                        and min_value <= py_value <= max_value
+                    ):
+                        raise ScadeOneException(f"invalid {name} value: {py_value}")
+                    return create(c_type(int(py_value)))
+
+                return encode_int
+
+            def encode_float(py_value: Any) -> Optional[core.sd_value_t]:
+                if py_value is None:
+                    return create_none()
+                if isinstance(py_value, bool):
+                    raise ScadeOneException(
+                        f"unexpected bool value for non boolean element: {py_value}"
+                    )
+                if not isinstance(py_value, numbers.Real):
+                    raise ScadeOneException(f"invalid {name} value: {py_value}")
+                return create(c_type(float(py_value)))
+
+            return encode_float
+        if isinstance(sd_type, (defs.StructType, defs.ArrayType)):
+            if isinstance(sd_type, defs.StructType):
+                items_encoders = [cls.compile_encoder(field.sd_type) for field in sd_type.fields]
+                shape = None
+            else:
+                cell_type = (
+                    sd_type.base_type
+                    if len(sd_type.dims) == 1
+                    else defs.ArrayType(0, sd_type.base_type, sd_type.dims[1:])
+                )
+                items_encoders = [cls.compile_encoder(cell_type)] * sd_type.dims[0]
+                shape = list(sd_type.dims)
+            n_items = len(items_encoders)
+            create_list = dll_wrap.sdd_value_create_list
+
+            def encode_list(py_value: Any) -> Optional[core.sd_value_t]:
+                if py_value is None:
+                    return create_none()
+                if shape is not None and hasattr(py_value, "shape"):
+                    # NumPy array
+                    if list(py_value.shape) != shape:
+                        return None
+                elif not isinstance(py_value, (list, tuple)) or len(py_value) != n_items:
+                    return None
+                csd_values = []
+                for py_value_item, encode_item in zip(py_value, items_encoders):
+                    csd_value = encode_item(py_value_item)
+                    if csd_value is None:
+                        return None
+                    csd_values.append(csd_value)
+                return create_list(n_items, csd_values)
+
+            return encode_list
+        if isinstance(sd_type, defs.EnumType):
+            create_enum = dll_wrap.sdd_value_create_enum
+
+            def encode_enum(py_value: Any) -> Optional[core.sd_value_t]:
+                if py_value is None:
+                    return create_none()
+                return create_enum(py_value)
+
+            return encode_enum
+        if isinstance(sd_type, defs.VariantType):
+            constructors_encoders = {
+                ctor.name: cls.compile_encoder(ctor.value_type)
+                for ctor in sd_type.constructors
+                if ctor.value_type is not None
+            }
+            create_variant = dll_wrap.sdd_value_create_variant
+
+            def encode_variant(py_value: Any) -> Optional[core.sd_value_t]:
+                if py_value is None:
+                    return create_none()
+                csd_value = None
+                if isinstance(py_value, tuple):
+                    if len(py_value) < 1 or len(py_value) > 2:
+                        return None
+                    ctor_name = py_value[0]
+                    if len(py_value) == 2:
+                        encode_ctor_value = constructors_encoders.get(ctor_name)
+                        if encode_ctor_value is None:
+                            return None
+                        csd_value = encode_ctor_value(py_value[1])
+                elif isinstance(py_value, str):
+                    ctor_name = py_value
+                else:
+                    return None
+                return create_variant(ctor_name, csd_value)
+
+            return encode_variant
+        if isinstance(sd_type, defs.ImportedType):
+            create_imported = dll_wrap.sdd_value_create_imported
+
+            def encode_imported(py_value: Any) -> Optional[core.sd_value_t]:
+                if py_value is None:
+                    return create_none()
+                return create_imported(py_value)
+
+            return encode_imported
+
+        def encode_none(py_value: Any) -> Optional[core.sd_value_t]:
+            return create_none() if py_value is None else None
+
+        return encode_none
+
+    @classmethod
+    def compile_sequence_encoder(
+        cls, sd_type: Optional[defs.Type]
+    ) -> Callable[[List[Any]], Optional[List[core.sd_value_t]]]:
+        """Compile the conversion of lists of Python values of a type to native values
+
+        For the predefined numeric types, the values are checked at once when they all are
+        Python integers, or floats, and then converted without checks. The returned function
+        returns None if a value is invalid.
+        """
+        encode = cls.compile_encoder(sd_type)
+
+        def encode_values(py_values: List[Any]) -> Optional[List[core.sd_value_t]]:
+            csd_values = [encode(py_value) for py_value in py_values]
+            return None if any(csd_value is None for csd_value in csd_values) else csd_values
+
+        if not isinstance(sd_type, defs.PredefinedType) or sd_type.kind in (
+            defs.PredefinedTypeKind.BOOL,
+            defs.PredefinedTypeKind.CHAR,
+        ):
+            return encode_values
+        _, c_type, int_range, create, _, _ = cls.PredefinedCodecs[sd_type.kind]
+        # Python type of the values checked at once
+        py_type = int if int_range is not None else float
+
+        def encode_numbers(py_values: List[Any]) -> Optional[List[core.sd_value_t]]:
+            if py_values and all(type(py_value) is py_type for py_value in py_values):
+                if int_range is None or (
+                    int_range[0] <= min(py_values) and max(py_values) <= int_range[1]
+                ):
+                    return [create(c_type(py_value)) for py_value in py_values]
+            # check each value, and raise an exception for the invalid ones
+            return encode_values(py_values)
+
+        return encode_numbers
+
+    @classmethod
+    def load_raw_value(cls, csd_value: core.sd_value_t) -> Any:
+        return cls.load_sd_value(csd_value).to_python()
+
+    @classmethod
+    def compile_decoder(
+        cls, sd_type: Optional[defs.Type], raw: bool = False
+    ) -> Callable[[core.sd_value_t], Any]:
+        """Compile the conversion of native values of a type to values
+
+        The type is analyzed once: the returned function only checks the class of a value,
+        which can be 'none', and reads it with the function compiled for its type.
+        The values of another class are read with load_sd_value().
+
+        With raw set to True, the values are converted to plain Python values,
+        as Value.to_python() does, without creating Value objects.
+        """
+        get_class = dll_wrap.sdd_value_get_class_wrap
+        load_sd_value = cls.load_raw_value if raw else cls.load_sd_value
+        if isinstance(sd_type, defs.PredefinedType):
+            name, _, _, _, get_predef, value_class = cls.PredefinedCodecs[sd_type.kind]
+            predef_class = core.DataClass.PREDEF
+            if raw:
+                if sd_type.kind == defs.PredefinedTypeKind.CHAR:
+
+                    def value_class(c_value: core.sd_uint8_t) -> str:
+                        return chr(c_value.value)
+
+                elif sd_type.kind == defs.PredefinedTypeKind.BOOL:
+
+                    def value_class(c_value: core.sd_uint8_t) -> bool:
+                        return c_value.value != 0
+
+                else:
+                    value_class = operator.attrgetter("value")
+
+            def decode_predef(csd_value: core.sd_value_t) -> Any:
+                if get_class(csd_value) != predef_class:
+                    return load_sd_value(csd_value)
+                c_value = get_predef(csd_value)
+                if c_value is None:
+                    raise ScadeOneException(f"cannot read {name} value")
+                return value_class(c_value)
+
+            return decode_predef
+        if isinstance(sd_type, (defs.StructType, defs.ArrayType)):
+            if isinstance(sd_type, defs.StructType):
+                items_decoders = [
+                    cls.compile_decoder(field.sd_type, raw) for field in sd_type.fields
+                ]
+            else:
+                cell_type = (
+                    sd_type.base_type
+                    if len(sd_type.dims) == 1
+                    else defs.ArrayType(0, sd_type.base_type, sd_type.dims[1:])
+                )
+                items_decoders = [cls.compile_decoder(cell_type, raw)] * sd_type.dims[0]
+            list_class = core.DataClass.LIST
+            get_n_values = dll_wrap.sdd_value_get_list_n_values_wrap
+            get_value_at = dll_wrap.sdd_value_get_list_value_at_wrap
+
+            list_class_of = tuple if raw else defs.ListValue
+
+            def decode_list(csd_value: core.sd_value_t) -> Any:
+                if get_class(csd_value) != list_class or get_n_values(csd_value) != len(
+                    items_decoders
+                ):
+                    return load_sd_value(csd_value)
+                return list_class_of(
+                    [
+                        decode_item(get_value_at(csd_value, i))
+                        for i, decode_item in enumerate(items_decoders)
+                    ]
+                )
+
+            return decode_list
+        if isinstance(sd_type, defs.EnumType):
+            enum_class = core.DataClass.ENUM
+            get_enum_name = dll_wrap.sdd_value_get_enum_name
+            enum_value_class = str if raw else defs.EnumValue
+
+            def decode_enum(csd_value: core.sd_value_t) -> Any:
+                if get_class(csd_value) != enum_class:
+                    return load_sd_value(csd_value)
+                return enum_value_class(get_enum_name(csd_value))
+
+            return decode_enum
+        return load_sd_value
+
+
+class ValueCodec:
+    """Conversions between Python values and native values of a type,
+    compiled once by SimDataFactory for the type."""
+
+    def __init__(self, sd_type: Optional[defs.Type]) -> None:
+        self.encode = SimDataFactory.compile_encoder(sd_type)
+        self.encode_values = SimDataFactory.compile_sequence_encoder(sd_type)
+        self.decode = SimDataFactory.compile_decoder(sd_type)
+        self.decode_raw = SimDataFactory.compile_decoder(sd_type, raw=True)
+
 
 class Element(defs.ElementBase):
     """Class for simdata elements"""
 
+    # NumPy dtypes of the predefined types supported by append_array() and read_array()
+    NumpyDtypes = {
+        defs.PredefinedTypeKind.BOOL: "bool",
+        defs.PredefinedTypeKind.INT8: "int8",
+        defs.PredefinedTypeKind.INT16: "int16",
+        defs.PredefinedTypeKind.INT32: "int32",
+        defs.PredefinedTypeKind.INT64: "int64",
+        defs.PredefinedTypeKind.UINT8: "uint8",
+        defs.PredefinedTypeKind.UINT16: "uint16",
+        defs.PredefinedTypeKind.UINT32: "uint32",
+        defs.PredefinedTypeKind.UINT64: "uint64",
+        defs.PredefinedTypeKind.FLOAT32: "float32",
+        defs.PredefinedTypeKind.FLOAT64: "float64",
+    }
+    # Minimum number of identical values appended as a repeated value by append_array()
+    MinRunLength = 4
+    # Kinds of runs of values, for append_array()
+    RawRun = 0
+    NonesRun = 1
+    RepeatedRun = 2
+    # Number of values of the first and largest chunks read by read_array()
+    ReadChunkSize = 4096
+    MaxReadChunkSize = 1 << 20
+
     def __init__(
         self,
         file: defs.FileBase,
@@ -337,27 +637,61 @@ class Element(defs.ElementBase):
         kind: defs.ElementKind,
         group_expr: Optional[str],
         parent: Optional[defs.ElementBase],
+        type_id: Optional[int] = None,
     ) -> None:
         super().__init__(file, name, sd_type, kind, group_expr, parent)
         self._elem_id = elem_id
-        # read children elements
-        children_elements_ids = dll_wrap.sde_get_children(self._elem_id)
-        if children_elements_ids is None:
-            raise ScadeOneException('cannot read children elements for "{0}"'.format(self._name))
-        for child_id in children_elements_ids:
-            self._children_elements.append(SimDataFactory.load_element(file, self, child_id))
+        # id of the type to load on first access (see sd_type), if sd_type is not given
+        self._type_id = type_id
+        # conversions of the values, compiled on first use (see _get_codec())
+        self._codec: Optional[ValueCodec] = None
+        # repeat factor of the last sequence of values, 0 if there is no sequence,
+        # None if not known yet (see _get_last_repeat_factor())
+        self._last_repeat_factor: Optional[int] = None
+        # children elements are read on first access (see children_elements)
+        self._children_loaded = False
 
     @property
     def elem_id(self) -> int:
         return self._elem_id
 
+    @property
+    def children_elements(self) -> List[defs.ElementBase]:
+        """Children elements, read from the file on first access"""
+        if not self._children_loaded:
+            if self._file._closed:
+                raise ScadeOneException(
+                    'cannot read children elements for "{0}": file is closed'.format(self._name)
+                )
+            children_elements_ids = dll_wrap.sde_get_children(self._elem_id)
+            if children_elements_ids is None:
+                raise ScadeOneException(
+                    'cannot read children elements for "{0}"'.format(self._name)
+                )
+            for child_id in children_elements_ids:
+                self._children_elements.append(
+                    SimDataFactory.load_element(self._file, self, child_id)
+                )
+            self._children_loaded = True
+        return self._children_elements
+
     @defs.ElementBase.name.setter
     def name(self, name: str) -> None:
         if dll_wrap.sde_set_name(self._elem_id, name) != core.SD_ERR_NONE:
             raise ScadeOneException("cannot set name for element with id {0}".format(self._elem_id))
+        self._file._unindex_element(self)
         self._name = name
+        self._file._index_element(self)
 
-    @defs.ElementBase.sd_type.setter
+    @property
+    def sd_type(self) -> Optional[defs.Type]:
+        """Element type, read from the file on first access"""
+        if self._type_id is not None:
+            self._sd_type = self._file.load_type(self._type_id)
+            self._type_id = None
+        return self._sd_type
+
+    @sd_type.setter
     def sd_type(self, sd_type: Optional[defs.Type]) -> None:
         if (
             dll_wrap.sde_set_type(self._elem_id, sd_type.type_id if sd_type else core.SDT_NONE)
@@ -365,6 +699,14 @@ class Element(defs.ElementBase):
         ):
             raise ScadeOneException("cannot set type for element with id {0}".format(self._elem_id))
         self._sd_type = sd_type
+        self._type_id = None
+        self._codec = None
+
+    def _get_codec(self) -> ValueCodec:
+        """Get the conversions of the values of the element type, compiled once."""
+        if self._codec is None:
+            self._codec = ValueCodec(self.sd_type)
+        return self._codec
 
     @defs.ElementBase.kind.setter
     def kind(self, kind: defs.ElementKind) -> None:
@@ -405,6 +747,8 @@ class Element(defs.ElementBase):
         ElementBase
             Created child element
         """
+        # load the existing children before creating the new one
+        children_elements = self.children_elements
         elem_id = dll_wrap.sde_create(
             self._elem_id,
             name,
@@ -412,8 +756,13 @@ class Element(defs.ElementBase):
             core.SdeKind(kind),
             group_expr,
         )
+        if elem_id == core.SD_ID_INVALID:
+            raise ScadeOneException(
+                'cannot create child element "{0}" of "{1}"'.format(name, self._name)
+            )
         elem = Element(self._file, elem_id, name, sd_type, kind, group_expr, self)
-        self._children_elements.append(elem)
+        children_elements.append(elem)
+        self._file._index_element(elem)
         return elem
 
     def remove_child_element(self, element: "Element") -> None:
@@ -433,10 +782,11 @@ class Element(defs.ElementBase):
             raise ScadeOneException(
                 "element to remove must be of Element type, got {0}".format(type(element))
             )
-        if element not in self._children_elements:
+        if element not in self.children_elements:
             raise ScadeOneException("element to remove is not a child of {0}".format(element.name))
         if dll_wrap.sde_remove(element.elem_id) != core.SD_ERR_NONE:
             raise ScadeOneException("cannot remove element with id {0}".format(element.elem_id))
+        self._file._unindex_element(element)
         self._children_elements.remove(element)
 
     def append_value(self, py_value: Any) -> None:
@@ -453,23 +803,18 @@ class Element(defs.ElementBase):
             value is invalid or could not be added
         """
 
-        # Get the last sequence
-        sequence = self.get_last_sequence()
-
-        # An existing sequence
-        if sequence and dll_wrap.sdd_sequence_get_repeat_factor(sequence) > 1:
-            # Append the value to the last sequence
+        if self._get_last_repeat_factor() > 1:
+            # The last sequence is repeated: append a new sequence
             self.append_values_sequence([py_value])
         else:
-            csd_value = SimDataFactory.build_core_sd_value(py_value, self.sd_type)
+            csd_value = self._get_codec().encode(py_value)
             if csd_value is None:
                 raise ScadeOneException(f"invalid value: {py_value}")
             ret = dll_wrap.sdd_append_value(self._elem_id, csd_value)
             dll_wrap.sdd_value_close(csd_value)
             if ret != core.SD_ERR_NONE:
                 raise ScadeOneException("cannot append value")
-        if sequence:
-            dll_wrap.sdd_sequence_close(sequence)
+            self._last_repeat_factor = 1
 
     def append_nones_sequence(self, count: int) -> None:
         """Create and append a sequence of 'none'
@@ -492,7 +837,9 @@ class Element(defs.ElementBase):
         ret = dll_wrap.sdd_append_sequence(self.elem_id, sequence)
         dll_wrap.sdd_sequence_close(sequence)
         if ret != core.SD_ERR_NONE:
+            self._last_repeat_factor = None
             raise ScadeOneException("cannot append nones sequence")
+        self._last_repeat_factor = 1
 
     def append_values_sequence(self, py_values: List[Any], repeat_factor: int = 1) -> None:
         """Create and append a new sequence of 'values' with repeat factor.
@@ -520,14 +867,13 @@ class Element(defs.ElementBase):
                 raise ScadeOneException("no repeat factor allowed for structure and array types")
             if any(self.read_values()):
                 raise ScadeOneException("structure/array type already has an existing sequence")
-        csd_values = []
-        for py_value in py_values:
-            if py_value is None:
-                raise ScadeOneException("values sequence cannot contain 'none'")
-            csd_value = SimDataFactory.build_core_sd_value(py_value, self.sd_type)
-            if csd_value is None:
-                raise ScadeOneException(f"invalid value: {py_value} from {py_values}")
-            csd_values.append(csd_value)
+        if any(py_value is None for py_value in py_values):
+            raise ScadeOneException("values sequence cannot contain 'none'")
+        codec = self._get_codec()
+        csd_values = codec.encode_values(py_values)
+        if csd_values is None:
+            invalid_value = next(v for v in py_values if codec.encode(v) is None)
+            raise ScadeOneException(f"invalid value: {invalid_value} from {py_values}")
         sequence = dll_wrap.sdd_sequence_create_values(
             self.sd_type.type_id, len(csd_values), csd_values, repeat_factor
         )
@@ -536,7 +882,246 @@ class Element(defs.ElementBase):
         ret = dll_wrap.sdd_append_sequence(self._elem_id, sequence)
         dll_wrap.sdd_sequence_close(sequence)
         if ret != core.SD_ERR_NONE:
+            self._last_repeat_factor = None
             raise ScadeOneException("cannot append values sequence")
+        self._last_repeat_factor = repeat_factor
+
+    def append_array(self, values: Any, repeat_factor: int = 1, compress: bool = False) -> None:
+        """Append values from a NumPy array.
+
+        The element type must be a predefined Boolean or numeric type, an enumeration type,
+        a structure type of such types, or an array type of such a type. The first
+        dimension of *values* is the index of the values, and the other dimensions are the
+        dimensions of the array type. The dtype of the values is given by
+        :py:func:`numpy_dtype`: enumeration values are integer codes, and structure values
+        are records of a structured dtype. If *values* is a masked array, as returned by
+        :py:meth:`read_array`, the values whose entries are all masked are 'none' values.
+
+        The memory of each value is given to the native library, without copy if *values*
+        is C-contiguous and has the dtype of the element type. Else *values* is converted
+        first: integers are accepted for integer and floating-point types, floating-point
+        numbers for floating-point types, and records with the same field names for
+        structure types, whose fields are converted one by one. The integers out of the
+        range of their type and the invalid enumeration codes are rejected, in the fields
+        of structures too.
+
+        With *compress*, the runs of at least :py:attr:`MinRunLength` identical values of a
+        scalar type are appended as a single value with a repeat factor. The runs are
+        detected on the whole array at once, and identical means the same bits: 0.0 and
+        -0.0 are different, and NaN values are identical only with the same bits. The runs
+        of 'none' values are always appended as sequences of nones.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or numpy.ma.MaskedArray
+            values to add, of shape (n,) or (n, d1, ..., dk) for an array type of
+            dimensions d1, ..., dk
+        repeat_factor : int, optional
+            number of times to add, by default 1 (no repeat), do not use with array and
+            structure types, nor with 'none' values
+        compress : bool, optional
+            append the runs of identical values with repeat factors, by default False
+
+        Raises
+        ------
+        ScadeOneException
+            NumPy is not installed, invalid repeat factor, element type or values,
+            cannot append values
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ScadeOneException("append_array() requires NumPy") from e
+        if not isinstance(repeat_factor, int) or repeat_factor < 1:
+            raise ScadeOneException("invalid repeat factor")
+        shape, dtype = self._get_array_layout()
+        nones = None
+        if isinstance(values, np.ma.MaskedArray):
+            nones = self._get_nones(np.ma.getmaskarray(values))
+            values = values.filled(0) if nones.any() else values.data
+            if not nones.any():
+                nones = None
+        values = np.asarray(values)
+        if values.ndim != len(shape) + 1 or values.shape[1:] != shape:
+            raise ScadeOneException(
+                f"invalid values shape {values.shape} for type {self.sd_type}: "
+                f"(n, {', '.join(str(d) for d in shape)}) expected"
+            )
+        # the 'none' values are filled with 0, which is not always a valid code
+        self._check_array_values(
+            values if nones is None else values[~nones],
+            dtype,
+            "",
+            numpy_enum_tables(self.sd_type),
+        )
+        try:
+            values = np.ascontiguousarray(values, dtype=dtype)
+        except (TypeError, ValueError) as e:
+            raise ScadeOneException(f"cannot convert values to {dtype}: {e}") from None
+        if len(values) == 0:
+            return
+        if repeat_factor > 1:
+            if shape or dtype.names is not None:
+                raise ScadeOneException("no repeat factor allowed for structure and array types")
+            if nones is not None:
+                raise ScadeOneException("no repeat factor allowed for 'none' values")
+            self.append_values_sequence(self._get_py_values(values), repeat_factor)
+            return
+        compress = compress and not shape and dtype.names is None
+        if nones is None and not compress:
+            self._append_raw_values(values, 0, len(values))
+            return
+        for kind, start, stop in self._get_runs(values, nones, compress):
+            if kind == self.RawRun:
+                self._append_raw_values(values, start, stop)
+            elif kind == self.NonesRun:
+                self.append_nones_sequence(stop - start)
+            else:
+                self.append_values_sequence(
+                    self._get_py_values(values[start : start + 1]), stop - start
+                )
+
+    @staticmethod
+    def _check_array_values(
+        values: Any, dtype: Any, path: str, enum_tables: Dict[str, Dict[int, str]]
+    ) -> None:
+        """Check that values can be converted to dtype without loss, field by field, and
+        that the enumeration codes are valid. *path* is the path of the structure fields
+        of the values, as in :py:func:`numpy_enum_tables`."""
+        import numpy as np
+
+        where = f" for field {path}" if path else ""
+        if dtype.subdtype is not None:
+            # subarray field: its dimensions are the last ones of the values
+            dtype, dims = dtype.subdtype
+            if values.shape[values.ndim - len(dims) :] != dims:
+                raise ScadeOneException(
+                    f"invalid values shape {values.shape}{where}: dimensions {dims} expected"
+                )
+        if dtype.names is not None:
+            if values.dtype.names != dtype.names:
+                raise ScadeOneException(
+                    f"invalid values dtype {values.dtype}{where}: "
+                    f"fields {', '.join(dtype.names)} expected"
+                )
+            for name in dtype.names:
+                Element._check_array_values(
+                    values[name],
+                    dtype.fields[name][0],
+                    f"{path}.{name}" if path else name,
+                    enum_tables,
+                )
+            return
+        if values.dtype != dtype:
+            expected_kinds = {"b": "b", "i": "iu", "u": "iu", "f": "iuf"}[dtype.kind]
+            if values.dtype.kind not in expected_kinds:
+                raise ScadeOneException(
+                    f"invalid values dtype {values.dtype}{where}: {dtype} values expected"
+                )
+            if values.size and dtype.kind in "iu":
+                info = np.iinfo(dtype)
+                if values.min() < info.min or values.max() > info.max:
+                    raise ScadeOneException(f"values out of {dtype} range{where}")
+        if path in enum_tables and values.size:
+            invalid = ~np.isin(values, list(enum_tables[path]))
+            if invalid.any():
+                code = values[invalid].flat[0]
+                raise ScadeOneException(f"invalid enumeration code {code}{where}")
+
+    def _append_raw_values(self, values: Any, start: int, stop: int) -> None:
+        """Append the memory of values[start:stop], a C-contiguous array of the element dtype."""
+        if self._get_last_repeat_factor() > 1:
+            # The last sequence is repeated: append a new sequence
+            self.append_values_sequence(self._get_py_values(values[start : start + 1]))
+            start += 1
+        append_raw_value = dll_wrap.sdd_append_raw_value
+        address = values.ctypes.data
+        stride = values.strides[0]
+        for index in range(start, stop):
+            if append_raw_value(self._elem_id, address + index * stride) != core.SD_ERR_NONE:
+                self._last_repeat_factor = None
+                raise ScadeOneException(f"cannot append value at index {index}")
+        self._last_repeat_factor = 1
+
+    @staticmethod
+    def _get_nones(mask: Any) -> Any:
+        """Get the 'none' flags of the values from the mask of a masked array: a value is
+        'none' if all its entries are masked. Partially masked values are not allowed."""
+        import numpy as np
+
+        if mask.dtype.names is not None:
+            fields_nones = [Element._get_nones(mask[name]) for name in mask.dtype.names]
+            all_masked = np.logical_and.reduce(fields_nones)
+            any_masked = np.logical_or.reduce(fields_nones)
+        else:
+            mask = mask.reshape(len(mask), -1)
+            all_masked = mask.all(axis=1)
+            any_masked = mask.any(axis=1)
+        if (any_masked != all_masked).any():
+            index = int(np.flatnonzero(any_masked != all_masked)[0])
+            raise ScadeOneException(f"partially masked value at index {index}")
+        return all_masked
+
+    def _get_runs(
+        self, values: Any, nones: Optional[Any], compress: bool
+    ) -> List[Tuple[int, int, int]]:
+        """Split values into runs of 'none' values, of repeated values if *compress*,
+        and of other values, as a list of (kind, start, stop)."""
+        import numpy as np
+
+        n = len(values)
+        if nones is None:
+            nones = np.zeros(n, dtype=bool)
+        # run starts: first value, and values which differ from the previous one
+        starts = np.empty(n, dtype=bool)
+        starts[0] = True
+        np.not_equal(nones[1:], nones[:-1], out=starts[1:])
+        if compress:
+            # compare the bits, not the floating-point values
+            bits = values.view(f"u{values.itemsize}") if values.dtype.kind == "f" else values
+            starts[1:] |= (bits[1:] != bits[:-1]) & ~nones[1:]
+        starts = np.flatnonzero(starts)
+        lengths = np.diff(starts, append=n)
+        kinds = np.full(len(starts), self.RawRun, dtype=np.int8)
+        if compress:
+            kinds[lengths >= self.MinRunLength] = self.RepeatedRun
+        kinds[nones[starts]] = self.NonesRun
+        # merge the consecutive runs of other values
+        merged = np.ones(len(starts), dtype=bool)
+        merged[1:] = (kinds[1:] != self.RawRun) | (kinds[:-1] != self.RawRun)
+        starts = starts[merged]
+        kinds = kinds[merged]
+        stops = np.append(starts[1:], n)
+        return list(zip(kinds.tolist(), starts.tolist(), stops.tolist()))
+
+    def _get_py_values(self, values: Any) -> List[Any]:
+        """Get the Python values of scalar NumPy values, for values sequences."""
+        if isinstance(self.sd_type, defs.EnumType):
+            names = numpy_enum_tables(self.sd_type)[""]
+            try:
+                return [names[code] for code in values.tolist()]
+            except KeyError as e:
+                raise ScadeOneException(f"invalid code {e} for type {self.sd_type}") from None
+        return values.tolist()
+
+    def _get_array_layout(self) -> Tuple[Tuple[int, ...], Any]:
+        """Get the array dimensions and the NumPy dtype of the element type,
+        for append_array() and read_array().
+
+        The outer array types give the dimensions of the NumPy arrays, and their
+        base type gives the dtype, structured for structure types."""
+        shape: List[int] = []
+        sd_type = self.sd_type
+        while isinstance(sd_type, defs.ArrayType):
+            shape.extend(sd_type.dims)
+            sd_type = sd_type.base_type
+        try:
+            dtype = numpy_dtype(sd_type)
+        except ScadeOneException as e:
+            raise ScadeOneException(
+                f"unsupported type {self.sd_type} for NumPy values of element {self._name}"
+            ) from e
+        return tuple(shape), dtype
 
     def get_last_sequence(self) -> Optional[core.sd_sequence_t]:
         """Get the last sequence"""
@@ -551,9 +1136,24 @@ class Element(defs.ElementBase):
                     break
         return sequence
 
+    def _get_last_repeat_factor(self) -> int:
+        """Get the repeat factor of the last sequence, 0 if there is no sequence.
+
+        The repeat factor is read from the file once, and then maintained by the
+        methods which append or clear values.
+        """
+        if self._last_repeat_factor is None:
+            sequence = self.get_last_sequence()
+            if sequence:
+                self._last_repeat_factor = dll_wrap.sdd_sequence_get_repeat_factor(sequence)
+                dll_wrap.sdd_sequence_close(sequence)
+            else:
+                self._last_repeat_factor = 0
+        return self._last_repeat_factor
+
     def read_values(
-        self, start: Optional[int] = None, n: Optional[int] = None
-    ) -> defs.Iterator[defs.Value]:
+        self, start: Optional[int] = None, n: Optional[int] = None, raw: bool = False
+    ) -> defs.Iterator[Any]:
         """Read element values
 
         Parameters
@@ -562,10 +1162,13 @@ class Element(defs.ElementBase):
             start index for reading, beginning if not specified
         n : int, optional
             number of values to read, runs until end if not specified
+        raw : bool, optional
+            if True, yield plain Python values instead of Value objects (see Value.to_python()):
+            None, bool, int, float, str, or tuples for lists and variant values
 
         Yields
         ------
-        Iterator[Value]
+        Iterator[Value | Any]
             each value read
 
         Raises
@@ -589,14 +1192,165 @@ class Element(defs.ElementBase):
                         )
                     )
 
+            codec = self._get_codec()
+            decode = codec.decode_raw if raw else codec.decode
             for i in range(0, n):
                 csd_value = dll_wrap.sdd_value_iter_get_value(value_iter)
                 if csd_value is None:
                     break
-                yield SimDataFactory.load_sd_value(csd_value)
+                yield decode(csd_value)
                 dll_wrap.sdd_value_close(csd_value)
             dll_wrap.sdd_value_iter_close(value_iter)
 
+    def read_array(self, start: Optional[int] = None, n: Optional[int] = None) -> Any:
+        """Read element values into a NumPy masked array
+
+        The element type must be a type supported by :py:meth:`append_array`, and the
+        values have the dtype given by :py:func:`numpy_dtype`: use :py:func:`numpy_enum_tables`
+        to get the names of the enumeration codes. The values are read by chunks, each chunk
+        with a single call to the native library.
+
+        Parameters
+        ----------
+        start : int, optional
+            start index for reading, beginning if not specified
+        n : int, optional
+            number of values to read, runs until end if not specified
+
+        Returns
+        -------
+        numpy.ma.MaskedArray
+            values, of shape (n,) or (n, d1, ..., dk) for an array type of dimensions
+            d1, ..., dk. The 'none' values are masked.
+
+        Raises
+        ------
+        ScadeOneException
+            NumPy is not installed, invalid element type or number of values to read,
+            cannot seek element index
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ScadeOneException("read_array() requires NumPy") from e
+        shape, dtype = self._get_array_layout()
+        values_chunks = []
+        nones_chunks = []
+        for values, nones in self._read_raw_chunks(
+            shape, dtype, start, n, self.ReadChunkSize, self.MaxReadChunkSize
+        ):
+            values_chunks.append(values)
+            nones_chunks.append(nones)
+        if not values_chunks:
+            values_chunks.append(np.empty((0, *shape), dtype=dtype))
+            nones_chunks.append(np.empty(0, dtype=np.uint8))
+        values = values_chunks[0] if len(values_chunks) == 1 else np.concatenate(values_chunks)
+        return self._get_masked_array(values, np.concatenate(nones_chunks))
+
+    def iter_chunks(
+        self, chunk_size: int = ReadChunkSize, start: Optional[int] = None, n: Optional[int] = None
+    ) -> defs.Iterator[Any]:
+        """Read element values by chunks of NumPy masked arrays
+
+        The element type must be a type supported by :py:meth:`read_array`. Each chunk is
+        read with a single call to the native library, and only one chunk is in memory
+        at a time, unless the caller keeps it: use this method for the elements with too
+        many values to be read at once.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            number of values of each chunk, the last chunk may be smaller
+        start : int, optional
+            start index for reading, beginning if not specified
+        n : int, optional
+            number of values to read, runs until end if not specified
+
+        Yields
+        ------
+        Iterator[numpy.ma.MaskedArray]
+            chunks of values, as returned by :py:meth:`read_array`
+
+        Raises
+        ------
+        ScadeOneException
+            NumPy is not installed, invalid element type, chunk size or number of values
+            to read, cannot seek element index
+        """
+        try:
+            import numpy  # noqa: F401
+        except ImportError as e:
+            raise ScadeOneException("iter_chunks() requires NumPy") from e
+        if not dll_wrap.fits_in_c_size_t(chunk_size, True):
+            raise ScadeOneException(
+                f"invalid chunk size: {chunk_size} (must be a positive integer)"
+            )
+        shape, dtype = self._get_array_layout()
+        for values, nones in self._read_raw_chunks(shape, dtype, start, n, chunk_size, chunk_size):
+            yield self._get_masked_array(values, nones)
+
+    def _read_raw_chunks(
+        self,
+        shape: Tuple[int, ...],
+        dtype: Any,
+        start: Optional[int],
+        n: Optional[int],
+        chunk_size: int,
+        max_chunk_size: int,
+    ) -> defs.Iterator[Tuple[Any, Any]]:
+        """Read the values and the 'none' flags by chunks, for read_array() and iter_chunks().
+
+        The chunk size doubles after each chunk, up to *max_chunk_size*. The chunks are
+        not empty, and the value iterator is closed when the generator is closed.
+        """
+        import numpy as np
+
+        if n is None:
+            n = core.SD_SIZE_NONE
+        elif not dll_wrap.fits_in_c_size_t(n, True):
+            raise ScadeOneException(
+                f"invalid number of values to read: {n} (must be a positive integer)"
+            )
+        value_iter = dll_wrap.sdd_value_iter_create(self._elem_id)
+        if not value_iter:
+            return
+        try:
+            if start and dll_wrap.sdd_value_iter_seek(value_iter, start) != core.SD_ERR_NONE:
+                raise ScadeOneException(
+                    "cannot seek index for element with id {1}: invalid start index {0}".format(
+                        start, self._elem_id
+                    )
+                )
+            while n > 0:
+                size = min(n, chunk_size)
+                values = np.empty((size, *shape), dtype=dtype)
+                nones = np.empty(size, dtype=np.uint8)
+                n_read = dll_wrap.sdd_value_iter_get_raw_values(
+                    value_iter,
+                    size,
+                    values.ctypes.data,
+                    nones.ctypes.data_as(ctypes.POINTER(core.sd_bool_t)),
+                )
+                if n_read:
+                    yield values[:n_read], nones[:n_read]
+                if n_read < size:
+                    break
+                n -= n_read
+                # fewer calls for long traces
+                chunk_size = min(2 * chunk_size, max_chunk_size)
+        finally:
+            dll_wrap.sdd_value_iter_close(value_iter)
+
+    @staticmethod
+    def _get_masked_array(values: Any, nones: Any) -> Any:
+        """Get the masked array of values, where the 'none' values are masked."""
+        import numpy as np
+
+        mask = nones.astype(bool)
+        if values.ndim > 1:
+            mask = np.broadcast_to(mask.reshape(-1, *[1] * (values.ndim - 1)), values.shape).copy()
+        return np.ma.MaskedArray(values, mask=mask)
+
     def clear_values(self) -> None:
         """Clear all values of element
 
@@ -606,6 +1360,7 @@ class Element(defs.ElementBase):
             values could not be cleared
         """
         value_iter = dll_wrap.sdd_value_iter_create(self._elem_id)
+        self._last_repeat_factor = None
         if value_iter and dll_wrap.sdd_value_iter_clear_values(value_iter) != core.SD_ERR_NONE:
             raise ScadeOneException(
                 "cannot clear values for element with id {0}".format(self._elem_id)
@@ -620,12 +1375,50 @@ class File(defs.FileBase):
     def __init__(self, file_id: int) -> None:
         super().__init__()
         self._file_id = file_id
-        # read root elements
-        elements_ids = dll_wrap.sde_get_children(self._file_id)
-        if elements_ids is None:
-            raise ScadeOneException("cannot read root elements")
-        for elem_id in elements_ids:
-            self._elements.append(SimDataFactory.load_element(self, None, elem_id))
+        # root elements are read on first access (see elements)
+        self._elements_loaded = False
+        # set by close(): the elements and types not read yet cannot be read anymore
+        self._closed = False
+        # types of the elements, by id (see load_type())
+        self._types: Dict[int, defs.Type] = {}
+        # elements by path, built on first lookup (see find_element_by_path())
+        self._path_index: Optional[Dict[str, List[defs.ElementBase]]] = None
+
+    @property
+    def elements(self) -> List[defs.ElementBase]:
+        """Root elements, read from the file on first access"""
+        if not self._elements_loaded:
+            if self._closed:
+                raise ScadeOneException("cannot read root elements: file is closed")
+            elements_ids = dll_wrap.sde_get_children(self._file_id)
+            if elements_ids is None:
+                raise ScadeOneException("cannot read root elements")
+            for elem_id in elements_ids:
+                self._elements.append(SimDataFactory.load_element(self, None, elem_id))
+            self._elements_loaded = True
+        return self._elements
+
+    def load_type(self, type_id: int) -> Optional[defs.Type]:
+        """Load a type of the file, once for all the elements of this type
+
+        Parameters
+        ----------
+        type_id : int
+            type id
+
+        Returns
+        -------
+        Optional[Type]
+            loaded type, None if the type has no representation (no type)
+
+        Raises
+        ------
+        ScadeOneException
+            the type was not loaded before the file was closed
+        """
+        if self._closed and type_id not in self._types:
+            raise ScadeOneException("cannot read type with id {0}: file is closed".format(type_id))
+        return SimDataFactory.load_type(type_id, self._types)
 
     def add_element(
         self,
@@ -653,6 +1446,8 @@ class File(defs.FileBase):
             The new element that was added to file
         """
 
+        # load the existing elements before creating the new one
+        elements = self.elements
         elem_id = dll_wrap.sde_create(
             self._file_id,
             name,
@@ -660,8 +1455,11 @@ class File(defs.FileBase):
             core.SdeKind(kind),
             group_expr,
         )
+        if elem_id == core.SD_ID_INVALID:
+            raise ScadeOneException('cannot create element "{0}"'.format(name))
         elem = Element(self, elem_id, name, sd_type, kind, group_expr, None)
-        self._elements.append(elem)
+        elements.append(elem)
+        self._index_element(elem)
         return elem
 
     def remove_element(self, element: Element) -> None:
@@ -681,12 +1479,68 @@ class File(defs.FileBase):
             raise ScadeOneException(
                 "element to remove must be of Element type, got {0}".format(type(element))
             )
-        if element not in self._elements:
+        if element not in self.elements:
             raise ScadeOneException("element {0} was not found".format(element.name))
         if dll_wrap.sde_remove(element.elem_id) != core.SD_ERR_NONE:
             raise ScadeOneException("cannot remove element with id {0}".format(element.elem_id))
+        self._unindex_element(element)
         self._elements.remove(element)
 
+    def find_element_by_path(self, path: str) -> Optional[defs.ElementBase]:
+        """Find an element from its path
+
+        The path of an element is given by :py:attr:`Element.path`, for instance
+        "op/in1/field". The first call loads all the elements of the file to build an
+        index of the paths, which is then kept up to date when elements are added,
+        removed or renamed: the next lookups take constant time.
+
+        As element names can contain '/', several elements can have the same path:
+        the element with the fewest parents is returned, and of elements with the same
+        parent, the first one, as :py:meth:`find_element` does.
+
+        Parameters
+        ----------
+        path : str
+            path of the element
+
+        Returns
+        -------
+        Optional[ElementBase]
+            element of the path, None if not found
+        """
+        if self._path_index is None:
+            self._path_index = {}
+            for elem in self.elements:
+                self._index_element(elem)
+        elements = self._path_index.get(path)
+        if not elements:
+            return None
+        return min(elements, key=lambda elem: elem.nb_parents)
+
+    def _index_element(self, elem: defs.ElementBase) -> None:
+        """Add an element and its descendants to the path index, if it is built."""
+        if self._path_index is None:
+            return
+        self._path_index.setdefault(elem.path, []).append(elem)
+        for child in elem.children_elements:
+            self._index_element(child)
+
+    def _unindex_element(self, elem: defs.ElementBase) -> None:
+        """Remove an element and its descendants from the path index, if it is built.
+        The other elements with the same path are kept."""
+        if self._path_index is None:
+            return
+        path = elem.path
+        elements = self._path_index.get(path, [])
+        for index, indexed in enumerate(elements):
+            if indexed is elem:
+                del elements[index]
+                break
+        if not elements:
+            self._path_index.pop(path, None)
+        for child in elem.children_elements:
+            self._unindex_element(child)
+
     def get_version(self) -> str:
         """Get the file version
 
@@ -700,6 +1554,9 @@ class File(defs.FileBase):
     def close(self) -> None:
         """Close a file
 
+        The elements, children elements and types are read from the file on first access:
+        those which were not read before the file is closed cannot be read afterwards.
+
         Raises
         ------
         ScadeOneException
@@ -707,10 +1564,11 @@ class File(defs.FileBase):
         """
         if dll_wrap.sdf_close(self._file_id) != core.SD_ERR_NONE:
             raise ScadeOneException("cannot close file with id {0}".format(self._file_id))
+        self._closed = True
 
     def __str__(self) -> str:
         s = "*** Elements:\n"
-        for elem in self._elements:
+        for elem in self.elements:
             s += str(elem)
         return s
 
@@ -787,6 +1645,77 @@ def edit_file(file_path: str) -> defs.FileBase:
     return File(file_id)
 
 
+def scan(
+    file_path: str, elements: Optional[List[str]] = None, chunk_size: int = Element.ReadChunkSize
+) -> defs.Iterator[Dict[str, Any]]:
+    """Read the values of elements of a simdata file by chunks of NumPy masked arrays
+
+    The file is opened in read-only mode, only its root elements are loaded, and the values
+    are read with :py:meth:`Element.iter_chunks`: the memory used depends on the chunk size
+    and the number of elements, not on the number of values in the file. The file is closed
+    when the iteration ends, or when the generator is closed.
+
+    Parameters
+    ----------
+    file_path : str
+        path of the file
+    elements : List[str], optional
+        names of the root elements to read. If not specified, all root elements of a type
+        supported by :py:meth:`Element.read_array` are read.
+    chunk_size : int, optional
+        number of values of each chunk
+
+    Yields
+    ------
+    Iterator[Dict[str, numpy.ma.MaskedArray]]
+        for each range of *chunk_size* indexes, the chunks of values indexed by the element
+        names. The elements without values in the range are absent.
+
+    Raises
+    ------
+    ScadeOneException
+        NumPy is not installed, file could not be opened, element not found or of an
+        unsupported type, invalid chunk size
+
+    Examples
+    --------
+    >>> total = 0.0
+    >>> for chunks in sd.scan("recording.sd", ["speed"], chunk_size=1_000_000):
+    ...     total += chunks["speed"].sum()
+    """
+    file = open_file(file_path)
+    chunks_iters = {}
+    try:
+        if elements is None:
+            for elem in file.elements:
+                if _is_numpy_supported(elem.sd_type):
+                    chunks_iters[elem.name] = elem.iter_chunks(chunk_size)
+        else:
+            for name in elements:
+                elem = file.find_element(name)
+                if elem is None:
+                    raise ScadeOneException(
+                        'element "{0}" not found in file "{1}"'.format(name, file_path)
+                    )
+                chunks_iters[name] = elem.iter_chunks(chunk_size)
+        running_iters = dict(chunks_iters)
+        while running_iters:
+            chunks = {}
+            for name, chunks_iter in list(running_iters.items()):
+                chunk = next(chunks_iter, None)
+                if chunk is None:
+                    del running_iters[name]
+                else:
+                    chunks[name] = chunk
+            if chunks:
+                yield chunks
+    finally:
+        # the value iterators are closed before the file
+        for chunks_iter in chunks_iters.values():
+            chunks_iter.close()
+        file.close()
+
+
 def create_struct_type(fields: List[Tuple], name: str = "") -> defs.StructType:
     """Create a structure type
 
@@ -927,8 +1856,8 @@ def create_enum_type(values: List[str], name: str = "") -> defs.EnumType:
         err = dll_wrap.sdt_enum_add_value(enum_type_id, value_name, int_value)
         if err != core.SD_ERR_NONE:
             raise ScadeOneException('cannot create value "{0}" of enum type'.format(value_name))
-        int_value = int_value + 1
         enum_values.append(defs.EnumTypeValue(value_name, int_value))
+        int_value = int_value + 1
     return defs.EnumType(enum_type_id, defs.Int64, enum_values, name)
 
 
@@ -1055,3 +1984,106 @@ def create_vsize_imported_type(
     return defs.ImportedType(
         imported_type_id, mem_size, True, pfn_vsize_get_bytes_size, pfn_vsize_to_bytes, name
     )
+
+
+def numpy_dtype(sd_type: defs.Type) -> Any:
+    """Get the NumPy dtype of the memory representation of a type
+
+    Predefined Boolean and numeric types are mapped to NumPy scalar dtypes, enumeration types
+    to the dtype of their integer codes (see :py:func:`numpy_enum_tables`), array types to
+    subarray dtypes, and structure types to structured dtypes, with the field offsets and the
+    size of the native library. The dtype of an element type is the dtype of the values
+    of :py:meth:`Element.append_array` and :py:meth:`Element.read_array`.
+
+    Parameters
+    ----------
+    sd_type : Type
+        type of values
+
+    Returns
+    -------
+    numpy.dtype
+        NumPy dtype of the values
+
+    Raises
+    ------
+    ScadeOneException
+        NumPy is not installed, unsupported type (char, variant or imported type)
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ScadeOneException("numpy_dtype() requires NumPy") from e
+
+    def dtype_of(sub_type: defs.Type) -> Any:
+        if isinstance(sub_type, defs.PredefinedType) and sub_type.kind in Element.NumpyDtypes:
+            return np.dtype(Element.NumpyDtypes[sub_type.kind])
+        if isinstance(sub_type, defs.EnumType):
+            return dtype_of(sub_type.base_type)
+        if isinstance(sub_type, defs.ArrayType):
+            return np.dtype((dtype_of(sub_type.base_type), tuple(sub_type.dims)))
+        if isinstance(sub_type, defs.StructType):
+            # the offsets of created types are only known by the native library
+            type_id = sub_type.type_id
+            return np.dtype(
+                {
+                    "names": [field.name for field in sub_type.fields],
+                    "formats": [dtype_of(field.sd_type) for field in sub_type.fields],
+                    "offsets": [
+                        dll_wrap.sdt_struct_get_field_offset(type_id, i)
+                        for i in range(len(sub_type.fields))
+                    ],
+                    "itemsize": dll_wrap.sdt_get_size(type_id),
+                }
+            )
+        raise ScadeOneException(f"unsupported type {sub_type} for NumPy values")
+
+    return dtype_of(sd_type)
+
+
+def _is_numpy_supported(sd_type: Optional[defs.Type]) -> bool:
+    """Check whether a type has a NumPy dtype, without raising exception."""
+    if isinstance(sd_type, defs.PredefinedType):
+        return sd_type.kind in Element.NumpyDtypes
+    if isinstance(sd_type, (defs.EnumType, defs.ArrayType)):
+        return _is_numpy_supported(sd_type.base_type)
+    if isinstance(sd_type, defs.StructType):
+        return all(_is_numpy_supported(field.sd_type) for field in sd_type.fields)
+    return False
+
+
+def numpy_enum_tables(sd_type: defs.Type) -> Dict[str, Dict[int, str]]:
+    """Get the lookup tables of the enumeration codes in the NumPy values of a type
+
+    Parameters
+    ----------
+    sd_type : Type
+        type of values
+
+    Returns
+    -------
+    Dict[str, Dict[int, str]]
+        for each enumeration type in *sd_type*, the table from the integer codes to the
+        enumeration value names, indexed by the path of the structure fields which contain
+        the codes: the field names separated by '.', or '' for *sd_type* itself.
+        The array types are transparent.
+
+    Examples
+    --------
+    >>> tables = numpy_enum_tables(elem.sd_type)
+    >>> values = elem.read_array()
+    >>> modes = [tables["ctrl.mode"][code] for code in values["ctrl"]["mode"]]
+    """
+    tables: Dict[str, Dict[int, str]] = {}
+
+    def add_tables(sub_type: defs.Type, path: str) -> None:
+        if isinstance(sub_type, defs.EnumType):
+            tables[path] = {value.int_value: value.name for value in sub_type.values}
+        elif isinstance(sub_type, defs.ArrayType):
+            add_tables(sub_type.base_type, path)
+        elif isinstance(sub_type, defs.StructType):
+            for field in sub_type.fields:
+                add_tables(field.sd_type, f"{path}.{field.name}" if path else field.name)
+
+    add_tables(sd_type, "")
+    return tables
@@ -335,20 +335,34 @@ class Value:
     """Interface for all element types values that shall
     provide a readable string representation.
     Derived classes shall implement __str__() method.
+
+    Value classes are slotted, to limit the memory used by long traces.
     """
 
-    pass
+    __slots__ = ()
+
+    def to_python(self) -> Any:
+        """Return the value as a plain Python value, in the format accepted
+        by Element.append_value(): None for none, bool, int, float or str
+        for predefined values, tuple for lists, str for enumeration values, and
+        tuple (name, value) or str for variant values."""
+        return None
 
 
 class PredefinedValue(Value):
     """Values for predefined Swan Types"""
 
-    pass
+    __slots__ = ("_value",)
+
+    def to_python(self) -> Any:
+        return self._value.value
 
 
 class NoneValue(Value):
     """None Values"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "none"
 
@@ -356,26 +370,38 @@ class NoneValue(Value):
 class PredefinedCharValue(PredefinedValue):
     """Values for predefined type char"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_uint8_t) -> None:
         self._value = value
 
     def __str__(self) -> str:
         return "'" + chr(self._value.value) + "'"
 
+    def to_python(self) -> Any:
+        return chr(self._value.value)
+
 
 class PredefinedBoolValue(PredefinedValue):
     """Values for predefined type boolean"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_uint8_t) -> None:
         self._value = True if value else False
 
     def __str__(self) -> str:
         return "true" if self._value else "false"
 
+    def to_python(self) -> Any:
+        return self._value
+
 
 class PredefinedInt8Value(PredefinedValue):
     """Values for predefined type int 8"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_int8_t) -> None:
         self._value = value
 
@@ -386,6 +412,8 @@ class PredefinedInt8Value(PredefinedValue):
 class PredefinedInt16Value(PredefinedValue):
     """Values for predefined type int 16"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_int16_t) -> None:
         self._value = value
 
@@ -396,6 +424,8 @@ class PredefinedInt16Value(PredefinedValue):
 class PredefinedInt32Value(PredefinedValue):
     """Values for predefined type int 32"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_int32_t) -> None:
         self._value = value
 
@@ -406,6 +436,8 @@ class PredefinedInt32Value(PredefinedValue):
 class PredefinedInt64Value(PredefinedValue):
     """Values for predefined type int 64"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_int64_t) -> None:
         self._value = value
 
@@ -416,6 +448,8 @@ class PredefinedInt64Value(PredefinedValue):
 class PredefinedUInt8Value(PredefinedValue):
     """Values for predefined type unsigned int 8"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_uint8_t) -> None:
         self._value = value
 
@@ -426,6 +460,8 @@ class PredefinedUInt8Value(PredefinedValue):
 class PredefinedUInt16Value(PredefinedValue):
     """Values for predefined type unsigned int 16"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_uint16_t) -> None:
         self._value = value
 
@@ -436,6 +472,8 @@ class PredefinedUInt16Value(PredefinedValue):
 class PredefinedUInt32Value(PredefinedValue):
     """Values for predefined type unsigned int 32"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_uint32_t) -> None:
         self._value = value
 
@@ -446,6 +484,8 @@ class PredefinedUInt32Value(PredefinedValue):
 class PredefinedUInt64Value(PredefinedValue):
     """Values for predefined type unsigned int 64"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_uint64_t) -> None:
         self._value = value
 
@@ -456,6 +496,8 @@ class PredefinedUInt64Value(PredefinedValue):
 class PredefinedFloat32Value(PredefinedValue):
     """Values for predefined type float 32"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_float32_t) -> None:
         self._value = value
 
@@ -466,6 +508,8 @@ class PredefinedFloat32Value(PredefinedValue):
 class PredefinedFloat64Value(PredefinedValue):
     """Values for predefined type float 64"""
 
+    __slots__ = ()
+
     def __init__(self, value: core.sd_float64_t) -> None:
         self._value = value
 
@@ -476,26 +520,38 @@ class PredefinedFloat64Value(PredefinedValue):
 class ListValue(Value):
     """Values for list types"""
 
+    __slots__ = ("_values",)
+
     def __init__(self, values: List[Value]) -> None:
         self._values = values
 
     def __str__(self) -> str:
         return "(" + ",".join([str(v) for v in self._values]) + ")"
 
+    def to_python(self) -> Any:
+        return tuple(v.to_python() for v in self._values)
+
 
 class EnumValue(Value):
     """Values for enumeration types"""
 
+    __slots__ = ("_name",)
+
     def __init__(self, name: str) -> None:
         self._name = name
 
     def __str__(self) -> str:
         return self._name
 
+    def to_python(self) -> Any:
+        return self._name
+
 
 class VariantValue(Value):
     """Values for variant types"""
 
+    __slots__ = ("_name", "_value")
+
     def __init__(self, name: str, value: Optional[Value]) -> None:
         self._name = name
         self._value = value
@@ -503,10 +559,15 @@ class VariantValue(Value):
     def __str__(self) -> str:
         return self._name + "{" + (str(self._value) if self._value is not None else "") + "}"
 
+    def to_python(self) -> Any:
+        return self._name if self._value is None else (self._name, self._value.to_python())
+
 
 class UntypedVariantConstructorValue(Value):
     """No value to return for untyped variant constructor"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return ""
 
@@ -514,6 +575,8 @@ class UntypedVariantConstructorValue(Value):
 class ImportedValue(Value):
     """Values for imported types"""
 
+    __slots__ = ("_bytes_data",)
+
     def __init__(self, bytes_data) -> None:
         self._bytes_data = bytes_data
 
@@ -522,6 +585,9 @@ class ImportedValue(Value):
             "" if self._bytes_data is None else "".join([f"{by:0>4X}" for by in self._bytes_data])
         )
 
+    def to_python(self) -> Any:
+        return None if self._bytes_data is None else bytes(self._bytes_data)
+
 
 ElementKind = core.SdeKind
 
@@ -590,6 +656,13 @@ class ElementBase(metaclass=abc.ABCMeta):
     def children_elements(self) -> List["ElementBase"]:
         return self._children_elements
 
+    @property
+    def path(self) -> str:
+        "Path of element: names of its parents and its name, separated by '/'"
+        if self.parent is None:
+            return self.name
+        return self.parent.path + "/" + self.name
+
     @property
     def nb_parents(self) -> int:
         if self.parent is None:
@@ -626,8 +699,21 @@ class ElementBase(metaclass=abc.ABCMeta):
     def append_values_sequence(self, py_values: List[Any], repeat_factor: int = 1) -> None:
         pass
 
+    def append_array(self, values: Any, repeat_factor: int = 1, compress: bool = False) -> None:
+        pass
+
+    def read_array(self, start: Optional[int] = None, n: Optional[int] = None) -> Any:
+        pass
+
+    def iter_chunks(
+        self, chunk_size: int = 4096, start: Optional[int] = None, n: Optional[int] = None
+    ) -> Iterator[Any]:
+        pass
+
     @abc.abstractmethod
-    def read_values(self, start: Optional[int] = None, n: Optional[int] = None) -> Iterator[Value]:
+    def read_values(
+        self, start: Optional[int] = None, n: Optional[int] = None, raw: bool = False
+    ) -> Iterator[Any]:
         pass
 
     @abc.abstractmethod
@@ -670,6 +756,10 @@ class FileBase:
     def remove_element(self, element: ElementBase) -> None:
         pass
 
+    @abc.abstractmethod
+    def load_type(self, type_id: int) -> Optional[Type]:
+        pass
+
     @abc.abstractmethod
     def get_version(self) -> str:
         pass
@@ -684,6 +774,10 @@ class FileBase:
                 return e
         return None
 
+    @abc.abstractmethod
+    def find_element_by_path(self, path: str) -> Optional[ElementBase]:
+        pass
+
     def __str__(self) -> str:
         s = "*** Elements:\n"
         for elem in self.elements:
@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import copy
 from typing import TYPE_CHECKING, List, Union, Optional, cast
 
 from ansys.scadeone.core.common.exception import ScadeOneException
@@ -42,6 +43,7 @@ class DiagramFactory:
 
             cls._instance = super(DiagramFactory, cls).__new__(cls)
             cls._instance._parser = SwanParser(LOGGER)
+            cls._instance._adaptations = {}
         return cls._instance
 
     @staticmethod
@@ -143,7 +145,15 @@ class DiagramFactory:
         return end_obj, end_adp
 
     def _parse_group_adaptation(self, adp: str) -> "swan.GroupAdaptation":
-        """Convert a group adaptation expression into a GroupAdaptation object."""
+        """Convert a group adaptation expression into a GroupAdaptation object.
+
+        The expression is parsed once, then a copy of the parsed adaptation is returned.
+        """
+        if (adaptation := self._adaptations.get(adp)) is None:
+            adaptation = self._adaptations[adp] = self._parse_new_group_adaptation(adp)
+        return copy.deepcopy(adaptation)
+
+    def _parse_new_group_adaptation(self, adp: str) -> "swan.GroupAdaptation":
         from ansys.scadeone.core.swan import Diagram, Wire
 
         swan_code = f"diagram (#0 wire #1 .({adp}) => #2)"
@@ -154,11 +164,15 @@ class DiagramFactory:
 
 
 class DiagramAdder:
-    """Class for adding diagrams."""
+    """Class for adding diagrams.
+
+    The next lunum and an index of the wires by source are stored in the diagram.
+    They are computed once from the diagram objects, then maintained when objects
+    are added, so that adding a block or a wire does not depend on the diagram size.
+    """
 
     def __init__(self, owner: "swan.Diagram") -> None:
         self._owner = owner
-        self._lunum = -1
 
     def add_block(self, block: "swan.Block") -> None:
         """Add a block to the diagram."""
@@ -180,24 +194,35 @@ class DiagramAdder:
         """Add a set sensor block to the diagram."""
         self._add_diagram_object(set_sensor)
 
-    def _check_wire_source(self, wire: "swan.Wire") -> Optional["swan.Wire"]:
-        # Check if the wire source is already in the diagram with the same source characteristics
-        from ansys.scadeone.core.swan import Wire
+    @staticmethod
+    def _wire_source_key(wire: "swan.Wire") -> Optional[tuple]:
+        # Key of the wire index: source lunum and source adaptation
+        source = wire.source
+        if not source.is_connected or source.port.lunum is None:
+            return None
+        return source.port.lunum.value, source.adaptation
 
-        source_lunum = wire.source.port.lunum.value
-        source_adaptation = wire.source.adaptation
-        # look for candidate wires with the same source lunum
-        candidates = [obj for obj in self._owner.objects if isinstance(obj, Wire)]
+    def _get_wire_index(self) -> dict:
+        """Return the index of the diagram wires by source, computed on first call."""
+        from ansys.scadeone.core.swan import Wire
 
-        def _check(w: "swan.Wire") -> bool:
-            same_lunum = source_lunum == w.source.port.lunum.value
-            same_adaptation = source_adaptation == w.source.adaptation
-            return same_lunum and same_adaptation
+        if self._owner._wires_by_source is None:
+            wires_by_source = {}
+            for obj in self._owner.objects:
+                if not isinstance(obj, Wire):
+                    continue
+                key = self._wire_source_key(obj)
+                if key is not None and key not in wires_by_source:
+                    wires_by_source[key] = obj
+            self._owner._wires_by_source = wires_by_source
+        return self._owner._wires_by_source
 
-        wires = list(filter(_check, candidates))
-        if len(wires) == 0:
+    def _check_wire_source(self, wire: "swan.Wire") -> Optional["swan.Wire"]:
+        # Check if the wire source is already in the diagram with the same source characteristics
+        key = self._wire_source_key(wire)
+        if key is None:
             return None
-        return wires[0]
+        return self._get_wire_index().get(key)
 
     @staticmethod
     def _check_wire_targets(wire: "swan.Wire", existing_wire: "swan.Wire") -> bool:
@@ -214,33 +239,168 @@ class DiagramAdder:
                 # Check if existing wire have the same targets,
                 # if it doesn't, add the targets to the existing wire
                 existing_wire.targets.extend(wire.targets)
+                for target in wire.targets:
+                    target.owner = existing_wire
+                existing_wire.set_modified()
+                if self._owner._diag_nav is not None:
+                    self._owner._diag_nav.add_wire_targets(existing_wire, wire.targets)
             return existing_wire
 
         # No candidate wires found, add the wire to the diagram
         self._add_diagram_object(wire)
+        if (key := self._wire_source_key(wire)) is not None:
+            self._get_wire_index()[key] = wire
         return wire
 
+    def add_objects(
+        self,
+        objects: List["swan.DiagramObject"],
+        wire_ends: List[tuple],
+    ) -> List["swan.Wire"]:
+        """Add blocks and wires to the diagram in one go.
+
+        The lunums are allocated once for all the new objects, and the wires
+        are checked against the existing ones with the wire index and sets of targets.
+
+        Parameters
+        ----------
+        objects: List[DiagramObject]
+            Objects to add, before the wires.
+        wire_ends: List[tuple]
+            (source, targets) pairs, with the same forms as for
+            :py:meth:`DiagramCreator.connect`.
+
+        Returns
+        -------
+        List[Wire]
+            The wire of each (source, targets) pair: a new wire or the
+            existing wire with the same source.
+
+        Raises
+        ------
+        ScadeOneException
+            A wire end is neither in the diagram nor in *objects*, or has an invalid
+            group adaptation. The diagram is then not modified.
+        """
+        # All the wire ends are checked, and their adaptations parsed,
+        # before the diagram is modified
+        factory = DiagramFactory()
+        new_objects = {id(obj) for obj in objects}
+        checked_ends = []
+        for source, targets in wire_ends:
+            if not isinstance(targets, list):
+                targets = [targets]
+            for end in [source, *targets]:
+                end_obj, _ = factory._split_wire_end(end)
+                if end_obj.lunum is None and id(end_obj) not in new_objects:
+                    raise ScadeOneException("Cannot connect an object which is not in a diagram.")
+            checked_ends.append((source, targets))
+
+        self._add_new_objects(objects)
+        wire_index = self._get_wire_index()
+        targets_by_wire = {}
+        new_wires = []
+        extended_wires = {}
+        result = []
+        for source, targets in checked_ends:
+            wire = factory.create_wire(source, targets)
+            key = self._wire_source_key(wire)
+            existing_wire = wire_index.get(key) if key is not None else None
+            if existing_wire is None:
+                if key is not None:
+                    wire_index[key] = wire
+                targets_by_wire[id(wire)] = self._target_keys(wire.targets)
+                new_wires.append(wire)
+                result.append(wire)
+                continue
+            # Keep the targets which are not yet connected to the existing wire
+            target_keys = targets_by_wire.get(id(existing_wire))
+            if target_keys is None:
+                target_keys = targets_by_wire[id(existing_wire)] = self._target_keys(
+                    existing_wire.targets
+                )
+            for target in wire.targets:
+                target_key = (target.port.lunum.value, target.adaptation)
+                if target_key in target_keys:
+                    continue
+                target_keys.add(target_key)
+                existing_wire.targets.append(target)
+                target.owner = existing_wire
+                existing_wire.set_modified()
+                if existing_wire.owner is self._owner and existing_wire._lunum is not None:
+                    # Wire already in the diagram, navigation is updated below
+                    extended_wires.setdefault(id(existing_wire), (existing_wire, []))[1].append(
+                        target
+                    )
+            result.append(existing_wire)
+
+        self._add_new_objects(new_wires)
+        if self._owner._diag_nav is not None:
+            for wire, targets in extended_wires.values():
+                self._owner._diag_nav.add_wire_targets(wire, targets)
+        return result
+
+    @staticmethod
+    def _target_keys(targets: List["swan.Connection"]) -> set:
+        return {
+            (target.port.lunum.value, target.adaptation)
+            for target in targets
+            if target.is_connected and target.port.lunum is not None
+        }
+
+    def _add_new_objects(self, objects: List["swan.DiagramObject"]) -> None:
+        """Add a list of objects to the diagram with a single lunum allocation."""
+        from ansys.scadeone.core.swan import Lunum
+
+        if not objects:
+            return
+        first = self._reserve_lunums(len(objects))
+        for lunum, obj in enumerate(objects, first):
+            obj._lunum = Lunum(f"#{lunum}")
+            obj.owner = self._owner
+            obj._structural_hashes = None
+        if not self._owner._objects:
+            self._owner._objects = list(objects)
+        else:
+            self._owner._objects.extend(objects)
+        self._owner.set_modified()
+        if self._owner._diag_nav is not None:
+            for obj in objects:
+                self._owner._diag_nav.add_object(obj)
+
     def _add_diagram_object(self, object: "swan.DiagramObject") -> None:
         """Add a diagram object to the diagram."""
         from ansys.scadeone.core.swan import Lunum
 
-        self._generate_next_lunum()
-        object._lunum = Lunum(f"#{self._lunum}")
-        self._lunum += 1
+        lunum = self._generate_next_lunum()
+        object._lunum = Lunum(f"#{lunum}")
         object.owner = self._owner
         if not self._owner._objects:
             self._owner._objects = [object]
         else:
             self._owner._objects.append(object)
+        object.set_modified()
+        if self._owner._diag_nav is not None:
+            # Keep the navigation up to date with the edited diagram
+            self._owner._diag_nav.add_object(object)
 
-    def _generate_next_lunum(self) -> None:
+    def _generate_next_lunum(self) -> int:
         """Generate the next lunum for the diagram objects."""
-        if not self._lunum == -1:
-            return
-        if not self._owner._objects:
-            self._lunum = 0
-        else:
-            self._lunum = max([int(obj.lunum.value[1:]) for obj in self._owner._objects]) + 1
+        return self._reserve_lunums(1)
+
+    def _reserve_lunums(self, count: int) -> int:
+        """Reserve *count* consecutive lunums and return the first one."""
+        if self._owner._next_lunum is None:
+            lunums = [
+                int(obj.lunum.value[1:])
+                for diag_obj in self._owner.objects
+                for obj in [diag_obj, *diag_obj.locals]
+                if obj.lunum is not None
+            ]
+            self._owner._next_lunum = max(lunums) + 1 if lunums else 0
+        lunum = self._owner._next_lunum
+        self._owner._next_lunum += count
+        return lunum
 
 
 class DiagramCreator:
@@ -342,6 +502,35 @@ class DiagramCreator:
         added_wire = self._diagram_adder.add_wire(wire)
         return added_wire
 
+    def build(
+        self,
+        blocks: Optional[List["swan.DiagramObject"]] = None,
+        wires: Optional[List[tuple]] = None,
+    ) -> List["swan.Wire"]:
+        """Add blocks and wires to the diagram in one call.
+
+        This is the bulk version of the *add_* and :py:meth:`connect` methods,
+        for diagrams with many objects: lunums are allocated once, and
+        duplicate connections are detected with hash sets.
+
+        Parameters
+        ----------
+        blocks: List[DiagramObject], optional
+            Diagram objects to add, for instance created with the
+            :py:class:`DiagramFactory` methods.
+        wires: List[tuple], optional
+            List of (source, targets) pairs, where *source* and *targets* take the
+            same forms as the :py:meth:`connect` parameters. Sources and targets are
+            either objects of the diagram or objects of *blocks*.
+
+        Returns
+        -------
+        List[Wire]
+            Wire of each (source, targets) pair. When a wire with the same source
+            already exists, the new targets are added to it and it is returned.
+        """
+        return self._diagram_adder.add_objects(blocks or [], wires or [])
+
     # Harness specific methods
     def _is_in_harness(self) -> bool:
         """Check if the diagram is in a test harness."""
@@ -380,7 +569,10 @@ class DiagramCreator:
                 "Cannot add an under test operator outside a test harness diagram."
             )
         block = self.add_block(instance)
-        block.pragmas.append(TestPragma(TestPragmaKind.UNDER_TEST))
+        pragma = TestPragma(TestPragmaKind.UNDER_TEST)
+        pragma.owner = block
+        block.pragmas.append(pragma)
+        block.set_modified()
         return block
 
     def add_data_source(self, key: str) -> "swan.Block":
@@ -224,6 +224,7 @@ class UseDirectiveAdder:
         """Add a use directive to the module."""
         module.use_directives.append(use_directive)
         use_directive._owner = module
+        module.set_modified()
 
 
 class DeclarationAdder:
@@ -268,6 +269,7 @@ class DeclarationAdder:
         else:
             raise ScadeOneException(f"Declaration not supported: {declaration}")
         declaration._owner = module
+        module.set_modified()
 
 
 class ModuleAdder:
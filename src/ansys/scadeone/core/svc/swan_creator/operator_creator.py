@@ -145,6 +145,7 @@ class OperatorAdder:
         variable._is_input = True
         operator.inputs.append(variable)
         variable._owner = operator
+        operator.set_modified()
 
     @staticmethod
     def add_output(operator: "swan.OperatorDeclaration", variable: "swan.Variable") -> None:
@@ -152,6 +153,7 @@ class OperatorAdder:
         variable._is_output = True
         operator.outputs.append(variable)
         variable._owner = operator
+        operator.set_modified()
 
 
 class OperatorDeclarationCreator(ABC):
@@ -322,6 +324,9 @@ class OperatorCreator(OperatorDeclarationCreator):
             scope = Scope([diag])
             scope.owner = self
             self._body = scope
+            self.set_modified()
             return diag
         self._body._sections.append(diag)
+        diag.owner = self._body
+        self._body.set_modified()
         return diag
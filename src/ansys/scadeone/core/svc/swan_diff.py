@@ -0,0 +1,429 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module contains the comparison of two Swan models.
+
+The differences are reported as :py:class:`Change` objects: added, removed and
+changed declarations of the modules, then the changed equations, blocks, wires, states...
+inside the changed operators. Each change has a stable path such as
+``CC.swan/operator Regulation/diagram 1/wire #5``.
+
+Identical modules are skipped by comparing their source files, identical constructs
+are skipped by comparing their structural hashes (see :py:meth:`SwanItem.structural_hash`).
+"""
+
+from enum import Enum
+import json
+from typing import Iterable, Iterator, Optional, TextIO, Tuple
+
+import ansys.scadeone.core.swan as swan
+from ansys.scadeone.core.common.storage import SwanFile
+from ansys.scadeone.core.interfaces import IModel
+
+# An item of a container: key in the container, category and Swan object
+Item = Tuple[str, str, swan.SwanItem]
+
+
+class ChangeKind(Enum):
+    """Kind of a model change."""
+
+    #: Construct only in the second model.
+    ADDED = "added"
+    #: Construct only in the first model.
+    REMOVED = "removed"
+    #: Construct in both models, with differences.
+    CHANGED = "changed"
+
+
+class Change:
+    """Difference between two models.
+
+    Parameters
+    ----------
+    kind : ChangeKind
+        Kind of change.
+    category : str
+        Category of the changed construct: *module*, *operator*, *equation*, *block*, *wire*...
+    path : str
+        Path of the construct, the same in both models.
+    old : Optional[SwanItem]
+        Construct in the first model, None if added.
+    new : Optional[SwanItem]
+        Construct in the second model, None if removed.
+    """
+
+    def __init__(
+        self,
+        kind: ChangeKind,
+        category: str,
+        path: str,
+        old: Optional[swan.SwanItem],
+        new: Optional[swan.SwanItem],
+    ) -> None:
+        self._kind = kind
+        self._category = category
+        self._path = path
+        self._old = old
+        self._new = new
+
+    @property
+    def kind(self) -> ChangeKind:
+        """Kind of change."""
+        return self._kind
+
+    @property
+    def category(self) -> str:
+        """Category of the changed construct."""
+        return self._category
+
+    @property
+    def path(self) -> str:
+        """Path of the changed construct."""
+        return self._path
+
+    @property
+    def old(self) -> Optional[swan.SwanItem]:
+        """Construct in the first model, None if added."""
+        return self._old
+
+    @property
+    def new(self) -> Optional[swan.SwanItem]:
+        """Construct in the second model, None if removed."""
+        return self._new
+
+    def to_dict(self) -> dict:
+        """Return the change as a dictionary, with *kind*, *category* and *path* keys."""
+        return {"kind": self.kind.value, "category": self.category, "path": self.path}
+
+    def __repr__(self) -> str:
+        return f"Change({self.kind.value}, {self.category}, {self.path})"
+
+
+class ModelDiff:
+    """Differences between two models.
+
+    The differences are computed while iterating on the object: modules are loaded
+    and compared one after the other.
+
+    Parameters
+    ----------
+    model_a : Model
+        First model.
+    model_b : Model
+        Second model.
+    ignore_layout : bool, optional
+        When True, the diagram pragmas and the luids are ignored, by default True.
+    """
+
+    def __init__(self, model_a: IModel, model_b: IModel, ignore_layout: bool = True) -> None:
+        self._model_a = model_a
+        self._model_b = model_b
+        self._ignore_layout = ignore_layout
+
+    def __iter__(self) -> Iterator[Change]:
+        modules_a = self._modules(self._model_a)
+        modules_b = self._modules(self._model_b)
+        for key, (category, name, source_a) in modules_a.items():
+            if key not in modules_b:
+                module_a = self._load(self._model_a, category, name)
+                yield Change(ChangeKind.REMOVED, category, key, module_a, None)
+                continue
+            source_b = modules_b[key][2]
+            if (
+                isinstance(source_a, SwanFile)
+                and isinstance(source_b, SwanFile)
+                and source_a.content() == source_b.content()
+            ):
+                # Same source file, the module is not loaded
+                continue
+            module_a = self._load(self._model_a, category, name)
+            module_b = self._load(self._model_b, category, name)
+            yield from self._diff_item(key, category, module_a, module_b)
+        for key, (category, name, _) in modules_b.items():
+            if key not in modules_a:
+                module_b = self._load(self._model_b, category, name)
+                yield Change(ChangeKind.ADDED, category, key, None, module_b)
+
+    def to_json(
+        self, stream: Optional[TextIO] = None, indent: Optional[int] = None
+    ) -> Optional[str]:
+        """Write the changes as a JSON list of objects with *kind*, *category* and *path* keys.
+
+        Parameters
+        ----------
+        stream : Optional[TextIO], optional
+            Output stream. The changes are written as they are computed.
+            If None, the JSON string is returned.
+        indent : Optional[int], optional
+            Indentation of the change objects, see :py:func:`json.dumps`.
+
+        Returns
+        -------
+        Optional[str]
+            JSON string if no stream is given, else None.
+        """
+        if stream is None:
+            return json.dumps([change.to_dict() for change in self], indent=indent)
+        separator = "["
+        for change in self:
+            stream.write(separator + "\n" + json.dumps(change.to_dict(), indent=indent))
+            separator = ","
+        stream.write("\n]\n" if separator == "," else "[]\n")
+        return None
+
+    # Modules
+    # -------
+
+    @staticmethod
+    def _modules(model: IModel) -> dict:
+        # module file name -> (category, module name, module or not-yet-loaded file)
+        modules = {}
+        for module in model.all_modules:
+            if isinstance(module, SwanFile):
+                name = swan.Module.module_name_from_path(module.path)
+                suffix = module.path.suffix
+            else:
+                name = module.name.as_string
+                if isinstance(module, swan.ModuleInterface):
+                    suffix = ".swani"
+                elif isinstance(module, swan.TestModule):
+                    suffix = ".swant"
+                else:
+                    suffix = ".swan"
+            category = {".swani": "interface", ".swant": "test_module"}.get(suffix, "module")
+            modules[f"{name}{suffix}"] = (category, name, module)
+        return modules
+
+    @staticmethod
+    def _load(model: IModel, category: str, name: str) -> swan.Module:
+        if category == "interface":
+            return model.get_module_interface(name)
+        if category == "test_module":
+            return model.get_test_module(name)
+        return model.get_module_body(name)
+
+    # Items
+    # -----
+
+    def _hash(self, swan_obj: swan.SwanItem) -> int:
+        return swan_obj.structural_hash(self._ignore_layout)
+
+    def _diff_item(
+        self, path: str, category: str, item_a: swan.SwanItem, item_b: swan.SwanItem
+    ) -> Iterator[Change]:
+        if type(item_a) is type(item_b) and self._hash(item_a) == self._hash(item_b):
+            return
+        yield Change(ChangeKind.CHANGED, category, path, item_a, item_b)
+        items_a = self._index(_children(item_a, self._ignore_layout))
+        items_b = self._index(_children(item_b, self._ignore_layout))
+        for key, (child_category, child_a) in items_a.items():
+            child_path = f"{path}/{key}"
+            if key in items_b:
+                yield from self._diff_item(child_path, child_category, child_a, items_b[key][1])
+            else:
+                yield Change(ChangeKind.REMOVED, child_category, child_path, child_a, None)
+        for key, (child_category, child_b) in items_b.items():
+            if key not in items_a:
+                yield Change(ChangeKind.ADDED, child_category, f"{path}/{key}", None, child_b)
+
+    @staticmethod
+    def _index(items: Iterable[Item]) -> dict:
+        # key -> (category, object), duplicated keys are numbered
+        index = {}
+        for key, category, swan_obj in items:
+            unique_key = key
+            count = 1
+            while unique_key in index:
+                count += 1
+                unique_key = f"{key} ({count})"
+            index[unique_key] = (category, swan_obj)
+        return index
+
+
+# Children of the compared constructs
+# -----------------------------------
+
+
+def _name(swan_obj: swan.SwanItem) -> str:
+    identifier = getattr(swan_obj, "id", None)
+    if isinstance(identifier, swan.Identifier):
+        return identifier.value
+    return "_"
+
+
+def _children(swan_obj: swan.SwanItem, ignore_layout: bool) -> Iterator[Item]:
+    """Return the items of a construct which are compared one by one."""
+    if isinstance(swan_obj, swan.Module):
+        yield from _module_items(swan_obj)
+    elif isinstance(swan_obj, (swan.OperatorDeclarationDefinitionBase, swan.TestHarness)):
+        if isinstance(swan_obj, swan.OperatorDeclarationDefinitionBase):
+            for var in swan_obj.inputs:
+                yield f"input {_name(var)}", "variable", var
+            for var in swan_obj.outputs:
+                yield f"output {_name(var)}", "variable", var
+        body = getattr(swan_obj, "body", None)
+        if isinstance(body, swan.Scope):
+            yield from _scope_items(body, ignore_layout)
+        elif body is not None:
+            yield "body", "equation", body
+    elif isinstance(swan_obj, swan.Scope):
+        yield from _scope_items(swan_obj, ignore_layout)
+    elif isinstance(swan_obj, swan.Diagram):
+        yield from _diagram_items(swan_obj)
+    elif isinstance(swan_obj, swan.SectionObject):
+        yield from _section_items(swan_obj.section, [0], ignore_layout)
+    elif isinstance(swan_obj, swan.StateMachineBlock):
+        yield from _children(swan_obj.state_machine, ignore_layout)
+    elif isinstance(swan_obj, swan.StateMachine):
+        for item in swan_obj.items:
+            if isinstance(item, swan.State):
+                yield f"state {_state_name(item)}", "state", item
+            elif isinstance(item, swan.Transition):
+                yield _transition_key(item), "transition", item
+    elif isinstance(swan_obj, swan.State):
+        for transition in swan_obj.in_state_strong_transition_decls:
+            yield _transition_key(transition), "transition", transition
+        for transition in swan_obj.in_state_weak_transition_decls:
+            yield _transition_key(transition), "transition", transition
+        yield from _scope_items(swan_obj.body, ignore_layout)
+
+
+def _module_items(module: swan.Module) -> Iterator[Item]:
+    for use in module.use_directives:
+        yield f"use {use.path.as_string}", "use", use
+    for decl in module.declarations:
+        if isinstance(decl, swan.ConstDeclarations):
+            for const in decl.constants:
+                yield f"const {_name(const)}", "constant", const
+        elif isinstance(decl, swan.TypeDeclarations):
+            for type_decl in decl.types:
+                yield f"type {_name(type_decl)}", "type", type_decl
+        elif isinstance(decl, swan.SensorDeclarations):
+            for sensor in decl.sensors:
+                yield f"sensor {_name(sensor)}", "sensor", sensor
+        elif isinstance(decl, swan.GroupDeclarations):
+            for group in decl.groups:
+                yield f"group {_name(group)}", "group", group
+        elif isinstance(decl, swan.OperatorDeclarationDefinitionBase):
+            yield f"operator {_name(decl)}", "operator", decl
+        elif isinstance(decl, swan.TestHarness):
+            yield f"harness {_name(decl)}", "harness", decl
+        elif not isinstance(decl, swan.UseDirective):
+            yield f"declaration {_name(decl)}", "declaration", decl
+
+
+def _scope_items(scope: swan.Scope, ignore_layout: bool) -> Iterator[Item]:
+    # section counters, by kind
+    counter = [0]
+    for section in scope.sections:
+        yield from _section_items(section, counter, ignore_layout)
+
+
+def _section_items(
+    section: swan.ScopeSection, counter: list, ignore_layout: bool
+) -> Iterator[Item]:
+    if isinstance(section, swan.VarSection):
+        for var in section.var_decls:
+            yield f"var {_name(var)}", "variable", var
+    elif isinstance(section, swan.LetSection):
+        # Equations are identified by their definitions, whatever their section
+        for equation in section.equations:
+            yield _equation_item(equation, "equation", ignore_layout)
+    elif isinstance(section, swan.Diagram):
+        counter[0] += 1
+        yield f"diagram {counter[0]}", "diagram", section
+    else:
+        counter[0] += 1
+        yield f"{type(section).__name__} {counter[0]}", "section", section
+
+
+def _equation_item(equation: swan.SwanItem, default_category: str, ignore_layout: bool) -> Item:
+    lhs = getattr(equation, "lhs", None)
+    lhs_str = swan.swan_to_str(lhs) if isinstance(lhs, swan.EquationLHS) else ""
+    if isinstance(equation, swan.DefByCase):
+        if isinstance(equation, swan.StateMachine):
+            kind, category = "automaton", "state_machine"
+        else:
+            kind, category = "activate", "activate"
+        if ignore_layout:
+            # luids are layout: the equation is identified by its contents
+            name = f"{equation.structural_hash(True):016x}"
+        else:
+            name = equation.luid.value if equation.luid is not None else lhs_str
+        return f"{kind} {name}".rstrip(), category, equation
+    return f"{default_category} {lhs_str}".rstrip(), default_category, equation
+
+
+def _diagram_items(diagram: swan.Diagram) -> Iterator[Item]:
+    # Diagram objects are identified by their lunums
+    for index, obj in enumerate(diagram.objects):
+        key = obj.lunum.value if obj.lunum is not None else f"object {index}"
+        if isinstance(obj, swan.Wire):
+            yield f"wire {key}", "wire", obj
+        elif isinstance(obj, swan.SectionObject):
+            yield f"section {key}", "section", obj
+        elif isinstance(obj, swan.StateMachineBlock):
+            yield f"automaton {key}", "state_machine", obj
+        elif isinstance(obj, swan.DefByCaseBlockBase):
+            yield f"activate {key}", "activate", obj
+        else:
+            yield f"block {key}", "block", obj
+
+
+def _state_name(state: swan.State) -> str:
+    return " ".join(ref.value for ref in (state.lunum, state.id) if ref is not None)
+
+
+def _state_ref(state_ref: Optional[swan.StateRef]) -> str:
+    if state_ref is None:
+        return ""
+    return state_ref.id.value if state_ref.id is not None else state_ref.lunum.value
+
+
+def _transition_key(transition: swan.Transition) -> str:
+    kind = "unless" if transition.is_strong else "until"
+    priority = transition.priority.value if transition.priority is not None else ""
+    source = _state_ref(transition.source)
+    key = f"{kind} {priority}".rstrip()
+    return f"{source} {key}" if source else key
+
+
+def diff(model_a: IModel, model_b: IModel, ignore_layout: bool = True) -> ModelDiff:
+    """Compare two models.
+
+    Parameters
+    ----------
+    model_a : Model
+        First model.
+    model_b : Model
+        Second model.
+    ignore_layout : bool, optional
+        When True, the diagram pragmas and the luids are ignored, by default True.
+
+    Returns
+    -------
+    ModelDiff
+        Iterable of the changes from *model_a* to *model_b*.
+    """
+    return ModelDiff(model_a, model_b, ignore_layout)
@@ -0,0 +1,298 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module contains the computation of structural hashes of Swan constructs.
+
+The structural hash of a Swan object is computed bottom-up from its class name,
+its builtin and enumeration values and the structural hashes of its children,
+as a Merkle tree. Two constructs with the same structure and values have the same
+hash, whatever their owner. The hashes are stable from one session to another.
+
+The hash of each visited object is cached in the object, see
+:py:meth:`SwanItem.structural_hash` and :py:meth:`SwanItem.invalidate_structural_hash`.
+"""
+
+from enum import Enum
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Tuple
+
+import ansys.scadeone.core.swan as swan
+from ansys.scadeone.core.svc.swan_visitor import Owner, OwnerProperty, SwanVisitor
+
+_DIGEST_SIZE = 16
+
+
+class StructuralHasher(SwanVisitor):
+    """Visitor computing the structural hashes of a Swan object and of its children.
+
+    Parameters
+    ----------
+    ignore_layout : bool, optional
+        When True, the diagram pragmas and the luids are ignored.
+    """
+
+    def __init__(self, ignore_layout: bool = False) -> None:
+        super().__init__()
+        self._ignore_layout = ignore_layout
+        # hash under computation of each object being visited
+        self._frames = [blake2b(digest_size=_DIGEST_SIZE)]
+
+    def hash(self, swan_obj: swan.SwanItem) -> int:
+        """Return the structural hash of a Swan object.
+
+        Parameters
+        ----------
+        swan_obj : SwanItem
+            Swan object.
+
+        Returns
+        -------
+        int
+            Structural hash.
+        """
+        return int.from_bytes(self._get_digest(swan_obj, None, None), "big")
+
+    def _update(self, owner_property: OwnerProperty, data: bytes) -> None:
+        # The property name distinguishes optional children
+        self._frames[-1].update(f"\0{owner_property}\0".encode() + data)
+
+    def _get_digest(
+        self, swan_obj: swan.SwanItem, owner: Owner, owner_property: OwnerProperty
+    ) -> bytes:
+        cache = getattr(swan_obj, "_structural_hashes", None)
+        if cache is not None and self._ignore_layout in cache:
+            return cache[self._ignore_layout]
+        self._frames.append(blake2b(type(swan_obj).__name__.encode(), digest_size=_DIGEST_SIZE))
+        super()._visit(swan_obj, owner, owner_property)
+        digest = self._frames.pop().digest()
+        if cache is None:
+            cache = swan_obj._structural_hashes = {}
+        cache[self._ignore_layout] = digest
+        return digest
+
+    def _visit(self, swan_obj: Any, owner: Owner, owner_property: OwnerProperty) -> None:
+        if isinstance(swan_obj, Enum):
+            self._update(owner_property, f"{type(swan_obj).__name__}.{swan_obj.name}".encode())
+        elif self._ignore_layout and (
+            isinstance(swan_obj, swan.Luid) or self._is_layout_pragma(swan_obj)
+        ):
+            # layout objects are not part of the hash, not even by their type
+            pass
+        else:
+            self._update(owner_property, self._get_digest(swan_obj, owner, owner_property))
+
+    def visit_builtin(self, object: Any, owner: Owner, owner_property: OwnerProperty) -> None:
+        self._update(owner_property, f"{type(object).__name__}:{object!r}".encode())
+
+    @staticmethod
+    def _is_layout_pragma(swan_obj: Any) -> bool:
+        if not isinstance(swan_obj, swan.Pragma):
+            return False
+        # the key of a pragma created from its text can hold the whole text
+        words = str(swan_obj.key).split()
+        if words and words[0] == "#pragma":
+            words = words[1:]
+        return bool(words) and words[0] == swan.PragmaKey.DIAGRAM.value
+
+    def visit_Pragma(
+        self, swan_obj: swan.Pragma, owner: Owner, owner_property: OwnerProperty
+    ) -> None:
+        if self._ignore_layout and self._is_layout_pragma(swan_obj):
+            return
+        self._update(owner_property, str(swan_obj).encode())
+
+
+def structural_hash(swan_obj: swan.SwanItem, ignore_layout: bool = False) -> int:
+    """Return the structural hash of a Swan object.
+
+    Parameters
+    ----------
+    swan_obj : SwanItem
+        Swan object.
+    ignore_layout : bool, optional
+        When True, the diagram pragmas and the luids are ignored.
+
+    Returns
+    -------
+    int
+        Structural hash.
+    """
+    return StructuralHasher(ignore_layout).hash(swan_obj)
+
+
+class _StateHasher(StructuralHasher):
+    """Structural hasher of the state of a module and of its items, to detect the
+    modifications made without :py:meth:`SwanItem.set_modified`.
+
+    The cached hashes are neither used nor updated, as they are not invalidated by
+    such modifications. The operator and harness bodies are loaded lazily: they are
+    hashed separately, when they are loaded (see :py:func:`body_state_hash`).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # hash of each visited module item, by id
+        self.item_hashes: Dict[int, int] = {}
+
+    def _get_digest(
+        self, swan_obj: swan.SwanItem, owner: Owner, owner_property: OwnerProperty
+    ) -> bytes:
+        self._frames.append(blake2b(type(swan_obj).__name__.encode(), digest_size=_DIGEST_SIZE))
+        super(StructuralHasher, self)._visit(swan_obj, owner, owner_property)
+        digest = self._frames.pop().digest()
+        if isinstance(swan_obj, swan.ModuleItem):
+            self.item_hashes[id(swan_obj)] = int.from_bytes(digest, "big")
+        return digest
+
+    def visit_OperatorDefinition(
+        self, swan_obj: swan.OperatorDefinition, owner: Owner, owner_property: OwnerProperty
+    ) -> None:
+        self.visit_OperatorDeclarationDefinitionBase(swan_obj, owner, owner_property)
+
+    def visit_TestHarness(
+        self, swan_obj: swan.TestHarness, owner: Owner, owner_property: OwnerProperty
+    ) -> None:
+        self.visit_Declaration(swan_obj, owner, owner_property)
+        self.visit_ModuleItem(swan_obj, owner, owner_property)
+
+
+# recorded hash of a body which was not loaded when the module state was recorded:
+# the body hash is recorded when the body is loaded
+BODY_NOT_LOADED = -1
+
+
+def body_state_hash(body: Optional[swan.SwanItem]) -> Optional[int]:
+    """Return the hash of an operator or harness body, without using the cached hashes.
+
+    Parameters
+    ----------
+    body : Optional[SwanItem]
+        Body, or None.
+
+    Returns
+    -------
+    Optional[int]
+        Hash of the body, None if there is no body.
+    """
+    return None if body is None else _StateHasher().hash(body)
+
+
+def _has_lazy_body(item: swan.ModuleItem) -> bool:
+    return isinstance(item, (swan.OperatorDefinition, swan.TestHarness))
+
+
+def record_module_state(module: swan.Module) -> None:
+    """Record the state of a module and of its items, to detect the modifications
+    made later without :py:meth:`SwanItem.set_modified`.
+
+    The modules are not tracked by default, as the creators and the setters call
+    :py:meth:`SwanItem.set_modified`. Once the state of a module is recorded,
+    :py:meth:`ansys.scadeone.core.project.Project.save` compares the module with it
+    (see :py:func:`detect_modifications`) and records it again when the module is saved.
+    The bodies which are not loaded yet are hashed when they are loaded.
+
+    Parameters
+    ----------
+    module : Module
+        Loaded module.
+    """
+    hasher = _StateHasher()
+    module._state_hash = hasher.hash(module)
+    for item in module.use_directives + module.declarations:
+        item._state_hash = hasher.item_hashes.get(id(item))
+        if _has_lazy_body(item):
+            item._body_state_hash = (
+                BODY_NOT_LOADED if callable(item._body) else body_state_hash(item._body)
+            )
+
+
+def refresh_module_state(module: swan.Module) -> None:
+    """Record again the state of a module whose state is recorded, after it is saved.
+
+    Parameters
+    ----------
+    module : Module
+        Saved module.
+    """
+    if module._state_hash is not None:
+        record_module_state(module)
+
+
+def find_modifications(module: swan.Module) -> Tuple[bool, List[swan.ModuleItem]]:
+    """Compare a module and its items with their recorded state, without changing them.
+
+    The structural hashes are computed without using the cached hashes.
+
+    Parameters
+    ----------
+    module : Module
+        Module to check.
+
+    Returns
+    -------
+    Tuple[bool, List[ModuleItem]]
+        True if the module differs from its recorded state, and the items which
+        differ from their recorded state or are new. (False, []) if the state of the
+        module is not recorded (see :py:func:`record_module_state`).
+    """
+    if module._state_hash is None:
+        return False, []
+    hasher = _StateHasher()
+    module_modified = hasher.hash(module) != module._state_hash
+    items = []
+    for item in module.use_directives + module.declarations:
+        item_modified = (
+            item._state_hash is None or hasher.item_hashes.get(id(item)) != item._state_hash
+        )
+        if not item_modified and _has_lazy_body(item) and not callable(item._body):
+            item_modified = body_state_hash(item._body) != item._body_state_hash
+        if item_modified:
+            items.append(item)
+    return module_modified, items
+
+
+def detect_modifications(module: swan.Module) -> bool:
+    """Detect the modifications of a module and of its items since their state was
+    recorded, including the ones made without :py:meth:`SwanItem.set_modified`.
+
+    The modified items and the module are marked as modified (see
+    :py:meth:`SwanItem.set_modified`). If the state of the module is not recorded
+    (see :py:func:`record_module_state`), nothing is computed.
+
+    Parameters
+    ----------
+    module : Module
+        Module to check.
+
+    Returns
+    -------
+    bool
+        True if the module is new or modified.
+    """
+    module_modified, items = find_modifications(module)
+    for item in items:
+        item.set_modified()
+    if module_modified or items:
+        module.set_modified()
+    return module.is_modified
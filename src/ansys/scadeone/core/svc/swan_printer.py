@@ -24,14 +24,22 @@
 # pyright: reportUnusedExpression=false
 
 from io import IOBase, StringIO
-from typing import Any, List, Optional, Union, cast
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union, cast
 from enum import Flag, auto
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+from pathlib import Path
+import pickle
+import time
 
 import ansys.scadeone.core.svc.common.renderer as R
 from ansys.scadeone.core.svc.swan_visitor import SwanVisitor, Owner, OwnerProperty
 import ansys.scadeone.core.swan as Swan
+from ansys.scadeone.core.common.exception import ScadeOneException
 from ansys.scadeone.core.common.versioning import gen_swan_version
+from ansys.scadeone.core.svc.swan_hash import find_modifications
 
 PrintData = dict[str, Optional[Union[R.DElt, List[R.DElt], Flag]]]
 
@@ -71,14 +79,27 @@ class PPrinter(SwanVisitor):
     normalize : bool, optional
         Write all the same Swan declarations or each declaration on one line,
         by default True i.e. each Swan declaration per line
+    streaming : bool, optional
+        When printing a module, render each use directive and declaration as soon as
+        it is visited, instead of building the document of the whole module,
+        by default False. The output is the same.
+    keep_source : bool, optional
+        When printing a module loaded from a Swan code, copy the code of the use directives
+        and declarations which are not modified and the code between them,
+        by default False. Only the new and modified items are rendered. The code written
+        with another version of Swan is not copied.
     """
 
     __own_property = "visitor"
 
-    def __init__(self, normalize=True) -> None:
+    def __init__(self, normalize=True, streaming=False, keep_source=False) -> None:
         super().__init__()
         self._normalize = normalize
+        self._streaming = streaming
+        self._keep_source = keep_source
         self._doc_data_stack: deque[PrintData] = deque()
+        # renderer of the current print, when streaming
+        self._renderer: Optional[R.Renderer] = None
 
     # Push/Pop doc data stack methods
     # the self._doc_data_stack is used to manage the current doc data, that is to say
@@ -191,19 +212,30 @@ class PPrinter(SwanVisitor):
         if not swan_obj:
             stream.write("None")
             return
-        # Our own print
-        self._doc_data_stack.clear()
-        _p_data = self._push_and_get_doc_data({self.__own_property: None})
-        # Visit Swan object to build document
-        self.visit(swan_obj)
-        # Write visited Swan code
-        doc = R.Document()
-        doc << _p_data[self.__own_property]
         if render is None:
-            render = R.Renderer(stream)
+            render = R.Renderer(stream, fast=True)
         else:
             render.set_stream(stream)
-        render.render(doc)
+        # Our own print
+        self._doc_data_stack.clear()
+        _p_data = self._push_and_get_doc_data({self.__own_property: None})
+        if self._streaming:
+            self._renderer = render
+        try:
+            # Visit Swan object to build document
+            self.visit(swan_obj)
+        finally:
+            self._renderer = None
+        # Write visited Swan code, if not already streamed
+        if _p_data[self.__own_property] is not None:
+            self._render(render, cast(R.DElt, _p_data[self.__own_property]))
+
+    @staticmethod
+    def _render(render: R.Renderer, doc: R.DElt) -> None:
+        """Render a document element."""
+        _doc = R.Document()
+        _doc << doc
+        render.render(_doc)
 
     def _decl_formatting(self, pprint_data: PrintData, key: str, prefix: str):
         """
@@ -3457,31 +3489,112 @@ class PPrinter(SwanVisitor):
         """
 
         _p_data = self._push_and_get_doc_data({"use_directives": [], "declarations": None})
+        # When streaming the printed module, each document is rendered once built
+        # and is not kept.
+        render = self._renderer if owner is self else None
+
+        def _add(doc: R.DElt) -> None:
+            if render:
+                self._render(render, doc)
+            else:
+                _doc << doc
 
         # Visit properties
         _doc = R.DBlock()
-        _doc << R.DText(gen_swan_version(isinstance(swan_obj, Swan.TestModule))) << "@n"
+        _add(R.DText(gen_swan_version(isinstance(swan_obj, Swan.TestModule))))
+        _add(R.DLineBreak())
+        if owner is self and (kept_items := self._get_kept_items(swan_obj)) is not None:
+            self._visit_module_items_with_source(swan_obj, kept_items, _add)
+            self._pop_and_set_doc_data(owner_property, None if render else _doc)
+            return
+        for idx, item in enumerate(swan_obj.use_directives):
+            self._visit(item, swan_obj, "use_directives")
+            if idx > 0:
+                _add(R.DLineBreak(False))
+            _add(cast(List[R.DElt], _p_data["use_directives"]).pop())
         if swan_obj.use_directives:
-            for item in swan_obj.use_directives:
-                self._visit(item, swan_obj, "use_directives")
-
-            if _p_data["use_directives"]:
-                _doc << R.doc_list(
-                    *cast(List[R.DElt], _p_data["use_directives"]), sep=R.DLineBreak(False)
-                )
-                _doc << R.DLineBreak(False)
-        if swan_obj.declarations:
-            _dcl = []
-            for item in swan_obj.declarations:
-                self._visit(item, swan_obj, "declarations")
-                _dcl.append(_p_data["declarations"])
-            if _dcl:
-                _doc << R.doc_list(*_dcl, sep=R.DLineBreak(False))
+            _add(R.DLineBreak(False))
+        for idx, item in enumerate(swan_obj.declarations):
+            self._visit(item, swan_obj, "declarations")
+            if idx > 0:
+                _add(R.DLineBreak(False))
+            _add(cast(R.DElt, _p_data["declarations"]))
+            _p_data["declarations"] = None
         self.visit_HasPragma(swan_obj, owner, owner_property)
         if _p_data["pragmas"]:
-            _doc << "@n" << _p_data["pragmas"] << "@n"
+            _add(R.DLineBreak())
+            _add(cast(R.DElt, _p_data["pragmas"]))
+            _add(R.DLineBreak())
         # Update property
-        self._pop_and_set_doc_data(owner_property, _doc)
+        self._pop_and_set_doc_data(owner_property, None if render else _doc)
+
+    def _get_kept_items(self, swan_obj: Swan.Module) -> Optional[Set[int]]:
+        """Return the ids of the module items whose source is copied, or None if the
+        module source is not kept.
+
+        The source of the module pragmas and of the protected declarations is not known,
+        and the source written with another version is not copied under the current
+        version line. The items modified without set_modified() are detected by their
+        structural hash if the state of the module is recorded, without marking them
+        as modified (see swan_hash.find_modifications())."""
+        if not (
+            self._keep_source
+            and swan_obj.has_source_spans
+            and not swan_obj.pragmas
+            and swan_obj.source_version == gen_swan_version(isinstance(swan_obj, Swan.TestModule))
+        ):
+            return None
+        items = swan_obj.use_directives + swan_obj.declarations
+        if not all(item.source_span or item.is_modified for item in items):
+            return None
+        directly_modified = {id(item) for item in find_modifications(swan_obj)[1]}
+        return {
+            id(item) for item in items if not item.is_modified and id(item) not in directly_modified
+        }
+
+    @staticmethod
+    def _text_doc(text: str) -> R.DElt:
+        """Document of a text which can contain newlines."""
+        lines = text.split("\n")
+        return R.doc_list(*[R.DText(line) for line in lines], sep=R.DLineBreak(False))
+
+    def _visit_module_items_with_source(
+        self, swan_obj: Swan.Module, kept_items: Set[int], add: Callable
+    ) -> None:
+        """Visit the use directives and declarations of a module, copying the source
+        of the unmodified ones.
+
+        Parameters
+        ----------
+        swan_obj : Swan.Module
+            Module with a source text.
+        kept_items : Set[int]
+            Ids of the items whose source is copied.
+        add : Callable
+            Function adding a document to the module document.
+        """
+        _p_data = self._get_current_doc_data()
+        source = cast(str, swan_obj.source_text)
+        for item in swan_obj.use_directives + swan_obj.declarations:
+            if span := item.source_span:
+                add(self._text_doc(swan_obj.source_text_before(item)))
+                if id(item) in kept_items:
+                    add(self._text_doc(source[span[0] : span[1]]))
+                    continue
+            else:
+                add(self._text_doc("\n\n"))
+            if isinstance(item, Swan.UseDirective):
+                self._visit(item, swan_obj, "use_directives")
+                _item_doc = cast(List[R.DElt], _p_data["use_directives"]).pop()
+            else:
+                self._visit(item, swan_obj, "declarations")
+                _item_doc = cast(R.DElt, _p_data["declarations"])
+                _p_data["declarations"] = None
+            # the code between items gives the newlines
+            _text = StringIO()
+            self._render(R.Renderer(_text, fast=True), _item_doc)
+            add(self._text_doc(_text.getvalue().rstrip("\n")))
+        add(self._text_doc(swan_obj.source_text_after()))
 
     def visit_ModuleBody(
         self,
@@ -6267,7 +6380,9 @@ class PPrinter(SwanVisitor):
         self.visit_DiagramObject(swan_obj, owner, owner_property)
 
 
-def swan_to_str(swan_obj: Union[Swan.SwanItem, None], normalize: bool = False) -> str:
+def swan_to_str(
+    swan_obj: Union[Swan.SwanItem, None], normalize: bool = False, cache: bool = False
+) -> str:
     """
     Convert a Swan object to string.
 
@@ -6278,6 +6393,11 @@ def swan_to_str(swan_obj: Union[Swan.SwanItem, None], normalize: bool = False) -
     normalize : bool, optional
         Write each Swan declaration or all the same declarations on one line,
         by default False i.e. each Swan declaration per line.
+    cache : bool, optional
+        If True, the string is memoized in the Swan object, and a memoized string
+        is returned if there is one, by default False. The memoized strings are
+        invalidated by :py:meth:`SwanItem.set_modified` on the object or on one of
+        its descendants, as done by the creation methods.
 
     Returns
     -------
@@ -6288,10 +6408,116 @@ def swan_to_str(swan_obj: Union[Swan.SwanItem, None], normalize: bool = False) -
         return ""
     if isinstance(swan_obj, Swan.Pragma):
         return str(swan_obj)
+    if cache:
+        forms = getattr(swan_obj, "_printed_forms", None)
+        if forms is not None and normalize in forms:
+            return forms[normalize]
     # use PPPrinter
     buffer = StringIO()
     printer = PPrinter(normalize=normalize)
     printer.print(buffer, swan_obj)
     res = buffer.getvalue()
     buffer.close()
+    if cache:
+        if forms is None:
+            forms = swan_obj._printed_forms = {}
+        forms[normalize] = res
     return res
+
+
+def _module_to_file(module: Swan.Module, path: str, normalize: bool, keep_source: bool) -> float:
+    """Print a module to a temporary file which then replaces the *path* file.
+    Return the duration in seconds."""
+    start = time.perf_counter()
+    module_src = Path(path)
+    tmp_src = module_src.with_name(f".{module_src.name}.tmp")
+    try:
+        module_src.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_src.open("w", newline="") as fd:
+            PPrinter(normalize=normalize, streaming=True, keep_source=keep_source).print(fd, module)
+        os.replace(tmp_src, module_src)
+    except BaseException:
+        tmp_src.unlink(missing_ok=True)
+        raise
+    return time.perf_counter() - start
+
+
+def _pickled_module_to_file(data: bytes, path: str, normalize: bool, keep_source: bool) -> float:
+    """Worker function of :py:func:`swan_to_files`."""
+    return _module_to_file(pickle.loads(data), path, normalize, keep_source)
+
+
+def swan_to_files(
+    modules: Iterable[Swan.Module],
+    workers: int = 1,
+    normalize: bool = False,
+    keep_source: bool = False,
+) -> Dict[str, float]:
+    """
+    Print modules to their source files.
+
+    Each module is written to a temporary file which then replaces its source file.
+    With several workers, the modules are printed in a pool of processes. The printed
+    files do not depend on the number of workers.
+
+    The modules are sent to the processes with :py:mod:`pickle`, so the program using
+    several workers must be importable (see the *spawn* start method of :py:mod:`multiprocessing`).
+
+    Parameters
+    ----------
+    modules : Iterable[Swan.Module]
+        Modules to print. Their *source* gives the file path.
+    workers : int, optional
+        Number of processes, by default 1: the modules are printed by the current process.
+    normalize : bool, optional
+        Write each Swan declaration or all the same declarations on one line,
+        by default False i.e. each Swan declaration per line.
+    keep_source : bool, optional
+        Copy the source code of the unmodified items of the modules, see :py:class:`PPrinter`,
+        by default False.
+
+    Returns
+    -------
+    Dict[str, float]
+        Duration in seconds of the printing of each module, by source file, in the
+        order of *modules*.
+
+    Raises
+    ------
+    ScadeOneException
+        When a module has no source or cannot be printed.
+    """
+    modules = list(modules)
+    for module in modules:
+        if not module.source:
+            raise ScadeOneException(f"Module {module.name.as_string} has no source to save.")
+    timings = {}
+    if workers <= 1 or len(modules) <= 1:
+        for module in modules:
+            try:
+                timings[module.source] = _module_to_file(
+                    module, module.source, normalize, keep_source
+                )
+            except Exception as e:
+                raise ScadeOneException(f"Failed to save module {module.name.as_string}: {e}")
+        return timings
+
+    # spawn: the DOTNET runtime of the current process is not forked
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(modules)), mp_context=context) as pool:
+        futures = [
+            pool.submit(
+                _pickled_module_to_file,
+                pickle.dumps(module, protocol=pickle.HIGHEST_PROTOCOL),
+                module.source,
+                normalize,
+                keep_source,
+            )
+            for module in modules
+        ]
+        for module, future in zip(modules, futures):
+            try:
+                timings[module.source] = future.result()
+            except Exception as e:
+                raise ScadeOneException(f"Failed to save module {module.name.as_string}: {e}")
+    return timings
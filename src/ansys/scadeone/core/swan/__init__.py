@@ -20,7 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Union
+from typing import TYPE_CHECKING, Dict, Iterable, Union
+
+from ansys.scadeone.core.interfaces import IModel
 
 from .common import *
 from .diagram import *
@@ -39,11 +41,44 @@ from .variable import *
 from .harness import *
 from .pragmas import *
 
+if TYPE_CHECKING:
+    from ansys.scadeone.core.svc.swan_diff import ModelDiff
+
 
-def swan_to_str(swan: Union[SwanItem, None], normalize: bool = False) -> str:  # noqa: F405
+def swan_to_str(
+    swan: Union[SwanItem, None],  # noqa: F405
+    normalize: bool = False,
+    cache: bool = False,
+) -> str:
     """Convert a SwanItem to a string.
     When normalize is True, the output is normalized to a canonical form.
+    When cache is True, the string is memoized in the SwanItem, see
+    :py:func:`ansys.scadeone.core.svc.swan_printer.swan_to_str`.
     """
     import ansys.scadeone.core.svc.swan_printer as swan_printer
 
-    return swan_printer.swan_to_str(swan, normalize)
+    return swan_printer.swan_to_str(swan, normalize, cache)
+
+
+def swan_to_files(
+    modules: Iterable[Module],  # noqa: F405
+    workers: int = 1,
+    normalize: bool = False,
+) -> Dict[str, float]:
+    """Print modules to their source files, possibly in a pool of *workers* processes.
+
+    See :py:func:`ansys.scadeone.core.svc.swan_printer.swan_to_files`.
+    """
+    import ansys.scadeone.core.svc.swan_printer as swan_printer
+
+    return swan_printer.swan_to_files(modules, workers, normalize)
+
+
+def diff(model_a: IModel, model_b: IModel, ignore_layout: bool = True) -> "ModelDiff":
+    """Compare two models and return the changes from *model_a* to *model_b*.
+
+    See :py:func:`ansys.scadeone.core.svc.swan_diff.diff`.
+    """
+    import ansys.scadeone.core.svc.swan_diff as swan_diff
+
+    return swan_diff.diff(model_a, model_b, ignore_layout)
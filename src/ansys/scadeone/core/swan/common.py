@@ -45,6 +45,8 @@ class SwanItem(ABC):  # numpydoc ignore=PR01
 
     def __init__(self) -> None:
         self._owner = None
+        self._structural_hashes = None
+        self._printed_forms = None
         super().__init__()
 
     @property
@@ -56,6 +58,8 @@ class SwanItem(ABC):  # numpydoc ignore=PR01
     def owner(self, owner: Owner) -> None:  # numpydoc ignore=PR01
         """Set the owner of the Swan construct."""
         self._owner = owner
+        # the printed form may depend on the owner
+        self._printed_forms = None
 
     @staticmethod
     def set_owner(owner: Owner, children: Union["SwanItem", Iterable["SwanItem"], None]) -> None:
@@ -95,6 +99,62 @@ class SwanItem(ABC):  # numpydoc ignore=PR01
     def __str__(self) -> str:
         raise Exception(f"__str__ not implemented for {type(self)}")
 
+    def structural_hash(self, ignore_layout: bool = False) -> int:
+        """Structural hash of the Swan construct.
+
+        The hash is computed bottom-up from the construct kind, its values and the
+        hashes of its children. Equal constructs have equal hashes, whatever their
+        owner. The hashes are cached, a modification of the construct must be followed
+        by a call to :py:meth:`set_modified` or :py:meth:`invalidate_structural_hash`,
+        which the creators do.
+
+        Parameters
+        ----------
+        ignore_layout : bool, optional
+            When True, the diagram pragmas and the luids are ignored.
+
+        Returns
+        -------
+        int
+            Structural hash.
+        """
+        from ansys.scadeone.core.svc.swan_hash import structural_hash
+
+        return structural_hash(self, ignore_layout)
+
+    def invalidate_structural_hash(self) -> None:
+        """Invalidate the cached structural hashes and printed forms of the construct
+        and of its owners.
+
+        This method must be called when the construct is modified.
+        """
+        item = self
+        while isinstance(item, SwanItem):
+            item._structural_hashes = None
+            item._printed_forms = None
+            item = item.owner
+
+    def set_modified(self) -> None:
+        """Record a modification of the construct.
+
+        The cached structural hashes and printed forms of the construct and of its owners
+        are invalidated, and the module item and the module containing the construct are marked as
+        modified, so that they are written by :py:meth:`ansys.scadeone.core.project.Project.save`.
+
+        The creators and the setters call this method. A construct modified directly must
+        call it to be saved, unless the state of its module was recorded by
+        :py:func:`ansys.scadeone.core.svc.swan_hash.record_module_state` before the
+        modification. In any case, the cached structural hashes and printed forms of the
+        construct are not valid until this method is called.
+        """
+        item = self
+        while isinstance(item, SwanItem):
+            item._structural_hashes = None
+            item._printed_forms = None
+            if isinstance(item, (ModuleItem, ModuleBase)):
+                item.is_modified = True
+            item = item.owner
+
     @property
     def is_protected(self) -> bool:
         """Tell if a construct item is syntactically protected with some markup
@@ -234,6 +294,19 @@ class ModuleBase(HasPragma):  # numpydoc ignore=PR01
 
     def __init__(self, pragmas: Optional[List[Pragma]] = None) -> None:
         super().__init__(pragmas)
+        self._is_modified = True
+        # recorded structural hash, see swan_hash.record_module_state()
+        self._state_hash = None
+
+    @property
+    def is_modified(self) -> bool:
+        """True when the module has been created or modified since it was loaded or saved."""
+        return self._is_modified
+
+    @is_modified.setter
+    def is_modified(self, value: bool) -> None:  # numpydoc ignore=PR01
+        """Set the modification status of the module."""
+        self._is_modified = value
 
     def get_use_directive(self, module_name: str) -> Optional["UseDirective"]:  # noqa: F821 # type: ignore
         assert False
@@ -802,6 +875,31 @@ class ModuleItem(SwanItem):  # numpydoc ignore=PR01
 
     def __init__(self) -> None:
         super().__init__()
+        self._source_span = None
+        self._is_modified = True
+        # recorded structural hash, see swan_hash.record_module_state()
+        self._state_hash = None
+
+    @property
+    def source_span(self) -> Optional[Tuple[int, int]]:
+        """Start and end offsets of the item in the Swan code it was loaded from,
+        after the version line, or None for a new item."""
+        return self._source_span
+
+    @source_span.setter
+    def source_span(self, span: Optional[Tuple[int, int]]) -> None:  # numpydoc ignore=PR01
+        """Set the source offsets of the item."""
+        self._source_span = span
+
+    @property
+    def is_modified(self) -> bool:
+        """True when the item has been created or modified since it was loaded."""
+        return self._is_modified
+
+    @is_modified.setter
+    def is_modified(self, value: bool) -> None:  # numpydoc ignore=PR01
+        """Set the modification status of the item."""
+        self._is_modified = value
 
 
 class Declaration(HasPragma):  # numpydoc ignore=PR01
@@ -22,7 +22,7 @@
 
 # pylint: too-many-arguments
 
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from enum import Enum, auto
 from typing import List, Optional, Union, cast
 
@@ -124,6 +124,9 @@ class Diagram(scopes.ScopeSection, DiagramCreator):  # numpydoc ignore=PR01
             self._objects = objects
         self._luid = luid
         self._diag_nav = None
+        # Creator data: next lunum and wires indexed by source (lunum, adaptation)
+        self._next_lunum = None
+        self._wires_by_source = None
         common.SwanItem.set_owner(self, objects)
 
     @property
@@ -608,10 +611,23 @@ class ActivateWhenBlock(DefByCaseBlockBase):  # numpydoc ignore=PR01
 # Diagram navigation
 # ------------------------------------------------------------
 
+#: Edge of the diagram adjacency structure: a connection of *wire* from the
+#: *source* lunum to the *target* lunum, with the source and target adaptations.
+DiagramEdge = namedtuple(
+    "DiagramEdge", ["wire", "source", "source_adaptation", "target", "target_adaptation"]
+)
+
 
 class DiagramNavigation:
     """Class handling navigation through Diagram objects.
 
+    The navigation maintains an adjacency structure of the diagram: for each lunum,
+    a list of forward edges (connections from the block) and a list of reverse edges
+    (connections to the block). The structure is built once by :py:meth:`consolidate`
+    and is then updated incrementally by :py:meth:`add_object` and
+    :py:meth:`add_wire_targets` when the diagram is edited. Source and target queries
+    are proportional to the number of connections of the block.
+
     Parameters
     ----------
     diagram: Diagram
@@ -622,6 +638,8 @@ class DiagramNavigation:
         self._block_table = {}
         self._wires_of_target = defaultdict(list)
         self._wires_of_source = defaultdict(list)
+        self._forward_edges = defaultdict(list)
+        self._reverse_edges = defaultdict(list)
         self._diagram = diagram
 
     def get_block(self, lunum: common.Lunum) -> DiagramObject:
@@ -636,6 +654,14 @@ class DiagramNavigation:
         """Returning list of wires that have a specific target."""
         return self._wires_of_target[lunum.value]
 
+    def forward_edges(self, lunum: common.Lunum) -> List[DiagramEdge]:
+        """Returning list of edges whose source is a specific lunum."""
+        return self._forward_edges.get(lunum.value, [])
+
+    def reverse_edges(self, lunum: common.Lunum) -> List[DiagramEdge]:
+        """Returning list of edges whose target is a specific lunum."""
+        return self._reverse_edges.get(lunum.value, [])
+
     def get_wire_source(
         self, wire: Wire
     ) -> tuple[
@@ -669,68 +695,25 @@ class DiagramNavigation:
     ) -> List[tuple[DiagramObject, GroupAdaptation, Union[List[GroupAdaptation], None]]]:
         """A block sources list of a Diagram Object."""
         if len(obj.locals) != 0:
-            locals = [local.lunum for local in obj.locals]
-            target_wires = []
-            for lunum in locals:
-                target_wires.extend(self.with_target(lunum))
+            lunums = [local.lunum for local in obj.locals]
         else:
-            target_wires = self.with_target(obj.lunum)
-        sources = [self.get_wire_source(wire) for wire in target_wires]
-        return self._filter_sources(obj, sources)
-
-    def _filter_sources(
-        self,
-        obj: DiagramObject,
-        sources: List[
-            tuple[
-                DiagramObject,
-                GroupAdaptation,
-                Optional[tuple[DiagramObject, GroupAdaptation]],
-            ]
-        ],
-    ) -> List[tuple[DiagramObject, GroupAdaptation, Union[List[GroupAdaptation], None]]]:
-        """Filter sources (object, adaptation) of a given diagram object."""
+            lunums = [obj.lunum]
+        # A local object is connected through its owner block: no target adaptation
+        is_local = isinstance(obj.owner, DiagramObject)
+        # (source object, source adaptation) -> ordered set of target adaptations
         sources_dict = {}
-        for source in sources:
-            target_obj_adps = self._filter_target_blocks(source[2], obj)
-            for target_obj_adp in target_obj_adps:
-                # Stock a source (object, adaptation) and the corresponding target adaptations
-                source_obj_adp = (source[0], source[1])
-                if not sources_dict.get(source_obj_adp):
-                    sources_dict[source_obj_adp] = {}
-                    if target_obj_adp[1]:
-                        sources_dict[source_obj_adp] = {target_obj_adp[1]}
-                elif target_obj_adp[1]:
-                    sources_dict[source_obj_adp].add(target_obj_adp[1])
-        obj_sources = []
-        # Convert the (source, target adaptations) dictionary
-        # to a list of tuples: (source_block, source_adaptation, targets)
-        for source_obj_adp, target_adps in sources_dict.items():
-            obj_sources.append(
-                (
-                    source_obj_adp[0],
-                    source_obj_adp[1],
-                    list(target_adps) if target_adps else None,
-                )
-            )
-        return obj_sources
-
-    @staticmethod
-    def _filter_target_blocks(
-        target_obj_adps: Optional[List[tuple[DiagramObject, GroupAdaptation]]], obj
-    ) -> List[tuple[DiagramObject, GroupAdaptation]]:
-        """Filter target objects and adaptations of a given diagram object."""
-        if not target_obj_adps:
-            return []
-        filtered_target_obj_adps = []
-        for target_obj_adp in target_obj_adps:
-            if target_obj_adp[0].locals:
-                for local in target_obj_adp[0].locals:
-                    if local.lunum == obj.lunum:
-                        filtered_target_obj_adps.append((local, None))
-            if target_obj_adp[0].lunum == obj.lunum:
-                filtered_target_obj_adps.append(target_obj_adp)
-        return filtered_target_obj_adps
+        for lunum in lunums:
+            if lunum is None:
+                continue
+            for edge in self._reverse_edges.get(lunum.value, ()):
+                source_obj_adp = (self._block_table[edge.source], edge.source_adaptation)
+                target_adps = sources_dict.setdefault(source_obj_adp, {})
+                if edge.target_adaptation and not is_local:
+                    target_adps[edge.target_adaptation] = None
+        return [
+            (source_obj, source_adp, list(target_adps) if target_adps else None)
+            for (source_obj, source_adp), target_adps in sources_dict.items()
+        ]
 
     def get_block_targets(
         self, obj: DiagramObject
@@ -743,40 +726,74 @@ class DiagramNavigation:
             raise ScadeOneException(
                 "Cannot get targets of a block without a locally unique number (LUNUM)"
             )
-        targets = []
-        for wire in self.with_source(lunum):
-            targets.extend(self.get_wire_targets(wire))
-        return targets
+        return [
+            (self._block_table[edge.target], edge.source_adaptation, edge.target_adaptation)
+            for edge in self._forward_edges.get(lunum.value, ())
+        ]
 
     def consolidate(self) -> None:
         """Retrieve wire sources, wire targets and blocks from the Diagram Object."""
+        self._block_table.clear()
+        self._wires_of_target.clear()
+        self._wires_of_source.clear()
+        self._forward_edges.clear()
+        self._reverse_edges.clear()
+        for obj in self._diagram.objects:
+            self.add_object(obj)
 
-        def explore_object(obj: DiagramObject) -> None:
-            if isinstance(obj, (SectionObject, DefByCaseBlockBase)):
-                return
-            if isinstance(obj, Wire):
-                # process targets
-                # _wire_of_target: table which stores wires from
-                # target block found in wire
-                wire = cast(Wire, obj)
-                for target in wire.targets:
-                    if not target.is_connected:
-                        continue
-                    if target.port.is_self:
-                        continue
-                    self._wires_of_target[target.port.lunum.value].append(wire)
-                # process source
-                # _wire_of_source: table which stores wires from
-                # source block found in wire
-                if wire.source.is_connected and not wire.source.port.is_self:
-                    self._wires_of_source[wire.source.port.lunum.value].append(wire)
-            else:
-                lunum = obj.lunum
-                if lunum is None:
-                    return
-                self._block_table[lunum.value] = obj
-                for local in obj.locals:
-                    self._block_table[local.lunum.value] = obj
+    def add_object(self, obj: DiagramObject) -> None:
+        """Register a block or a wire added to the diagram.
 
-        for obj in self._diagram.objects:
-            explore_object(obj)
+        Parameters
+        ----------
+        obj: DiagramObject
+            Added diagram object.
+        """
+        if isinstance(obj, (SectionObject, DefByCaseBlockBase)):
+            return
+        if isinstance(obj, Wire):
+            wire = cast(Wire, obj)
+            # _wire_of_source: table which stores wires from
+            # source block found in wire
+            if wire.source.is_connected and not wire.source.port.is_self:
+                self._wires_of_source[wire.source.port.lunum.value].append(wire)
+            self.add_wire_targets(wire, wire.targets)
+            return
+        lunum = obj.lunum
+        if lunum is None:
+            return
+        self._block_table[lunum.value] = obj
+        for local in obj.locals:
+            self._block_table[local.lunum.value] = obj
+
+    def add_wire_targets(self, wire: Wire, targets: List[Connection]) -> None:
+        """Register new targets of a wire of the diagram.
+
+        Parameters
+        ----------
+        wire: Wire
+            Wire of the diagram.
+        targets: List[Connection]
+            Targets of the wire to register.
+        """
+        source = wire.source
+        if source.is_connected and not source.port.is_self:
+            source_lunum = source.port.lunum.value
+        else:
+            source_lunum = None
+        for target in targets:
+            if not target.is_connected:
+                continue
+            if target.port.is_self:
+                continue
+            target_lunum = target.port.lunum.value
+            # _wire_of_target: table which stores wires from
+            # target block found in wire
+            self._wires_of_target[target_lunum].append(wire)
+            if source_lunum is None:
+                continue
+            edge = DiagramEdge(
+                wire, source_lunum, source.adaptation, target_lunum, target.adaptation
+            )
+            self._forward_edges[source_lunum].append(edge)
+            self._reverse_edges[target_lunum].append(edge)
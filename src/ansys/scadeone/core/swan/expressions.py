@@ -639,7 +639,15 @@ class GroupRenaming(GroupRenamingBase):  # numpydoc ignore=PR01
 
     def __hash__(self) -> int:
         """Hash function for GroupRenaming."""
-        return hash((self.source, self.renaming, self.is_shortcut))
+        # consistent with __eq__: sources and renamings are compared by value
+        return hash(
+            (
+                self.is_by_name,
+                self.source.value,
+                self.renaming.value if self.renaming else None,
+                self.is_shortcut,
+            )
+        )
 
 
 class ProtectedGroupRenaming(GroupRenamingBase, common.ProtectedItem):  # numpydoc ignore=PR01
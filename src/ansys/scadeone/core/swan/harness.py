@@ -120,6 +120,8 @@ class TestHarness(
     ) -> None:
         common.Declaration.__init__(self, id, pragmas)
         self._body = body
+        # recorded structural hash of the body, see swan_hash.record_module_state()
+        self._body_state_hash = None
         self._inputs = [VarDecl(common.Identifier("_current_cycle"), type=Uint64Type())]
         self._outputs = [VarDecl(common.Identifier("_stop_condition"), type=BoolType())]
 
@@ -130,8 +132,18 @@ class TestHarness(
             body = self._body(self)
             self._body = body
             self.set_owner(self, self._body)
+            if self._body_state_hash is not None:
+                # the state of the module is recorded, see swan_hash.record_module_state()
+                from ansys.scadeone.core.svc.swan_hash import body_state_hash
+
+                self._body_state_hash = body_state_hash(body)
         return self._body
 
+    def __getstate__(self) -> dict:
+        # The lazy body refers to the parser data, it is loaded to be pickled
+        self.body
+        return self.__dict__
+
 
 class TestModule(Module, TestModuleCreator):  # numpydoc ignore=PR01
     """Test module definition."""
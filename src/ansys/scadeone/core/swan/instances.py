@@ -56,6 +56,7 @@ class OperatorInstance(common.SwanItem, ABC):  # numpydoc ignore=PR01  # numpydo
     @is_text.setter
     def is_text(self, is_text: bool) -> None:
         self._is_text = is_text
+        self.set_modified()
 
 
 class NamedInstance(OperatorInstance):  # numpydoc ignore=PR01
@@ -134,6 +135,7 @@ class OperatorExpression(common.SwanItem, ABC):  # numpydoc ignore=PR01
     @is_op_expr.setter
     def is_op_expr(self, is_op_expr: bool) -> None:
         self._is_op_expr = is_op_expr
+        self.set_modified()
 
 
 class OperatorExpressionInstance(OperatorInstance):  # numpydoc ignore=PR01
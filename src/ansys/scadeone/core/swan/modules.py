@@ -24,6 +24,7 @@
 This module contains classes for package and interface.
 """
 
+import bisect
 from typing import List, Optional, Union, cast, Callable
 from pathlib import Path
 
@@ -211,6 +212,10 @@ class Module(common.ModuleBase):  # numpydoc ignore=PR01
         self._uses = use_directives if use_directives else []
         self._declarations = declarations if declarations else []
         self._source = None
+        self._source_text = None
+        self._source_version = None
+        self._source_ends = []
+        self._has_source_spans = False
         common.SwanItem.set_owner(self, self._uses)
         common.SwanItem.set_owner(self, self._declarations)
 
@@ -228,6 +233,79 @@ class Module(common.ModuleBase):  # numpydoc ignore=PR01
     def source(self, path: str) -> None:
         "Set source of the module"
         self._source = path
+        self.set_modified()
+
+    @property
+    def source_text(self) -> Optional[str]:
+        """Swan code the module was loaded from, after the version line, or None.
+
+        The :py:attr:`ansys.scadeone.core.swan.ModuleItem.source_span` offsets of the
+        module items refer to this code."""
+        return self._source_text
+
+    @source_text.setter
+    def source_text(self, text: Optional[str]) -> None:
+        "Set the Swan code the module was loaded from, for the current module items"
+        self._source_text = text
+        all_items = self._uses + self._declarations
+        items = [item for item in all_items if item.source_span]
+        self._has_source_spans = text is not None and len(items) == len(all_items)
+        if text is not None:
+            # the parser spans may start with white spaces
+            for item in items:
+                start, end = item.source_span
+                while start < end and text[start].isspace():
+                    start += 1
+                item.source_span = (start, end)
+        # end offsets of the loaded items, including the ones removed later
+        self._source_ends = sorted(item.source_span[1] for item in items)
+
+    @property
+    def source_version(self) -> Optional[str]:
+        """Version line of the Swan code the module was loaded from, or None."""
+        return self._source_version
+
+    @source_version.setter
+    def source_version(self, version: Optional[str]) -> None:
+        "Set the version line of the Swan code the module was loaded from"
+        self._source_version = version
+
+    @property
+    def has_source_spans(self) -> bool:
+        """True if all the module items loaded from :py:attr:`source_text` have a source span,
+        so that the code between them only contains white spaces and comments.
+
+        The protected items have no source span."""
+        return self._has_source_spans
+
+    def source_text_before(self, item: common.ModuleItem) -> str:
+        """Return the loaded Swan code between a module item and the previous loaded item:
+        white spaces and comments.
+
+        Parameters
+        ----------
+        item : ModuleItem
+            Module item with a source span.
+
+        Returns
+        -------
+        str
+            Code before the item.
+        """
+        start = item.source_span[0]
+        index = bisect.bisect_right(self._source_ends, start)
+        previous_end = self._source_ends[index - 1] if index else 0
+        return self._source_text[previous_end:start]
+
+    def source_text_after(self) -> str:
+        """Return the loaded Swan code after the last loaded module item."""
+        return self._source_text[self._source_ends[-1] if self._source_ends else 0 :]
+
+    def __getstate__(self) -> dict:
+        # A pickled module is detached from its model
+        state = self.__dict__.copy()
+        state["_owner"] = None
+        return state
 
     @property
     def declarations(self) -> List[common.ModuleItem]:
@@ -417,6 +495,17 @@ class ModuleBody(Module, ModuleBodyCreator):  # numpydoc ignore=PR01
 
         self._parser = SwanParser(LOGGER)  # type: ignore # This a connection between Python and DONET
 
+    def __getstate__(self) -> dict:
+        state = super().__getstate__()
+        del state["_parser"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        from ansys.scadeone.core.model.loader import SwanParser
+
+        self.__dict__.update(state)
+        self._parser = SwanParser(LOGGER)  # type: ignore
+
     @property
     def extension(self) -> str:
         """Return module extension, with '.' included."""
@@ -170,6 +170,7 @@ class OperatorDeclarationDefinitionBase(
     @is_text.setter
     def is_text(self, text_flag: bool) -> None:
         self._is_text = text_flag
+        self.set_modified()
 
 
 class OperatorDeclaration(OperatorDeclarationDefinitionBase, OperatorDeclarationCreator):
@@ -236,6 +237,8 @@ class OperatorDefinition(OperatorDeclarationDefinitionBase, OperatorCreator):
             pragmas,
         )
         self._body = body
+        # recorded structural hash of the body, see swan_hash.record_module_state()
+        self._body_state_hash = None
 
     @property
     def body(self) -> Optional[Union[Scope, common.Equation]]:
@@ -244,8 +247,18 @@ class OperatorDefinition(OperatorDeclarationDefinitionBase, OperatorCreator):
             body = self._body(self)
             self._body = body
             self.set_owner(self, self._body)
+            if self._body_state_hash is not None:
+                # the state of the module is recorded, see swan_hash.record_module_state()
+                from ansys.scadeone.core.svc.swan_hash import body_state_hash
+
+                self._body_state_hash = body_state_hash(body)
         return self._body
 
+    def __getstate__(self) -> dict:
+        # The lazy body refers to the parser data, it is loaded to be pickled
+        self.body
+        return self.__dict__
+
     @property
     def has_body(self) -> bool:
         """True when operator has a body."""
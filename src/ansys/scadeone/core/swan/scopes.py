@@ -69,6 +69,7 @@ class ScopeSection(SwanItem):  # numpydoc ignore=PR01
     @is_text.setter
     def is_text(self, text_flag: bool) -> None:
         self._is_text = text_flag
+        self.set_modified()
 
     def get_declaration(self, name: str) -> Optional[Declaration]:
         from ansys.scadeone.core.swan.namespace import ScopeNamespace
@@ -113,6 +113,7 @@ class VarDecl(common.Declaration, common.Variable):  # numpydoc ignore=PR01
     @is_input.setter
     def is_input(self, value: bool) -> None:
         self._is_input = value
+        self.set_modified()
 
     @property
     def is_output(self) -> bool:
@@ -122,6 +123,7 @@ class VarDecl(common.Declaration, common.Variable):  # numpydoc ignore=PR01
     @is_output.setter
     def is_output(self, value: bool) -> None:
         self._is_output = value
+        self.set_modified()
 
     @property
     def is_local(self) -> bool:
@@ -0,0 +1,18 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_oper_misc2_module0_H_
+#define SWAN_oper_misc2_module0_H_
+
+#include "swan_types.h"
+#include "oper_poly_module0_Ti32.h"
+
+
+extern swan_int32 oper_misc2_module0(swan_int32 i0);
+
+
+
+#endif /* SWAN_oper_misc2_module0_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** oper_misc2_module0.h
+*************************************************************$ */
@@ -0,0 +1,21 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#include "swan_consts.h"
+#include "swan_sensors.h"
+#include "oper_poly_module0_Ti32.h"
+
+
+swan_int32 oper_poly_module0_Ti32(swan_int32 i0)
+{
+  swan_int32 o0;
+
+  o0 = i0;
+  return o0;
+}
+
+
+
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** oper_poly_module0_Ti32.c
+*************************************************************$ */
@@ -0,0 +1,17 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_oper_poly_module0_Ti32_H_
+#define SWAN_oper_poly_module0_Ti32_H_
+
+#include "swan_types.h"
+
+
+extern swan_int32 oper_poly_module0_Ti32(swan_int32 i0);
+
+
+
+#endif /* SWAN_oper_poly_module0_Ti32_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** oper_poly_module0_Ti32.h
+*************************************************************$ */
@@ -0,0 +1,12 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_CONSTS_H_
+#define SWAN_CONSTS_H_
+
+#include "swan_types.h"
+
+#endif /* SWAN_CONSTS_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** swan_consts.h
+*************************************************************$ */
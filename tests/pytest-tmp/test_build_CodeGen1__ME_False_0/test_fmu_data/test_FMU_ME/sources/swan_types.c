@@ -0,0 +1,8 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#include "swan_types.h"
+
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** swan_types.c
+*************************************************************$ */
@@ -0,0 +1,12 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_TYPES_H_
+#define SWAN_TYPES_H_
+
+#include "swan_config.h"
+
+#endif /* SWAN_TYPES_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0306 
+** swan_types.h
+*************************************************************$ */
@@ -0,0 +1,17 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0622 - Prerelease 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_oper_misc2_module0_H_
+#define SWAN_oper_misc2_module0_H_
+
+#include "swan_types.h"
+
+/* module0::oper_misc2 */
+extern swan_int32 oper_misc2_module0(/* i0 */swan_int32 i0);
+
+
+
+#endif /* SWAN_oper_misc2_module0_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0622 - Prerelease 
+** oper_misc2_module0.h
+*************************************************************$ */
@@ -0,0 +1,22 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0622 - Prerelease 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#include "swan_sensors.h"
+#include "swan_consts.h"
+#include "oper_poly_module0_Ti32.h"
+
+/* module0::oper_poly */
+swan_int32 oper_poly_module0_Ti32(/* i0 */swan_int32 i0)
+{
+  /* o0 */
+  swan_int32 o0;
+
+  o0 = i0;
+  return o0;
+}
+
+
+
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0622 - Prerelease 
+** oper_poly_module0_Ti32.c
+*************************************************************$ */
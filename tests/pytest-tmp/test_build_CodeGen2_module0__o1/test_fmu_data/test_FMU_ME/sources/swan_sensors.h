@@ -0,0 +1,52 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0622 - Prerelease 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_SENSORS_H_
+#define SWAN_SENSORS_H_
+
+#include "swan_types.h"
+
+#ifndef sensor_int_module0
+/* module0::sensor_int */
+extern swan_uint8 sensor_int_module0;
+#endif /* sensor_int_module0 */
+
+#ifndef sensor_enum_module0
+/* module0::sensor_enum */
+extern t_enum1_module0 sensor_enum_module0;
+#endif /* sensor_enum_module0 */
+
+#ifndef sensor_variant_module0
+/* module0::sensor_variant */
+extern t_variant1_module0 sensor_variant_module0;
+#endif /* sensor_variant_module0 */
+
+#ifndef sensor_array_module0
+/* module0::sensor_array */
+extern array_float32_3 sensor_array_module0;
+#endif /* sensor_array_module0 */
+
+#ifndef sensor_struct_module0
+/* module0::sensor_struct */
+extern t_struct1_module0 sensor_struct_module0;
+#endif /* sensor_struct_module0 */
+
+#ifndef sensor_syn_module0
+/* module0::sensor_syn */
+extern t_syn1_module0 sensor_syn_module0;
+#endif /* sensor_syn_module0 */
+
+#ifndef sensor_float_module0
+/* module0::sensor_float */
+extern swan_float32 sensor_float_module0;
+#endif /* sensor_float_module0 */
+
+#ifndef sensor_bool_module0
+/* module0::sensor_bool */
+extern swan_bool sensor_bool_module0;
+#endif /* sensor_bool_module0 */
+
+#endif /* SWAN_SENSORS_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0622 - Prerelease 
+** swan_sensors.h
+*************************************************************$ */
@@ -0,0 +1,1280 @@
+/*************** Ansys Scade One FMI wrapper *******************
+** Begin of file module0_oper_for_fmu_FMU.c
+****************************************************************
+** Copyright (c) 2024 - 2024 ANSYS, Inc. and/or its affiliates.
+** SPDX-License-Identifier: MIT
+**
+**
+** Permission is hereby granted, free of charge, to any person obtaining a copy
+** of this software and associated documentation files (the "Software"), to deal
+** in the Software without restriction, including without limitation the rights
+** to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+** copies of the Software, and to permit persons to whom the Software is
+** furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in all
+** copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+** OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+** SOFTWARE.
+
+****************************************************************/
+
+/* Includes */
+#include <stdio.h>
+#include <string.h>
+#include <assert.h>
+#include <float.h>
+
+#include "oper_for_fmu_module0.h"
+#include "swan_consts.h"
+#include "swan_sensors.h"
+
+#include "fmi2Functions.h"
+
+#define ENSURE_USED(x) (void)(x)
+
+/* Define SCADE context structure */
+typedef struct {
+    swan_int32 i0;
+    array_float32_3 i1;
+    swan_int8 g1_i2;
+    swan_float32 g2_i2;
+    t_struct1_module0 i3;
+    swan_int32 g1_i4;
+    swan_bool g2_i4;
+    swan_uint8 g3_i4;
+    t_enum1_module0 i5;
+    t_syn1_module0 i6;
+    t_variant1_module0 i7;
+    array_1 i8;
+    swan_int32 o0;
+    swan_float32 o1;
+    swan_bool o2;
+    swan_int8 g1_o3;
+    swan_float32 g2_o3;
+    t_struct1_module0 o4;
+    array_bool_2 o5;
+    swan_int32 g1_o6;
+    swan_bool g2_o6;
+    swan_uint8 g3_o6;
+    t_enum1_module0 o7;
+    t_syn1_module0 o8;
+    t_variant1_module0 o9;
+    array_1 o10;
+} SCADE_module0_oper_for_fmu;
+
+/* Sensors */
+swan_uint8 sensor_int_module0;
+t_enum1_module0 sensor_enum_module0;
+t_variant1_module0 sensor_variant_module0;
+array_float32_3 sensor_array_module0;
+t_struct1_module0 sensor_struct_module0;
+swan_uint8 sensor_syn_module0;
+swan_float32 sensor_float_module0;
+swan_bool sensor_bool_module0;
+
+/* Define FMU context structure */
+typedef struct {
+    fmi2String instanceName;
+    fmi2String GUID;
+    const fmi2CallbackFunctions *functions;
+    fmi2Boolean loggingOn;
+    fmi2Real initTime;
+    fmi2Real currentTime;
+    fmi2Real nextTime;
+    fmi2Real period;
+    fmi2Boolean initDone;
+    SCADE_module0_oper_for_fmu *context;
+} ModelInstance;
+
+/* FMI logging */
+#define TRACE_F(fmt, ...) if (comp->loggingOn) \
+    comp->functions->logger(comp->functions->componentEnvironment, comp->instanceName, fmi2OK, "log", fmt, ## __VA_ARGS__)
+#define WARNING_F(fmt, ...) if (comp->loggingOn) \
+    comp->functions->logger(comp->functions->componentEnvironment, comp->instanceName, fmi2Warning, "warning", fmt, ## __VA_ARGS__)
+#define ERROR_F(fmt, ...) if (comp->loggingOn) \
+    comp->functions->logger(comp->functions->componentEnvironment, comp->instanceName, fmi2Error, "error", fmt, ## __VA_ARGS__)
+
+#define TRACE(s) TRACE_F(s, NULL)
+#define WARNING(s) WARNING_F(s, NULL)
+#define ERROR(s) ERROR_F(s, NULL)
+
+/* Debug logging */
+void OPEN_FMI_DBG_LOG(){}
+void CLOSE_FMI_DBG_LOG(){}
+void DO_FMI_DBG_LOG(const char * format, ...){}
+
+/* Declare State Vector structure */
+#define STATE_VECTOR_SIZE 0
+
+/*$************ MODEL DEFINITIONS *************$*/
+
+/* Define class name and unique id */
+#define MODEL_IDENTIFIER module0_oper_for_fmu_FMU
+#define MODEL_GUID "a89f54d4-cbbb-11f1-a623-02fc00000001"
+
+/* Task period setting */
+#define TASK_PERIOD 0.02 
+
+/* Define model size */
+#define NUMBER_OF_REALS 65
+#define NUMBER_OF_INTEGERS 75
+#define NUMBER_OF_BOOLEANS 6
+#define NUMBER_OF_STRINGS 0
+#define NUMBER_OF_STATES 0
+#define STATES {0}
+#define NUMBER_OF_EVENT_INDICATORS 0
+
+/* get state decl: N/A */
+
+/* set state decl: N/A */
+
+/* Called by fmi2Terminate and fmi2Reset */
+static void terminate(ModelInstance* comp)
+{
+    ENSURE_USED(comp);
+}
+
+/* ---------------------------------------------------------------------------*
+ * Private helpers used below to validate function arguments
+ * ---------------------------------------------------------------------------*/
+
+static fmi2Boolean nullPointer(ModelInstance* comp, const char* f, const char* arg, const void* p)
+{
+    if (!p) {
+        DO_FMI_DBG_LOG("%s: invalid argument %s = NULL.\n", f, arg);
+        ERROR_F("%s: invalid argument %s = NULL.", f, arg);
+        return fmi2True;
+    }
+    return fmi2False;
+}
+
+static fmi2Boolean vrOutOfRange(ModelInstance* comp, const char* f, fmi2ValueReference vr, fmi2ValueReference end)
+{
+    if (vr >= end) {
+        DO_FMI_DBG_LOG("%s: illegal value reference %u.\n", f, vr);
+        ERROR_F("%s: illegal value reference %u.", f, vr);
+        return fmi2True;
+    }
+    return fmi2False;
+}
+
+/* ---------------------------------------------------------------------------*
+ * FMI functions: class methods not depending of a specific model instance
+ * ---------------------------------------------------------------------------*/
+
+const char* fmi2GetVersion()
+{
+    return fmi2Version;
+}
+
+const char* fmi2GetTypesPlatform()
+{
+    return fmi2TypesPlatform;
+}
+
+/* ---------------------------------------------------------------------------
+ * FMI functions: for FMI Model Exchange 2.0 and for FMI Co-Simulation 2.0
+ * logging control, setters and getters for Real, Integer, Boolean, String
+ * ---------------------------------------------------------------------------*/
+
+fmi2Status fmi2SetDebugLogging(fmi2Component c, fmi2Boolean loggingOn, size_t nCategories, const fmi2String categories[])
+{
+    ModelInstance* comp = (ModelInstance *)c;
+    ENSURE_USED(nCategories);
+    ENSURE_USED(categories);
+    
+    DO_FMI_DBG_LOG("fmi2SetDebugLogging: loggingOn=%s\n", loggingOn ? "true" : "false");
+    TRACE_F("fmi2SetDebugLogging: loggingOn=%s", loggingOn ? "true" : "false");
+    
+    comp->loggingOn = loggingOn;
+    return fmi2OK;
+}
+
+fmi2Status fmi2SetReal(fmi2Component c, const fmi2ValueReference vr[], size_t nvr, const fmi2Real value[])
+{
+    size_t i;
+    ModelInstance* comp = (ModelInstance *)c;
+
+    if ((nvr > 0) &&
+        (nullPointer(comp, "fmi2SetReal", "vr[]", vr) ||
+         nullPointer(comp, "fmi2SetReal", "value[]", value))) {
+        return fmi2Error;
+    }
+
+    for (i = 0; i < nvr; i++) {
+        if (vrOutOfRange(comp, "fmi2SetReal", vr[i], NUMBER_OF_REALS)) {
+            return fmi2Error;
+        }
+        DO_FMI_DBG_LOG("fmi2SetReal: #r%d# = %.17g\n", vr[i], value[i]);
+        TRACE_F("fmi2SetReal: #r%d# = %.16g", vr[i], value[i]);
+        switch (vr[i]) {
+        case 0: sensor_variant_module0.F.swan_value = (swan_float32) value[i]; break;
+        case 1: sensor_array_module0[0] = (swan_float32) value[i]; break;
+        case 2: sensor_array_module0[1] = (swan_float32) value[i]; break;
+        case 3: sensor_array_module0[2] = (swan_float32) value[i]; break;
+        case 4: sensor_struct_module0.b = (swan_float32) value[i]; break;
+        case 5: sensor_float_module0 = (swan_float32) value[i]; break;
+        case 6: comp->context->i1[0] = (swan_float32) value[i]; break;
+        case 7: comp->context->i1[1] = (swan_float32) value[i]; break;
+        case 8: comp->context->i1[2] = (swan_float32) value[i]; break;
+        case 9: comp->context->g2_i2 = (swan_float32) value[i]; break;
+        case 10: comp->context->i3.b = (swan_float32) value[i]; break;
+        case 11: comp->context->i7.F.swan_value = (swan_float32) value[i]; break;
+        case 12: comp->context->i8[0][0][0].b = (swan_float32) value[i]; break;
+        case 13: comp->context->i8[0][0][1].b = (swan_float32) value[i]; break;
+        case 14: comp->context->i8[0][0][2].b = (swan_float32) value[i]; break;
+        case 15: comp->context->i8[0][0][3].b = (swan_float32) value[i]; break;
+        case 16: comp->context->i8[0][1][0].b = (swan_float32) value[i]; break;
+        case 17: comp->context->i8[0][1][1].b = (swan_float32) value[i]; break;
+        case 18: comp->context->i8[0][1][2].b = (swan_float32) value[i]; break;
+        case 19: comp->context->i8[0][1][3].b = (swan_float32) value[i]; break;
+        case 20: comp->context->i8[0][2][0].b = (swan_float32) value[i]; break;
+        case 21: comp->context->i8[0][2][1].b = (swan_float32) value[i]; break;
+        case 22: comp->context->i8[0][2][2].b = (swan_float32) value[i]; break;
+        case 23: comp->context->i8[0][2][3].b = (swan_float32) value[i]; break;
+        case 24: comp->context->i8[1][0][0].b = (swan_float32) value[i]; break;
+        case 25: comp->context->i8[1][0][1].b = (swan_float32) value[i]; break;
+        case 26: comp->context->i8[1][0][2].b = (swan_float32) value[i]; break;
+        case 27: comp->context->i8[1][0][3].b = (swan_float32) value[i]; break;
+        case 28: comp->context->i8[1][1][0].b = (swan_float32) value[i]; break;
+        case 29: comp->context->i8[1][1][1].b = (swan_float32) value[i]; break;
+        case 30: comp->context->i8[1][1][2].b = (swan_float32) value[i]; break;
+        case 31: comp->context->i8[1][1][3].b = (swan_float32) value[i]; break;
+        case 32: comp->context->i8[1][2][0].b = (swan_float32) value[i]; break;
+        case 33: comp->context->i8[1][2][1].b = (swan_float32) value[i]; break;
+        case 34: comp->context->i8[1][2][2].b = (swan_float32) value[i]; break;
+        case 35: comp->context->i8[1][2][3].b = (swan_float32) value[i]; break;
+        case 36: comp->context->o1 = (swan_float32) value[i]; break;
+        case 37: comp->context->g2_o3 = (swan_float32) value[i]; break;
+        case 38: comp->context->o4.b = (swan_float32) value[i]; break;
+        case 39: comp->context->o9.F.swan_value = (swan_float32) value[i]; break;
+        case 40: comp->context->o10[0][0][0].b = (swan_float32) value[i]; break;
+        case 41: comp->context->o10[0][0][1].b = (swan_float32) value[i]; break;
+        case 42: comp->context->o10[0][0][2].b = (swan_float32) value[i]; break;
+        case 43: comp->context->o10[0][0][3].b = (swan_float32) value[i]; break;
+        case 44: comp->context->o10[0][1][0].b = (swan_float32) value[i]; break;
+        case 45: comp->context->o10[0][1][1].b = (swan_float32) value[i]; break;
+        case 46: comp->context->o10[0][1][2].b = (swan_float32) value[i]; break;
+        case 47: comp->context->o10[0][1][3].b = (swan_float32) value[i]; break;
+        case 48: comp->context->o10[0][2][0].b = (swan_float32) value[i]; break;
+        case 49: comp->context->o10[0][2][1].b = (swan_float32) value[i]; break;
+        case 50: comp->context->o10[0][2][2].b = (swan_float32) value[i]; break;
+        case 51: comp->context->o10[0][2][3].b = (swan_float32) value[i]; break;
+        case 52: comp->context->o10[1][0][0].b = (swan_float32) value[i]; break;
+        case 53: comp->context->o10[1][0][1].b = (swan_float32) value[i]; break;
+        case 54: comp->context->o10[1][0][2].b = (swan_float32) value[i]; break;
+        case 55: comp->context->o10[1][0][3].b = (swan_float32) value[i]; break;
+        case 56: comp->context->o10[1][1][0].b = (swan_float32) value[i]; break;
+        case 57: comp->context->o10[1][1][1].b = (swan_float32) value[i]; break;
+        case 58: comp->context->o10[1][1][2].b = (swan_float32) value[i]; break;
+        case 59: comp->context->o10[1][1][3].b = (swan_float32) value[i]; break;
+        case 60: comp->context->o10[1][2][0].b = (swan_float32) value[i]; break;
+        case 61: comp->context->o10[1][2][1].b = (swan_float32) value[i]; break;
+        case 62: comp->context->o10[1][2][2].b = (swan_float32) value[i]; break;
+        case 63: comp->context->o10[1][2][3].b = (swan_float32) value[i]; break;
+        case 64: comp->period = value[i]; break;
+        default: break;
+        }
+    }
+    return fmi2OK;
+}
+
+fmi2Status fmi2SetInteger(fmi2Component c, const fmi2ValueReference vr[], size_t nvr, const fmi2Integer value[])
+{
+    size_t i;
+    ModelInstance* comp = (ModelInstance *)c;
+    
+    if ((nvr > 0) &&
+        (nullPointer(comp, "fmi2SetInteger", "vr[]", vr) ||
+         nullPointer(comp, "fmi2SetInteger", "value[]", value))) {
+        return fmi2Error;
+    }
+    
+    for (i=0; i<nvr; i++) {
+        if (vrOutOfRange(comp, "fmi2SetInteger", vr[i], NUMBER_OF_INTEGERS)) {
+            return fmi2Error;
+        }
+        DO_FMI_DBG_LOG("fmi2SetInteger: #i%d# = %d\n", vr[i], value[i]);
+        TRACE_F("fmi2SetInteger: #i%d# = %d", vr[i], value[i]);
+        switch (vr[i]) {
+        case 0: sensor_int_module0 = (swan_uint8) value[i]; break;
+        case 1: sensor_enum_module0 = (t_enum1_module0) value[i]; break;
+        case 2: sensor_variant_module0.F.swan_tag = (kind_t_variant1_module0) value[i]; break;
+        case 3: sensor_variant_module0.I.swan_tag = (kind_t_variant1_module0) value[i]; break;
+        case 4: sensor_variant_module0.I.swan_value = (swan_int32) value[i]; break;
+        case 5: sensor_struct_module0.a = (swan_int8) value[i]; break;
+        case 6: sensor_syn_module0 = (swan_uint8) value[i]; break;
+        case 7: comp->context->i0 = (swan_int32) value[i]; break;
+        case 8: comp->context->g1_i2 = (swan_int8) value[i]; break;
+        case 9: comp->context->i3.a = (swan_int8) value[i]; break;
+        case 10: comp->context->g1_i4 = (swan_int32) value[i]; break;
+        case 11: comp->context->g3_i4 = (swan_uint8) value[i]; break;
+        case 12: comp->context->i5 = (t_enum1_module0) value[i]; break;
+        case 13: comp->context->i6 = (swan_uint8) value[i]; break;
+        case 14: comp->context->i7.F.swan_tag = (kind_t_variant1_module0) value[i]; break;
+        case 15: comp->context->i7.I.swan_tag = (kind_t_variant1_module0) value[i]; break;
+        case 16: comp->context->i7.I.swan_value = (swan_int32) value[i]; break;
+        case 17: comp->context->i8[0][0][0].a = (swan_int8) value[i]; break;
+        case 18: comp->context->i8[0][0][1].a = (swan_int8) value[i]; break;
+        case 19: comp->context->i8[0][0][2].a = (swan_int8) value[i]; break;
+        case 20: comp->context->i8[0][0][3].a = (swan_int8) value[i]; break;
+        case 21: comp->context->i8[0][1][0].a = (swan_int8) value[i]; break;
+        case 22: comp->context->i8[0][1][1].a = (swan_int8) value[i]; break;
+        case 23: comp->context->i8[0][1][2].a = (swan_int8) value[i]; break;
+        case 24: comp->context->i8[0][1][3].a = (swan_int8) value[i]; break;
+        case 25: comp->context->i8[0][2][0].a = (swan_int8) value[i]; break;
+        case 26: comp->context->i8[0][2][1].a = (swan_int8) value[i]; break;
+        case 27: comp->context->i8[0][2][2].a = (swan_int8) value[i]; break;
+        case 28: comp->context->i8[0][2][3].a = (swan_int8) value[i]; break;
+        case 29: comp->context->i8[1][0][0].a = (swan_int8) value[i]; break;
+        case 30: comp->context->i8[1][0][1].a = (swan_int8) value[i]; break;
+        case 31: comp->context->i8[1][0][2].a = (swan_int8) value[i]; break;
+        case 32: comp->context->i8[1][0][3].a = (swan_int8) value[i]; break;
+        case 33: comp->context->i8[1][1][0].a = (swan_int8) value[i]; break;
+        case 34: comp->context->i8[1][1][1].a = (swan_int8) value[i]; break;
+        case 35: comp->context->i8[1][1][2].a = (swan_int8) value[i]; break;
+        case 36: comp->context->i8[1][1][3].a = (swan_int8) value[i]; break;
+        case 37: comp->context->i8[1][2][0].a = (swan_int8) value[i]; break;
+        case 38: comp->context->i8[1][2][1].a = (swan_int8) value[i]; break;
+        case 39: comp->context->i8[1][2][2].a = (swan_int8) value[i]; break;
+        case 40: comp->context->i8[1][2][3].a = (swan_int8) value[i]; break;
+        case 41: comp->context->o0 = (swan_int32) value[i]; break;
+        case 42: comp->context->g1_o3 = (swan_int8) value[i]; break;
+        case 43: comp->context->o4.a = (swan_int8) value[i]; break;
+        case 44: comp->context->g1_o6 = (swan_int32) value[i]; break;
+        case 45: comp->context->g3_o6 = (swan_uint8) value[i]; break;
+        case 46: comp->context->o7 = (t_enum1_module0) value[i]; break;
+        case 47: comp->context->o8 = (swan_uint8) value[i]; break;
+        case 48: comp->context->o9.F.swan_tag = (kind_t_variant1_module0) value[i]; break;
+        case 49: comp->context->o9.I.swan_tag = (kind_t_variant1_module0) value[i]; break;
+        case 50: comp->context->o9.I.swan_value = (swan_int32) value[i]; break;
+        case 51: comp->context->o10[0][0][0].a = (swan_int8) value[i]; break;
+        case 52: comp->context->o10[0][0][1].a = (swan_int8) value[i]; break;
+        case 53: comp->context->o10[0][0][2].a = (swan_int8) value[i]; break;
+        case 54: comp->context->o10[0][0][3].a = (swan_int8) value[i]; break;
+        case 55: comp->context->o10[0][1][0].a = (swan_int8) value[i]; break;
+        case 56: comp->context->o10[0][1][1].a = (swan_int8) value[i]; break;
+        case 57: comp->context->o10[0][1][2].a = (swan_int8) value[i]; break;
+        case 58: comp->context->o10[0][1][3].a = (swan_int8) value[i]; break;
+        case 59: comp->context->o10[0][2][0].a = (swan_int8) value[i]; break;
+        case 60: comp->context->o10[0][2][1].a = (swan_int8) value[i]; break;
+        case 61: comp->context->o10[0][2][2].a = (swan_int8) value[i]; break;
+        case 62: comp->context->o10[0][2][3].a = (swan_int8) value[i]; break;
+        case 63: comp->context->o10[1][0][0].a = (swan_int8) value[i]; break;
+        case 64: comp->context->o10[1][0][1].a = (swan_int8) value[i]; break;
+        case 65: comp->context->o10[1][0][2].a = (swan_int8) value[i]; break;
+        case 66: comp->context->o10[1][0][3].a = (swan_int8) value[i]; break;
+        case 67: comp->context->o10[1][1][0].a = (swan_int8) value[i]; break;
+        case 68: comp->context->o10[1][1][1].a = (swan_int8) value[i]; break;
+        case 69: comp->context->o10[1][1][2].a = (swan_int8) value[i]; break;
+        case 70: comp->context->o10[1][1][3].a = (swan_int8) value[i]; break;
+        case 71: comp->context->o10[1][2][0].a = (swan_int8) value[i]; break;
+        case 72: comp->context->o10[1][2][1].a = (swan_int8) value[i]; break;
+        case 73: comp->context->o10[1][2][2].a = (swan_int8) value[i]; break;
+        case 74: comp->context->o10[1][2][3].a = (swan_int8) value[i]; break;
+        default: break;
+        }
+    }
+    return fmi2OK;
+}
+
+fmi2Status fmi2SetBoolean(fmi2Component c, const fmi2ValueReference vr[], size_t nvr, const fmi2Boolean value[])
+{
+    size_t i;
+    ModelInstance* comp = (ModelInstance *)c;
+    
+    if ((nvr > 0) &&
+        (nullPointer(comp, "fmi2SetBoolean", "vr[]", vr) ||
+         nullPointer(comp, "fmi2SetBoolean", "value[]", value))) {
+        return fmi2Error;
+    }
+
+    for (i = 0; i < nvr; i++) {
+        if (vrOutOfRange(comp, "fmi2SetBoolean", vr[i], NUMBER_OF_BOOLEANS)) {
+            return fmi2Error;
+        }
+        DO_FMI_DBG_LOG("fmi2SetBoolean: #b%d# = %s\n", vr[i], value[i] ? "true" : "false");
+        TRACE_F("fmi2SetBoolean: #b%d# = %s", vr[i], value[i] ? "true" : "false");
+        switch (vr[i]) {
+        case 0: sensor_bool_module0 = (swan_bool) value[i]; break;
+        case 1: comp->context->g2_i4 = (swan_bool) value[i]; break;
+        case 2: comp->context->o2 = (swan_bool) value[i]; break;
+        case 3: comp->context->o5[0] = (swan_bool) value[i]; break;
+        case 4: comp->context->o5[1] = (swan_bool) value[i]; break;
+        case 5: comp->context->g2_o6 = (swan_bool) value[i]; break;
+        default: break;
+        }
+    }
+    return fmi2OK;
+}
+
+fmi2Status fmi2SetString(fmi2Component c, const fmi2ValueReference vr[], size_t nvr, const fmi2String value[])
+{
+    size_t i;
+    ModelInstance* comp = (ModelInstance *)c;
+
+    if ((nvr > 0) &&
+        (nullPointer(comp, "fmi2SetString", "vr[]", vr) ||
+         nullPointer(comp, "fmi2SetString", "value[]", value))) {
+        return fmi2Error;
+    }
+
+    for (i = 0; i < nvr; i++) {
+        if (vrOutOfRange(comp, "fmi2SetString", vr[i], NUMBER_OF_STRINGS)) {
+            return fmi2Error;
+        }
+        DO_FMI_DBG_LOG("fmi2SetString: #s%d# = '%s'", vr[i], value[i]);
+        TRACE_F("fmi2SetString: #s%d# = '%s'", vr[i], value[i]);
+        if (nullPointer(comp, "fmi2SetString", "value[i]", value[i])) {
+            return fmi2Error;
+        }
+        /* string not supported: nothing done */
+    }
+    return fmi2OK;
+}
+
+fmi2Status fmi2GetReal(fmi2Component c, const fmi2ValueReference vr[], size_t nvr, fmi2Real value[])
+{
+    size_t i;
+    ModelInstance* comp = (ModelInstance *)c;
+
+    if ((nvr > 0) &&
+        (nullPointer(comp, "fmi2GetReal", "vr[]", vr) ||
+         nullPointer(comp, "fmi2GetReal", "value[]", value))) {
+         return fmi2Error;
+    }
+
+    for (i = 0; i < nvr; i++) {
+        if (vrOutOfRange(comp, "fmi2GetReal", vr[i], NUMBER_OF_REALS)) {
+            return fmi2Error;
+        }
+
+        switch (vr[i]) {
+        case 0: value[i] = (fmi2Real)sensor_variant_module0.F.swan_value; break;
+        case 1: value[i] = (fmi2Real)sensor_array_module0[0]; break;
+        case 2: value[i] = (fmi2Real)sensor_array_module0[1]; break;
+        case 3: value[i] = (fmi2Real)sensor_array_module0[2]; break;
+        case 4: value[i] = (fmi2Real)sensor_struct_module0.b; break;
+        case 5: value[i] = (fmi2Real)sensor_float_module0; break;
+        case 6: value[i] = (fmi2Real)comp->context->i1[0]; break;
+        case 7: value[i] = (fmi2Real)comp->context->i1[1]; break;
+        case 8: value[i] = (fmi2Real)comp->context->i1[2]; break;
+        case 9: value[i] = (fmi2Real)comp->context->g2_i2; break;
+        case 10: value[i] = (fmi2Real)comp->context->i3.b; break;
+        case 11: value[i] = (fmi2Real)comp->context->i7.F.swan_value; break;
+        case 12: value[i] = (fmi2Real)comp->context->i8[0][0][0].b; break;
+        case 13: value[i] = (fmi2Real)comp->context->i8[0][0][1].b; break;
+        case 14: value[i] = (fmi2Real)comp->context->i8[0][0][2].b; break;
+        case 15: value[i] = (fmi2Real)comp->context->i8[0][0][3].b; break;
+        case 16: value[i] = (fmi2Real)comp->context->i8[0][1][0].b; break;
+        case 17: value[i] = (fmi2Real)comp->context->i8[0][1][1].b; break;
+        case 18: value[i] = (fmi2Real)comp->context->i8[0][1][2].b; break;
+        case 19: value[i] = (fmi2Real)comp->context->i8[0][1][3].b; break;
+        case 20: value[i] = (fmi2Real)comp->context->i8[0][2][0].b; break;
+        case 21: value[i] = (fmi2Real)comp->context->i8[0][2][1].b; break;
+        case 22: value[i] = (fmi2Real)comp->context->i8[0][2][2].b; break;
+        case 23: value[i] = (fmi2Real)comp->context->i8[0][2][3].b; break;
+        case 24: value[i] = (fmi2Real)comp->context->i8[1][0][0].b; break;
+        case 25: value[i] = (fmi2Real)comp->context->i8[1][0][1].b; break;
+        case 26: value[i] = (fmi2Real)comp->context->i8[1][0][2].b; break;
+        case 27: value[i] = (fmi2Real)comp->context->i8[1][0][3].b; break;
+        case 28: value[i] = (fmi2Real)comp->context->i8[1][1][0].b; break;
+        case 29: value[i] = (fmi2Real)comp->context->i8[1][1][1].b; break;
+        case 30: value[i] = (fmi2Real)comp->context->i8[1][1][2].b; break;
+        case 31: value[i] = (fmi2Real)comp->context->i8[1][1][3].b; break;
+        case 32: value[i] = (fmi2Real)comp->context->i8[1][2][0].b; break;
+        case 33: value[i] = (fmi2Real)comp->context->i8[1][2][1].b; break;
+        case 34: value[i] = (fmi2Real)comp->context->i8[1][2][2].b; break;
+        case 35: value[i] = (fmi2Real)comp->context->i8[1][2][3].b; break;
+        case 36: value[i] = (fmi2Real)comp->context->o1; break;
+        case 37: value[i] = (fmi2Real)comp->context->g2_o3; break;
+        case 38: value[i] = (fmi2Real)comp->context->o4.b; break;
+        case 39: value[i] = (fmi2Real)comp->context->o9.F.swan_value; break;
+        case 40: value[i] = (fmi2Real)comp->context->o10[0][0][0].b; break;
+        case 41: value[i] = (fmi2Real)comp->context->o10[0][0][1].b; break;
+        case 42: value[i] = (fmi2Real)comp->context->o10[0][0][2].b; break;
+        case 43: value[i] = (fmi2Real)comp->context->o10[0][0][3].b; break;
+        case 44: value[i] = (fmi2Real)comp->context->o10[0][1][0].b; break;
+        case 45: value[i] = (fmi2Real)comp->context->o10[0][1][1].b; break;
+        case 46: value[i] = (fmi2Real)comp->context->o10[0][1][2].b; break;
+        case 47: value[i] = (fmi2Real)comp->context->o10[0][1][3].b; break;
+        case 48: value[i] = (fmi2Real)comp->context->o10[0][2][0].b; break;
+        case 49: value[i] = (fmi2Real)comp->context->o10[0][2][1].b; break;
+        case 50: value[i] = (fmi2Real)comp->context->o10[0][2][2].b; break;
+        case 51: value[i] = (fmi2Real)comp->context->o10[0][2][3].b; break;
+        case 52: value[i] = (fmi2Real)comp->context->o10[1][0][0].b; break;
+        case 53: value[i] = (fmi2Real)comp->context->o10[1][0][1].b; break;
+        case 54: value[i] = (fmi2Real)comp->context->o10[1][0][2].b; break;
+        case 55: value[i] = (fmi2Real)comp->context->o10[1][0][3].b; break;
+        case 56: value[i] = (fmi2Real)comp->context->o10[1][1][0].b; break;
+        case 57: value[i] = (fmi2Real)comp->context->o10[1][1][1].b; break;
+        case 58: value[i] = (fmi2Real)comp->context->o10[1][1][2].b; break;
+        case 59: value[i] = (fmi2Real)comp->context->o10[1][1][3].b; break;
+        case 60: value[i] = (fmi2Real)comp->context->o10[1][2][0].b; break;
+        case 61: value[i] = (fmi2Real)comp->context->o10[1][2][1].b; break;
+        case 62: value[i] = (fmi2Real)comp->context->o10[1][2][2].b; break;
+        case 63: value[i] = (fmi2Real)comp->context->o10[1][2][3].b; break;
+        case 64: value[i] = comp->period; break;
+        default: break;
+        }
+
+        DO_FMI_DBG_LOG("fmi2GetReal: #r%u# = %.16g\n", vr[i], value[i]);
+        TRACE_F("fmi2GetReal: #r%u# = %.16g", vr[i], value[i]);
+    }
+    return fmi2OK;
+}
+
+fmi2Status fmi2GetInteger(fmi2Component c, const fmi2ValueReference vr[], size_t nvr, fmi2Integer value[])
+{
+    size_t i;
+    ModelInstance* comp = (ModelInstance *)c;
+
+    if ((nvr > 0) &&
+        (nullPointer(comp, "fmi2GetInteger", "vr[]", vr) ||
+         nullPointer(comp, "fmi2GetInteger", "value[]", value))) {
+        return fmi2Error;
+    }
+
+    for (i = 0; i < nvr; i++) {
+        if (vrOutOfRange(comp, "fmi2GetInteger", vr[i], NUMBER_OF_INTEGERS)) {
+           return fmi2Error;
+        }
+
+        switch (vr[i]) {
+        case 0: value[i] = (fmi2Integer)sensor_int_module0; break;
+        case 1: value[i] = (fmi2Integer)sensor_enum_module0; break;
+        case 2: value[i] = (fmi2Integer)sensor_variant_module0.F.swan_tag; break;
+        case 3: value[i] = (fmi2Integer)sensor_variant_module0.I.swan_tag; break;
+        case 4: value[i] = (fmi2Integer)sensor_variant_module0.I.swan_value; break;
+        case 5: value[i] = (fmi2Integer)sensor_struct_module0.a; break;
+        case 6: value[i] = (fmi2Integer)sensor_syn_module0; break;
+        case 7: value[i] = (fmi2Integer)comp->context->i0; break;
+        case 8: value[i] = (fmi2Integer)comp->context->g1_i2; break;
+        case 9: value[i] = (fmi2Integer)comp->context->i3.a; break;
+        case 10: value[i] = (fmi2Integer)comp->context->g1_i4; break;
+        case 11: value[i] = (fmi2Integer)comp->context->g3_i4; break;
+        case 12: value[i] = (fmi2Integer)comp->context->i5; break;
+        case 13: value[i] = (fmi2Integer)comp->context->i6; break;
+        case 14: value[i] = (fmi2Integer)comp->context->i7.F.swan_tag; break;
+        case 15: value[i] = (fmi2Integer)comp->context->i7.I.swan_tag; break;
+        case 16: value[i] = (fmi2Integer)comp->context->i7.I.swan_value; break;
+        case 17: value[i] = (fmi2Integer)comp->context->i8[0][0][0].a; break;
+        case 18: value[i] = (fmi2Integer)comp->context->i8[0][0][1].a; break;
+        case 19: value[i] = (fmi2Integer)comp->context->i8[0][0][2].a; break;
+        case 20: value[i] = (fmi2Integer)comp->context->i8[0][0][3].a; break;
+        case 21: value[i] = (fmi2Integer)comp->context->i8[0][1][0].a; break;
+        case 22: value[i] = (fmi2Integer)comp->context->i8[0][1][1].a; break;
+        case 23: value[i] = (fmi2Integer)comp->context->i8[0][1][2].a; break;
+        case 24: value[i] = (fmi2Integer)comp->context->i8[0][1][3].a; break;
+        case 25: value[i] = (fmi2Integer)comp->context->i8[0][2][0].a; break;
+        case 26: value[i] = (fmi2Integer)comp->context->i8[0][2][1].a; break;
+        case 27: value[i] = (fmi2Integer)comp->context->i8[0][2][2].a; break;
+        case 28: value[i] = (fmi2Integer)comp->context->i8[0][2][3].a; break;
+        case 29: value[i] = (fmi2Integer)comp->context->i8[1][0][0].a; break;
+        case 30: value[i] = (fmi2Integer)comp->context->i8[1][0][1].a; break;
+        case 31: value[i] = (fmi2Integer)comp->context->i8[1][0][2].a; break;
+        case 32: value[i] = (fmi2Integer)comp->context->i8[1][0][3].a; break;
+        case 33: value[i] = (fmi2Integer)comp->context->i8[1][1][0].a; break;
+        case 34: value[i] = (fmi2Integer)comp->context->i8[1][1][1].a; break;
+        case 35: value[i] = (fmi2Integer)comp->context->i8[1][1][2].a; break;
+        case 36: value[i] = (fmi2Integer)comp->context->i8[1][1][3].a; break;
+        case 37: value[i] = (fmi2Integer)comp->context->i8[1][2][0].a; break;
+        case 38: value[i] = (fmi2Integer)comp->context->i8[1][2][1].a; break;
+        case 39: value[i] = (fmi2Integer)comp->context->i8[1][2][2].a; break;
+        case 40: value[i] = (fmi2Integer)comp->context->i8[1][2][3].a; break;
+        case 41: value[i] = (fmi2Integer)comp->context->o0; break;
+        case 42: value[i] = (fmi2Integer)comp->context->g1_o3; break;
+        case 43: value[i] = (fmi2Integer)comp->context->o4.a; break;
+        case 44: value[i] = (fmi2Integer)comp->context->g1_o6; break;
+        case 45: value[i] = (fmi2Integer)comp->context->g3_o6; break;
+        case 46: value[i] = (fmi2Integer)comp->context->o7; break;
+        case 47: value[i] = (fmi2Integer)comp->context->o8; break;
+        case 48: value[i] = (fmi2Integer)comp->context->o9.F.swan_tag; break;
+        case 49: value[i] = (fmi2Integer)comp->context->o9.I.swan_tag; break;
+        case 50: value[i] = (fmi2Integer)comp->context->o9.I.swan_value; break;
+        case 51: value[i] = (fmi2Integer)comp->context->o10[0][0][0].a; break;
+        case 52: value[i] = (fmi2Integer)comp->context->o10[0][0][1].a; break;
+        case 53: value[i] = (fmi2Integer)comp->context->o10[0][0][2].a; break;
+        case 54: value[i] = (fmi2Integer)comp->context->o10[0][0][3].a; break;
+        case 55: value[i] = (fmi2Integer)comp->context->o10[0][1][0].a; break;
+        case 56: value[i] = (fmi2Integer)comp->context->o10[0][1][1].a; break;
+        case 57: value[i] = (fmi2Integer)comp->context->o10[0][1][2].a; break;
+        case 58: value[i] = (fmi2Integer)comp->context->o10[0][1][3].a; break;
+        case 59: value[i] = (fmi2Integer)comp->context->o10[0][2][0].a; break;
+        case 60: value[i] = (fmi2Integer)comp->context->o10[0][2][1].a; break;
+        case 61: value[i] = (fmi2Integer)comp->context->o10[0][2][2].a; break;
+        case 62: value[i] = (fmi2Integer)comp->context->o10[0][2][3].a; break;
+        case 63: value[i] = (fmi2Integer)comp->context->o10[1][0][0].a; break;
+        case 64: value[i] = (fmi2Integer)comp->context->o10[1][0][1].a; break;
+        case 65: value[i] = (fmi2Integer)comp->context->o10[1][0][2].a; break;
+        case 66: value[i] = (fmi2Integer)comp->context->o10[1][0][3].a; break;
+        case 67: value[i] = (fmi2Integer)comp->context->o10[1][1][0].a; break;
+        case 68: value[i] = (fmi2Integer)comp->context->o10[1][1][1].a; break;
+        case 69: value[i] = (fmi2Integer)comp->context->o10[1][1][2].a; break;
+        case 70: value[i] = (fmi2Integer)comp->context->o10[1][1][3].a; break;
+        case 71: value[i] = (fmi2Integer)comp->context->o10[1][2][0].a; break;
+        case 72: value[i] = (fmi2Integer)comp->context->o10[1][2][1].a; break;
+        case 73: value[i] = (fmi2Integer)comp->context->o10[1][2][2].a; break;
+        case 74: value[i] = (fmi2Integer)comp->context->o10[1][2][3].a; break;
+        default: break;
+        }
+
+        DO_FMI_DBG_LOG("fmi2GetInteger: #i%u# = %d\n", vr[i], value[i]);
+        TRACE_F("fmi2GetInteger: #i%u# = %d", vr[i], value[i]);
+    }
+    return fmi2OK;
+}
+
+fmi2Status fmi2GetBoolean(fmi2Component c, const fmi2ValueReference vr[], size_t nvr, fmi2Boolean value[])
+{
+    size_t i;
+    ModelInstance* comp = (ModelInstance *)c;
+
+    if ((nvr > 0) &&
+        (nullPointer(comp, "fmi2GetBoolean", "vr[]", vr) ||
+         nullPointer(comp, "fmi2GetBoolean", "value[]", value))) {
+        return fmi2Error;
+    }
+
+    for (i = 0; i < nvr; i++) {
+        if (vrOutOfRange(comp, "fmi2GetBoolean", vr[i], NUMBER_OF_BOOLEANS)) {
+            return fmi2Error;
+        }
+        switch (vr[i]) {
+        case 0: value[i] = (fmi2Boolean)sensor_bool_module0; break;
+        case 1: value[i] = (fmi2Boolean)comp->context->g2_i4; break;
+        case 2: value[i] = (fmi2Boolean)comp->context->o2; break;
+        case 3: value[i] = (fmi2Boolean)comp->context->o5[0]; break;
+        case 4: value[i] = (fmi2Boolean)comp->context->o5[1]; break;
+        case 5: value[i] = (fmi2Boolean)comp->context->g2_o6; break;
+        default: break;
+        }
+
+        DO_FMI_DBG_LOG("fmi2GetBoolean: #b%u# = %s\n", vr[i], value[i]? "true" : "false");
+        TRACE_F("fmi2GetBoolean: #b%u# = %s", vr[i], value[i] ? "true" : "false");
+    }
+    return fmi2OK;
+}
+
+fmi2Status fmi2GetString(fmi2Component c, const fmi2ValueReference vr[], size_t nvr, fmi2String  value[])
+{
+    size_t i;
+    ModelInstance* comp = (ModelInstance *)c;
+
+    if ((nvr > 0) &&
+        (nullPointer(comp, "fmi2GetString", "vr[]", vr) ||
+         nullPointer(comp, "fmi2GetString", "value[]", value))) {
+        return fmi2Error;
+    }
+
+    for (i = 0; i < nvr; i++) {
+        if (vrOutOfRange(comp, "fmi2GetString", vr[i], NUMBER_OF_STRINGS)) {
+           return fmi2Error;
+        }
+
+        /* string not supported: nothing done */
+
+        DO_FMI_DBG_LOG("fmi2GetString: #s%u# = '%s'", vr[i], value[i]);
+        TRACE_F("fmi2GetString: #s%u# = '%s'", vr[i], value[i]);
+    }
+    return fmi2OK;
+}
+
+fmi2Status fmi2GetFMUstate (fmi2Component c, fmi2FMUstate* FMUstate)
+{
+    ModelInstance* comp = (ModelInstance*)c;
+    if (STATE_VECTOR_SIZE == 0) {
+        ERROR("fmi2GetFMUstate: function is not enabled.");
+        return fmi2Error;
+    }
+    if (nullPointer(comp, "fmi2GetFMUstate", "FMUstate", FMUstate)) {
+        return fmi2Error;
+    }
+
+    DO_FMI_DBG_LOG("fmi2GetFMUstate\n");
+    TRACE("fmi2GetFMUstate");
+    /* get state not implemented */    
+
+    return fmi2OK;
+}
+
+fmi2Status fmi2SetFMUstate (fmi2Component c, fmi2FMUstate FMUstate)
+{
+    ModelInstance* comp = (ModelInstance*)c;
+    if (STATE_VECTOR_SIZE == 0) {
+        ERROR("fmi2SetFMUstate: function is not enabled.");
+        return fmi2Error;
+    }
+    if (nullPointer(comp, "fmi2SetFMUstate", "FMUstate", FMUstate)) {
+        return fmi2Error;
+    }
+    DO_FMI_DBG_LOG("fmi2SetFMUstate\n");
+    TRACE("fmi2SetFMUstate");
+    /* set state not implemented */
+
+    return fmi2OK;
+}
+
+fmi2Status fmi2FreeFMUstate(fmi2Component c, fmi2FMUstate* FMUstate)
+{
+    ModelInstance* comp = (ModelInstance*)c;
+    if (STATE_VECTOR_SIZE == 0) {
+        ERROR("fmi2FreeFMUstate: function is not enabled.");
+        return fmi2Error;
+    }
+    if (nullPointer(comp, "fmi2FreeFMUstate", "FMUstate", FMUstate)) {
+        return fmi2Error;
+    }
+
+    DO_FMI_DBG_LOG("fmi2FreeFMUstate\n");
+    TRACE("fmi2FreeFMUstate");   
+    if (*FMUstate != NULL) {
+        comp->functions->freeMemory(*FMUstate);
+        *FMUstate = NULL;
+    }
+    
+    return fmi2OK;
+}
+
+fmi2Status fmi2SerializedFMUstateSize(fmi2Component c, fmi2FMUstate FMUstate, size_t *size)
+{
+    ModelInstance* comp = (ModelInstance*)c;
+    if (STATE_VECTOR_SIZE == 0) {
+        ERROR("fmi2SerializedFMUstateSize: function is not enabled.");
+        return fmi2Error;
+    }
+    if (nullPointer(comp, "fmi2SerializedFMUstateSize", "FMUstate", FMUstate)) {
+        return fmi2Error;
+    }
+    if (nullPointer(comp, "fmi2SerializedFMUstateSize", "size", size)) {
+        return fmi2Error;   
+    }
+    
+    DO_FMI_DBG_LOG("fmi2SerializedFMUstateSize\n");
+    TRACE("fmi2SerializedFMUstateSize");
+    *size = STATE_VECTOR_SIZE;
+    
+    return fmi2OK;
+}
+
+#ifndef wu_serialize_states_module0_oper_for_fmu
+#define wu_serialize_states_module0_oper_for_fmu(state_D, state_S, state_sz) (memcpy((state_D), (state_S), (state_sz)))
+#endif /* wu_serialize_states_module0_oper_for_fmu */
+
+fmi2Status fmi2SerializeFMUstate(fmi2Component c, fmi2FMUstate FMUstate, fmi2Byte serializedState[], size_t size)
+{
+    ModelInstance* comp = (ModelInstance*)c;
+    if (STATE_VECTOR_SIZE == 0) {
+        ERROR("fmi2SerializeFMUstate: function is not enabled.");
+        return fmi2Error;
+    }
+    if (nullPointer(comp, "fmi2SerializeFMUstate", "FMUstate", FMUstate)) {
+        return fmi2Error;
+    }
+    if (nullPointer(comp, "fmi2SerializeFMUstate", "serializedState", serializedState)) {
+        return fmi2Error;   
+    }
+
+    DO_FMI_DBG_LOG("fmi2SerializeFMUstate\n");
+    TRACE("fmi2SerializeFMUstate");   
+    if (size != STATE_VECTOR_SIZE) {
+        ERROR_F("fmi2SerializeFMUstate: Invalid input FMUstate size %d in regarding the internal size %d", size, STATE_VECTOR_SIZE);
+        return fmi2Error;
+    }
+    wu_serialize_states_module0_oper_for_fmu(serializedState, FMUstate, size);
+    
+    return fmi2OK;
+}
+
+#ifndef wu_deserialize_states_module0_oper_for_fmu
+#define wu_deserialize_states_module0_oper_for_fmu(state_D, state_S, state_sz) (memcpy((state_D), (state_S), (state_sz)))
+#endif /* wu_deserialize_states_module0_oper_for_fmu */
+
+fmi2Status fmi2DeSerializeFMUstate(fmi2Component c, const fmi2Byte serializedState[], size_t size,
+                                    fmi2FMUstate* FMUstate)
+{    
+    ModelInstance* comp = (ModelInstance*)c;
+    if (STATE_VECTOR_SIZE == 0) {
+        ERROR("fmi2DeSerializeFMUstate: function is not enabled.");
+        return fmi2Error;
+    }
+    if (nullPointer(comp, "fmi2DeSerializeFMUstate", "serializedState", serializedState)) {
+        return fmi2Error;
+    }
+    if (nullPointer(comp, "fmi2DeSerializeFMUstate", "FMUstate", FMUstate)) {
+        return fmi2Error;
+    }
+
+    DO_FMI_DBG_LOG("fmi2DeSerializeFMUstate\n");
+    TRACE("fmi2DeSerializeFMUstate");
+    if (size != STATE_VECTOR_SIZE) {
+        ERROR_F("fmi2DeSerializeFMUstate: Invalid input FMUstate size %d in regarding the internal size %d", size, STATE_VECTOR_SIZE);
+        return fmi2Error;
+    }       
+    if (*FMUstate == NULL) {
+        *FMUstate = (fmi2FMUstate)comp->functions->allocateMemory(1, STATE_VECTOR_SIZE);
+    }   
+    wu_deserialize_states_module0_oper_for_fmu(*FMUstate, serializedState, size); 
+
+    return fmi2OK;
+}
+
+fmi2Status fmi2GetDirectionalDerivative(fmi2Component c, const fmi2ValueReference vUnknown_ref[], size_t nUnknown,
+                                        const fmi2ValueReference vKnown_ref[] , size_t nKnown,
+                                        const fmi2Real dvKnown[], fmi2Real dvUnknown[])
+{
+    ModelInstance* comp = (ModelInstance *)c;
+    
+    DO_FMI_DBG_LOG("fmi2GetDirectionalDerivative\n");
+    TRACE("fmi2GetDirectionalDerivative");
+    
+    ENSURE_USED(vUnknown_ref);
+    ENSURE_USED(nUnknown);
+    ENSURE_USED(vKnown_ref);
+    ENSURE_USED(nKnown);
+    ENSURE_USED(dvKnown);
+    ENSURE_USED(dvUnknown);
+    return fmi2OK;
+}
+
+
+/* ---------------------------------------------------------------------------
+ * FMI functions
+ * ---------------------------------------------------------------------------*/
+
+fmi2Component fmi2Instantiate(fmi2String instanceName, fmi2Type fmuType, fmi2String GUID,
+                            fmi2String fmuResourceLocation, const fmi2CallbackFunctions *functions,
+                            fmi2Boolean visible, fmi2Boolean loggingOn)
+{
+    ModelInstance* comp;
+    ENSURE_USED(fmuResourceLocation);
+    ENSURE_USED(visible);
+    
+    OPEN_FMI_DBG_LOG();
+    DO_FMI_DBG_LOG("fmi2Instantiate: GUID=%s\n", GUID);
+
+    if (!functions->logger) 
+        return NULL;
+    if (!functions->allocateMemory || !functions->freeMemory) {
+        functions->logger(functions->componentEnvironment, instanceName, fmi2Error, "error", "fmi2Instantiate: missing callback function.");
+        return NULL;
+    }
+    if (!instanceName || !(*instanceName)) {
+        functions->logger(functions->componentEnvironment, instanceName, fmi2Error, "error", "fmi2Instantiate: missing instance name.");
+        return NULL;
+    }
+    if (strcmp(GUID, MODEL_GUID)) {
+        functions->logger(functions->componentEnvironment, instanceName, fmi2Error, "error", "fmi2Instantiate: wrong GUID %s. Expected %s.", GUID, MODEL_GUID);
+        return NULL;
+    }
+    comp = (ModelInstance *)functions->allocateMemory(1, sizeof(ModelInstance));
+    if (!comp) {
+        functions->logger(functions->componentEnvironment, instanceName, fmi2Error, "error", "fmi2Instantiate: out of memory.");
+        return NULL;
+    }
+    /* Allocate KCG context */
+    comp->context = (void*)functions->allocateMemory(1, sizeof(SCADE_module0_oper_for_fmu));
+    comp->instanceName = (fmi2String)functions->allocateMemory(strlen(instanceName)+1, sizeof(char));
+    strcpy((char*)comp->instanceName, instanceName);
+    comp->GUID = (fmi2String)functions->allocateMemory(strlen(GUID)+1, sizeof(char));
+    strcpy((char*)comp->GUID, GUID);
+    comp->functions = functions;
+    comp->loggingOn = loggingOn;
+    comp->initTime = 0.0;
+    comp->currentTime = 0.0;
+    comp->nextTime = 0.0;
+    comp->initDone = fmi2False;
+    TRACE_F("fmi2Instantiate: GUID=%s", GUID);
+
+    /* Set KCG context variables to clean initial values */
+    sensor_int_module0 = (swan_uint8)0;
+    sensor_enum_module0 = (t_enum1_module0)0;
+    sensor_variant_module0.F.swan_tag = (kind_t_variant1_module0)0;
+    sensor_variant_module0.F.swan_value = (swan_float32)0.0;
+    sensor_variant_module0.I.swan_tag = (kind_t_variant1_module0)0;
+    sensor_variant_module0.I.swan_value = (swan_int32)0;
+    sensor_array_module0[0] = (swan_float32)0.0;
+    sensor_array_module0[1] = (swan_float32)0.0;
+    sensor_array_module0[2] = (swan_float32)0.0;
+    sensor_struct_module0.a = (swan_int8)0;
+    sensor_struct_module0.b = (swan_float32)0.0;
+    sensor_syn_module0 = (swan_uint8)0;
+    sensor_float_module0 = (swan_float32)0.0;
+    sensor_bool_module0 = (swan_bool)fmi2False;
+    comp->context->i0 = (swan_int32)0;
+    comp->context->i1[0] = (swan_float32)0.0;
+    comp->context->i1[1] = (swan_float32)0.0;
+    comp->context->i1[2] = (swan_float32)0.0;
+    comp->context->g1_i2 = (swan_int8)0;
+    comp->context->g2_i2 = (swan_float32)0.0;
+    comp->context->i3.a = (swan_int8)0;
+    comp->context->i3.b = (swan_float32)0.0;
+    comp->context->g1_i4 = (swan_int32)0;
+    comp->context->g2_i4 = (swan_bool)fmi2False;
+    comp->context->g3_i4 = (swan_uint8)0;
+    comp->context->i5 = (t_enum1_module0)0;
+    comp->context->i6 = (swan_uint8)0;
+    comp->context->i7.F.swan_tag = (kind_t_variant1_module0)0;
+    comp->context->i7.F.swan_value = (swan_float32)0.0;
+    comp->context->i7.I.swan_tag = (kind_t_variant1_module0)0;
+    comp->context->i7.I.swan_value = (swan_int32)0;
+    comp->context->i8[0][0][0].a = (swan_int8)0;
+    comp->context->i8[0][0][0].b = (swan_float32)0.0;
+    comp->context->i8[0][0][1].a = (swan_int8)0;
+    comp->context->i8[0][0][1].b = (swan_float32)0.0;
+    comp->context->i8[0][0][2].a = (swan_int8)0;
+    comp->context->i8[0][0][2].b = (swan_float32)0.0;
+    comp->context->i8[0][0][3].a = (swan_int8)0;
+    comp->context->i8[0][0][3].b = (swan_float32)0.0;
+    comp->context->i8[0][1][0].a = (swan_int8)0;
+    comp->context->i8[0][1][0].b = (swan_float32)0.0;
+    comp->context->i8[0][1][1].a = (swan_int8)0;
+    comp->context->i8[0][1][1].b = (swan_float32)0.0;
+    comp->context->i8[0][1][2].a = (swan_int8)0;
+    comp->context->i8[0][1][2].b = (swan_float32)0.0;
+    comp->context->i8[0][1][3].a = (swan_int8)0;
+    comp->context->i8[0][1][3].b = (swan_float32)0.0;
+    comp->context->i8[0][2][0].a = (swan_int8)0;
+    comp->context->i8[0][2][0].b = (swan_float32)0.0;
+    comp->context->i8[0][2][1].a = (swan_int8)0;
+    comp->context->i8[0][2][1].b = (swan_float32)0.0;
+    comp->context->i8[0][2][2].a = (swan_int8)0;
+    comp->context->i8[0][2][2].b = (swan_float32)0.0;
+    comp->context->i8[0][2][3].a = (swan_int8)0;
+    comp->context->i8[0][2][3].b = (swan_float32)0.0;
+    comp->context->i8[1][0][0].a = (swan_int8)0;
+    comp->context->i8[1][0][0].b = (swan_float32)0.0;
+    comp->context->i8[1][0][1].a = (swan_int8)0;
+    comp->context->i8[1][0][1].b = (swan_float32)0.0;
+    comp->context->i8[1][0][2].a = (swan_int8)0;
+    comp->context->i8[1][0][2].b = (swan_float32)0.0;
+    comp->context->i8[1][0][3].a = (swan_int8)0;
+    comp->context->i8[1][0][3].b = (swan_float32)0.0;
+    comp->context->i8[1][1][0].a = (swan_int8)0;
+    comp->context->i8[1][1][0].b = (swan_float32)0.0;
+    comp->context->i8[1][1][1].a = (swan_int8)0;
+    comp->context->i8[1][1][1].b = (swan_float32)0.0;
+    comp->context->i8[1][1][2].a = (swan_int8)0;
+    comp->context->i8[1][1][2].b = (swan_float32)0.0;
+    comp->context->i8[1][1][3].a = (swan_int8)0;
+    comp->context->i8[1][1][3].b = (swan_float32)0.0;
+    comp->context->i8[1][2][0].a = (swan_int8)0;
+    comp->context->i8[1][2][0].b = (swan_float32)0.0;
+    comp->context->i8[1][2][1].a = (swan_int8)0;
+    comp->context->i8[1][2][1].b = (swan_float32)0.0;
+    comp->context->i8[1][2][2].a = (swan_int8)0;
+    comp->context->i8[1][2][2].b = (swan_float32)0.0;
+    comp->context->i8[1][2][3].a = (swan_int8)0;
+    comp->context->i8[1][2][3].b = (swan_float32)0.0;
+    comp->context->o0 = (swan_int32)0;
+    comp->context->o1 = (swan_float32)0.0;
+    comp->context->o2 = (swan_bool)fmi2False;
+    comp->context->g1_o3 = (swan_int8)0;
+    comp->context->g2_o3 = (swan_float32)0.0;
+    comp->context->o4.a = (swan_int8)0;
+    comp->context->o4.b = (swan_float32)0.0;
+    comp->context->o5[0] = (swan_bool)fmi2False;
+    comp->context->o5[1] = (swan_bool)fmi2False;
+    comp->context->g1_o6 = (swan_int32)0;
+    comp->context->g2_o6 = (swan_bool)fmi2False;
+    comp->context->g3_o6 = (swan_uint8)0;
+    comp->context->o7 = (t_enum1_module0)0;
+    comp->context->o8 = (swan_uint8)0;
+    comp->context->o9.F.swan_tag = (kind_t_variant1_module0)0;
+    comp->context->o9.F.swan_value = (swan_float32)0.0;
+    comp->context->o9.I.swan_tag = (kind_t_variant1_module0)0;
+    comp->context->o9.I.swan_value = (swan_int32)0;
+    comp->context->o10[0][0][0].a = (swan_int8)0;
+    comp->context->o10[0][0][0].b = (swan_float32)0.0;
+    comp->context->o10[0][0][1].a = (swan_int8)0;
+    comp->context->o10[0][0][1].b = (swan_float32)0.0;
+    comp->context->o10[0][0][2].a = (swan_int8)0;
+    comp->context->o10[0][0][2].b = (swan_float32)0.0;
+    comp->context->o10[0][0][3].a = (swan_int8)0;
+    comp->context->o10[0][0][3].b = (swan_float32)0.0;
+    comp->context->o10[0][1][0].a = (swan_int8)0;
+    comp->context->o10[0][1][0].b = (swan_float32)0.0;
+    comp->context->o10[0][1][1].a = (swan_int8)0;
+    comp->context->o10[0][1][1].b = (swan_float32)0.0;
+    comp->context->o10[0][1][2].a = (swan_int8)0;
+    comp->context->o10[0][1][2].b = (swan_float32)0.0;
+    comp->context->o10[0][1][3].a = (swan_int8)0;
+    comp->context->o10[0][1][3].b = (swan_float32)0.0;
+    comp->context->o10[0][2][0].a = (swan_int8)0;
+    comp->context->o10[0][2][0].b = (swan_float32)0.0;
+    comp->context->o10[0][2][1].a = (swan_int8)0;
+    comp->context->o10[0][2][1].b = (swan_float32)0.0;
+    comp->context->o10[0][2][2].a = (swan_int8)0;
+    comp->context->o10[0][2][2].b = (swan_float32)0.0;
+    comp->context->o10[0][2][3].a = (swan_int8)0;
+    comp->context->o10[0][2][3].b = (swan_float32)0.0;
+    comp->context->o10[1][0][0].a = (swan_int8)0;
+    comp->context->o10[1][0][0].b = (swan_float32)0.0;
+    comp->context->o10[1][0][1].a = (swan_int8)0;
+    comp->context->o10[1][0][1].b = (swan_float32)0.0;
+    comp->context->o10[1][0][2].a = (swan_int8)0;
+    comp->context->o10[1][0][2].b = (swan_float32)0.0;
+    comp->context->o10[1][0][3].a = (swan_int8)0;
+    comp->context->o10[1][0][3].b = (swan_float32)0.0;
+    comp->context->o10[1][1][0].a = (swan_int8)0;
+    comp->context->o10[1][1][0].b = (swan_float32)0.0;
+    comp->context->o10[1][1][1].a = (swan_int8)0;
+    comp->context->o10[1][1][1].b = (swan_float32)0.0;
+    comp->context->o10[1][1][2].a = (swan_int8)0;
+    comp->context->o10[1][1][2].b = (swan_float32)0.0;
+    comp->context->o10[1][1][3].a = (swan_int8)0;
+    comp->context->o10[1][1][3].b = (swan_float32)0.0;
+    comp->context->o10[1][2][0].a = (swan_int8)0;
+    comp->context->o10[1][2][0].b = (swan_float32)0.0;
+    comp->context->o10[1][2][1].a = (swan_int8)0;
+    comp->context->o10[1][2][1].b = (swan_float32)0.0;
+    comp->context->o10[1][2][2].a = (swan_int8)0;
+    comp->context->o10[1][2][2].b = (swan_float32)0.0;
+    comp->context->o10[1][2][3].a = (swan_int8)0;
+    comp->context->o10[1][2][3].b = (swan_float32)0.0;
+    comp->period = 0.02;
+
+    return comp;
+}
+
+fmi2Status fmi2SetupExperiment(fmi2Component c, fmi2Boolean toleranceDefined, fmi2Real tolerance,
+                            fmi2Real startTime, fmi2Boolean stopTimeDefined, fmi2Real stopTime)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+
+    DO_FMI_DBG_LOG("fmi2SetupExperiment startTime=%.17g, stopTimeDefined=%s, stopTime=%.17g\n", startTime, stopTimeDefined ? "true" : "false", stopTime);
+    TRACE_F("fmi2SetupExperiment: startTime=%.17g, stopTimeDefined=%s, stopTime=%.17g", startTime, stopTimeDefined ? "true" : "false", stopTime);
+
+    comp->initTime = startTime;
+    comp->nextTime = startTime;
+    return fmi2OK;
+}
+
+fmi2Status fmi2EnterInitializationMode(fmi2Component c)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+
+    DO_FMI_DBG_LOG("fmi2EnterInitializationMode\n");
+    TRACE("fmi2EnterInitializationMode");
+ 
+    return fmi2OK;
+}
+
+fmi2Status fmi2ExitInitializationMode(fmi2Component c)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+
+    DO_FMI_DBG_LOG("fmi2ExitInitializationMode\n");
+    TRACE("fmi2ExitInitializationMode");
+
+    return fmi2OK;
+}
+
+fmi2Status fmi2Terminate(fmi2Component c)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+    
+    DO_FMI_DBG_LOG("fmi2Terminate\n");
+    TRACE("fmi2Terminate");
+    
+    terminate(comp);
+    return fmi2OK;
+}
+
+fmi2Status fmi2Reset(fmi2Component c)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+
+    DO_FMI_DBG_LOG("fmi2Reset\n");
+    TRACE("fmi2Reset");
+    
+    // Stop scenario recording & SCADE co-simulation
+    terminate(comp);
+    // Force reinitialization at next eventUpdate()/doStep()
+    comp->initDone = fmi2False; 
+    return fmi2OK;
+}
+
+void fmi2FreeInstance(fmi2Component c)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+
+    DO_FMI_DBG_LOG("fmi2FreeInstance\n");
+    TRACE("fmi2FreeInstance");
+
+    if (comp != NULL) {
+        if (comp->context) {
+            comp->functions->freeMemory(comp->context);
+        }
+        comp->functions->freeMemory((char*)comp->instanceName);
+        comp->functions->freeMemory((char*)comp->GUID);
+        comp->functions->freeMemory(comp);
+    }
+
+    CLOSE_FMI_DBG_LOG();
+}
+
+// ---------------------------------------------------------------------------
+// FMI functions: only for Co-Simulation 2.0
+// ---------------------------------------------------------------------------
+
+/* Simulating the slave */
+fmi2Status fmi2SetRealInputDerivatives(fmi2Component c, const fmi2ValueReference vr[], size_t nvr,
+                                     const fmi2Integer order[], const fmi2Real value[])
+{
+    ModelInstance* comp = (ModelInstance *)c;
+    ENSURE_USED(vr);
+    ENSURE_USED(order);
+    ENSURE_USED(value);
+
+    DO_FMI_DBG_LOG("fmi2SetRealInputDerivatives: nvr=%u\n", nvr);
+    TRACE("fmi2SetRealInputDerivatives");
+
+    if (nvr!=0) {
+        ERROR("This model cannot interpolate inputs");
+        return fmi2Error;
+    }
+    return fmi2OK;
+}
+
+fmi2Status fmi2GetRealOutputDerivatives(fmi2Component c, const fmi2ValueReference vr[], size_t nvr,
+                                      const fmi2Integer order[], fmi2Real value[])
+{
+    ModelInstance* comp = (ModelInstance *)c;
+    ENSURE_USED(vr);
+    ENSURE_USED(order);
+    ENSURE_USED(value);
+
+    DO_FMI_DBG_LOG("fmi2GetRealOutputDerivatives: nvr=%u\n", nvr);
+    TRACE("fmi2GetRealOutputDerivatives");
+
+    if (nvr!=0) {
+        ERROR("This model cannot compute derivatives of outputs");
+        return fmi2Error;
+    }
+    return fmi2OK;
+}
+
+fmi2Status fmi2DoStep(fmi2Component c, fmi2Real time, fmi2Real step, fmi2Boolean newStep)
+{
+    ModelInstance *comp = (ModelInstance *)c;
+    fmi2Real finalTime = time + step;
+
+    DO_FMI_DBG_LOG("fmi2DoStep: time=%.17g step=%.17g newStep=%s\n", time, step, newStep ? "true" : "false");
+    TRACE_F("fmi2DoStep: time=%.17g step=%.17g newStep=%s", time, step, newStep?"true":"false");
+
+    /*if (newStep == fmi2False) {
+        ERROR("This FMU does not support rollbacks.");
+        return fmi2Error;
+    }*/
+
+    /* check period first */
+    if (comp->period < 1e-8) {
+        comp->period = TASK_PERIOD;
+    }
+    if (!comp->initDone) {
+        DO_FMI_DBG_LOG("First step => SCADE initialization\n");
+        /* Perform initialization at beginning */
+        /* no context to initialize */
+        comp->initDone = fmi2True;
+    }
+    if (comp->nextTime >= finalTime + 100 * __DBL_EPSILON__) {
+        DO_FMI_DBG_LOG("** nextTime=%.17g, finalTime=%.17g => no SCADE cycle\n", comp->nextTime, finalTime);
+    }
+    else {
+        while (comp->nextTime < finalTime + 100 * __DBL_EPSILON__) {
+            DO_FMI_DBG_LOG("nextTime=%.17g, finalTime=%.17g => SCADE cycle\n", comp->nextTime, finalTime);
+            /* Executing SCADE cycle */
+            oper_for_fmu_module0(comp->context->i0, (const array_float32_3 *)&comp->context->i1, comp->context->g1_i2, comp->context->g2_i2, (const t_struct1_module0 *)&comp->context->i3, comp->context->g1_i4, comp->context->g2_i4, comp->context->g3_i4, comp->context->i5, comp->context->i6, (const t_variant1_module0 *)&comp->context->i7, (const array_1 *)&comp->context->i8, &comp->context->o0, &comp->context->o1, &comp->context->o2, &comp->context->g1_o3, &comp->context->g2_o3, &comp->context->o4, &comp->context->o5, &comp->context->g1_o6, &comp->context->g2_o6, &comp->context->g3_o6, &comp->context->o7, &comp->context->o8, &comp->context->o9, &comp->context->o10);
+            comp->nextTime += comp->period;
+        }
+    }
+
+    return fmi2OK;
+}
+
+fmi2Status fmi2CancelStep(fmi2Component c)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+
+    DO_FMI_DBG_LOG("fmi2CancelStep\n");
+    ERROR("fmi2CancelStep should not be called as fmi2DoStep never returns fmiPending");
+
+    return fmi2Error;
+}
+
+fmi2Status fmi2GetStatus(fmi2Component c, const fmi2StatusKind s, fmi2Status* value)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+    ENSURE_USED(s);
+    ENSURE_USED(value);
+
+    DO_FMI_DBG_LOG("fmi2GetStatus\n");
+    ERROR("fmi2GetStatus: this function should not be called as fmiDoStep never returns fmiPending");
+
+    return fmi2Error;
+}
+
+fmi2Status fmi2GetRealStatus(fmi2Component c, const fmi2StatusKind s, fmi2Real* value)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+    ENSURE_USED(s);
+    ENSURE_USED(value);
+
+    DO_FMI_DBG_LOG("fmi2GetRealStatus\n");
+    ERROR("fmi2GetRealStatus: this function should not be called as fmiDoStep never returns fmiPending");
+
+    return fmi2Error;
+}
+
+fmi2Status fmi2GetIntegerStatus(fmi2Component c, const fmi2StatusKind s, fmi2Integer* value)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+    ENSURE_USED(s);
+    ENSURE_USED(value);
+
+    DO_FMI_DBG_LOG("fmi2GetIntegerStatus\n");
+    ERROR("fmi2GetIntegerStatus: this function should not be called as fmiDoStep never returns fmiPending");
+
+    return fmi2Error;
+}
+
+fmi2Status fmi2GetBooleanStatus(fmi2Component c, const fmi2StatusKind s, fmi2Boolean* value)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+
+    DO_FMI_DBG_LOG("fmi2GetBooleanStatus\n");
+
+    if (s == fmi2Terminated) {
+        TRACE("fmi2GetBooleanStatus");
+        *value = fmi2False;
+        return fmi2OK;
+    } else {
+        ERROR("fmi2GetBooleanStatus: this function should not be called as fmiDoStep never returns fmiPending");
+    }
+    return fmi2Error;
+}
+
+FMI2_Export fmi2Status fmi2GetStringStatus(fmi2Component c, const fmi2StatusKind s, fmi2String*  value)
+{
+    ModelInstance* comp = (ModelInstance *)c;
+    ENSURE_USED(s);
+    ENSURE_USED(value);
+
+    DO_FMI_DBG_LOG("fmi2GetStringStatus\n");
+    ERROR("fmi2GetStringStatus: this function should not be called as fmiDoStep never returns fmiPending");
+
+    return fmi2Error;
+}
+
+
+/******************* Ansys Scade One FMI wrapper ***************
+** End of file module0_oper_for_fmu_FMU.c
+****************************************************************/
\ No newline at end of file
@@ -0,0 +1,47 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0777 - Prerelease 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_oper_for_fmu_module0_H_
+#define SWAN_oper_for_fmu_module0_H_
+
+#include "swan_types.h"
+
+/* module0::oper_for_fmu */
+extern void oper_for_fmu_module0(
+  /* i0 */swan_int32 i0,
+  /* i1 */
+  const array_float32_3 *i1,
+  swan_int8 g1_i2,
+  swan_float32 g2_i2,
+  /* i3 */
+  const t_struct1_module0 *i3,
+  swan_int32 g1_i4,
+  swan_bool g2_i4,
+  swan_uint8 g3_i4,
+  /* i5 */t_enum1_module0 i5,
+  /* i6 */t_syn1_module0 i6,
+  /* i7 */
+  const t_variant1_module0 *i7,
+  /* i8 */
+  const array_1 *i8,
+  /* o0 */swan_int32 * restrict o0,
+  /* o1 */swan_float32 * restrict o1,
+  /* o2 */swan_bool * restrict o2,
+  swan_int8 * restrict g1_o3,
+  swan_float32 * restrict g2_o3,
+  /* o4 */t_struct1_module0 * restrict o4,
+  /* o5 */array_bool_2 * restrict o5,
+  swan_int32 * restrict g1_o6,
+  swan_bool * restrict g2_o6,
+  swan_uint8 * restrict g3_o6,
+  /* o7 */t_enum1_module0 * restrict o7,
+  /* o8 */t_syn1_module0 * restrict o8,
+  /* o9 */t_variant1_module0 * restrict o9,
+  /* o10 */array_1 * restrict o10);
+
+
+
+#endif /* SWAN_oper_for_fmu_module0_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0777 - Prerelease 
+** oper_for_fmu_module0.h
+*************************************************************$ */
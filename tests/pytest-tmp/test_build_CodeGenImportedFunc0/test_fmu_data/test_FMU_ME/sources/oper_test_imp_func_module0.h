@@ -0,0 +1,22 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0351 - Prerelease 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_oper_test_imp_func_module0_H_
+#define SWAN_oper_test_imp_func_module0_H_
+
+#include "swan_types.h"
+
+/* module0::oper_test_imp_func */
+extern void oper_test_imp_func_module0(
+  /* i0 */
+  const array_int32_4 *i0,
+  /* o0 */array_int32_4 * restrict o0,
+  /* o1 */array_int32_4 * restrict o1,
+  /* o2 */array_int32_4 * restrict o2);
+
+
+
+#endif /* SWAN_oper_test_imp_func_module0_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0351 - Prerelease 
+** oper_test_imp_func_module0.h
+*************************************************************$ */
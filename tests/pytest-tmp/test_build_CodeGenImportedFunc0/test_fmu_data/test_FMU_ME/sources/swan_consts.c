@@ -0,0 +1,8 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0351 - Prerelease 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#include "swan_consts.h"
+
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0351 - Prerelease 
+** swan_consts.c
+*************************************************************$ */
@@ -0,0 +1,36 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0351 - Prerelease 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_IMPORTED_FUNCTIONS_H_
+#define SWAN_IMPORTED_FUNCTIONS_H_
+
+#include "swan_types.h"
+
+#ifndef static_lib_module0
+/* module0::static_lib */
+extern void static_lib_module0(
+  /* i1 */
+  const array_int32_4 *i1,
+  /* o1 */array_int32_4 * restrict o1);
+#endif /* static_lib_module0 */
+
+#ifndef link_obj_module0
+/* module0::link_obj */
+extern void link_obj_module0(
+  /* i1 */
+  const array_int32_4 *i1,
+  /* o1 */array_int32_4 * restrict o1);
+#endif /* link_obj_module0 */
+
+#ifndef oper_imp_func_module0
+/* module0::oper_imp_func */
+extern void oper_imp_func_module0(
+  /* i1 */
+  const array_int32_4 *i1,
+  /* o1 */array_int32_4 * restrict o1);
+#endif /* oper_imp_func_module0 */
+
+#endif /* SWAN_IMPORTED_FUNCTIONS_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.4.0 - Build 0351 - Prerelease 
+** swan_imported_functions.h
+*************************************************************$ */
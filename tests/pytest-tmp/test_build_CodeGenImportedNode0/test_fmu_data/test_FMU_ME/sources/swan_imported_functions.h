@@ -0,0 +1,17 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0420 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_IMPORTED_FUNCTIONS_H_
+#define SWAN_IMPORTED_FUNCTIONS_H_
+
+#include "swan_types.h"
+
+#ifndef oper_imp_func_module0
+
+extern void oper_imp_func_module0(const array_int32_4 *i1, array_int32_4 *o1);
+#endif /* oper_imp_func_module0 */
+
+#endif /* SWAN_IMPORTED_FUNCTIONS_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0420 
+** swan_imported_functions.h
+*************************************************************$ */
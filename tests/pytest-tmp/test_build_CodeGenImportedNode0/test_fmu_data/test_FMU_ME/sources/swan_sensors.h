@@ -0,0 +1,12 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0420 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_SENSORS_H_
+#define SWAN_SENSORS_H_
+
+#include "swan_types.h"
+
+#endif /* SWAN_SENSORS_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0420 
+** swan_sensors.h
+*************************************************************$ */
@@ -0,0 +1,23 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0420 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#include "swan_consts.h"
+#include "swan_sensors.h"
+#include "oper_no_output_module0.h"
+
+
+void oper_no_output_module0(swan_int32 i0)
+{
+  swan_bool sig1;
+
+  sig1 = swan_false;
+  if (i0 > swan_lit_int32(0)) {
+    sig1 = swan_true;
+  }
+}
+
+
+
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0420 
+** oper_no_output_module0.c
+*************************************************************$ */
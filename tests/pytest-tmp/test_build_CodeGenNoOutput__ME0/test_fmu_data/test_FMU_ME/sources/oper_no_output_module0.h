@@ -0,0 +1,17 @@
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0420 
+** Command: swan_cg.exe config.json
+*************************************************************$ */
+#ifndef SWAN_oper_no_output_module0_H_
+#define SWAN_oper_no_output_module0_H_
+
+#include "swan_types.h"
+
+
+extern void oper_no_output_module0(swan_int32 i0);
+
+
+
+#endif /* SWAN_oper_no_output_module0_H_ */
+/* $ Ansys Scade One - Swan Code Generator - Version 2.2.0 - Build 0420 
+** oper_no_output_module0.h
+*************************************************************$ */
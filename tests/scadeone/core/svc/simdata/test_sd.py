@@ -31,6 +31,7 @@ from os import remove
 import sys
 
 import ansys.scadeone.core.svc.simdata as sd
+import ansys.scadeone.core.svc.simdata.core.dll_wrap as dll_wrap
 from test_sd_common import create_test_file
 
 
@@ -283,6 +284,471 @@ def test_append_values_with_repeat_factor():
     remove(file_path)
 
 
+def test_append_value_after_repeated_sequence():
+    file_path: str = "test_append_value_after_repeated_sequence.sd"
+
+    f = sd.create_file(file_path)
+    e_sequences = f.add_element("testSequences", sd.Int32)
+    e_sequences.append_values_sequence([1], 3)
+    f.close()
+
+    # the last sequence is read from the reopened file
+    f1 = sd.edit_file(file_path)
+    e_sequences = f1.find_element("testSequences")
+    e_sequences.append_value(2)
+    e_sequences.append_value(3)
+    e_sequences.append_values_sequence([4, 5], 2)
+    e_sequences.append_value(6)
+    e_sequences.append_nones_sequence(1)
+    e_sequences.append_value(7)
+    f1.close()
+
+    f2 = sd.open_file(file_path)
+    e_seq = f2.find_element("testSequences")
+    values = [str(v) for v in e_seq.read_values()]
+    assert values == ["1", "1", "1", "2", "3", "4", "5", "4", "5", "6", str(sd.NoneValue()), "7"]
+    f2.close()
+    remove(file_path)
+
+
+def test_append_array():
+    np = pytest.importorskip("numpy")
+    file_path: str = "test_append_array.sd"
+
+    f = sd.create_file(file_path)
+    e_scalars = f.add_element("scalars", sd.Int16)
+    e_scalars.append_values_sequence([1], 2)
+    e_scalars.append_array(np.arange(3))
+    e_scalars.append_array(np.array([7], dtype=np.int16), 2)
+    e_scalars.append_array(np.array([8, 9], dtype=np.int16))
+    e_floats = f.add_element("floats", sd.Float32)
+    e_floats.append_array(np.array([0.5, 2]))
+    e_arrays = f.add_element("arrays", sd.create_array_type(sd.Float64, [2, 3]))
+    e_arrays.append_array(np.arange(12, dtype=np.float64).reshape(2, 2, 3))
+    e_bools = f.add_element("bools", sd.Bool)
+    e_bools.append_array(np.array([True, False]))
+    with pytest.raises(ScadeOneException):
+        e_scalars.append_array(np.array([40000]))  # exceeds maximum value of int16
+    with pytest.raises(ScadeOneException):
+        e_scalars.append_array(np.array([1.5]))  # float value for int16
+    with pytest.raises(ScadeOneException):
+        e_arrays.append_array(np.zeros((2, 3)))  # missing values dimension
+    with pytest.raises(ScadeOneException):
+        e_arrays.append_array(np.zeros((1, 2, 3)), 2)  # repeat factor for array type
+    with pytest.raises(ScadeOneException):
+        e_scalars.append_array(np.arange(3), 0)  # invalid repeat factor
+    f.close()
+
+    f2 = sd.open_file(file_path)
+    assert [str(v) for v in f2.find_element("scalars").read_values()] == [
+        "1", "1", "0", "1", "2", "7", "7", "8", "9"
+    ]  # fmt: skip
+    assert [str(v) for v in f2.find_element("floats").read_values()] == ["0.5", "2"]
+    assert [str(v) for v in f2.find_element("arrays").read_values()] == [
+        "((0,1,2),(3,4,5))",
+        "((6,7,8),(9,10,11))",
+    ]
+    assert [str(v) for v in f2.find_element("bools").read_values()] == ["true", "false"]
+    f2.close()
+    remove(file_path)
+
+
+def test_value_codecs():
+    file_path: str = "test_value_codecs.sd"
+
+    enum_type = sd.create_enum_type(["Off", "On"], "Mode")
+    variant_type = sd.create_variant_type([("Some", sd.Int8), ("Nothing", None)], "Opt")
+    struct_type = sd.create_struct_type(
+        [("mode", enum_type), ("v", sd.create_array_type(sd.Float32, [2, 2])), ("o", variant_type)]
+    )
+    cases = [
+        (sd.Bool, [True, False], "false"),
+        (sd.Char, ["a", "b"], "'b'"),
+        (sd.Int8, [-128, 127], "127"),
+        (sd.UInt16, [0, 65535], "65535"),
+        (sd.Int64, [-(1 << 63), (1 << 63) - 1], str((1 << 63) - 1)),
+        (sd.UInt64, [0, (1 << 64) - 1], str((1 << 64) - 1)),
+        (sd.Float64, [0.5, 2], "2"),
+        (enum_type, ["Off", "On"], "On"),
+        (variant_type, [("Some", 3), "Nothing"], "Nothing{}"),
+        (struct_type, [("On", [[1, 2], [3, 4]], ("Some", 1)), None], "none"),
+    ]
+    f = sd.create_file(file_path)
+    for i, (sd_type, py_values, _) in enumerate(cases):
+        elem = f.add_element(f"e{i}", sd_type)
+        elem.append_values_sequence(py_values[:1])
+        elem.append_value(py_values[1])
+    e_int = f.add_element("int", sd.Int8)
+    for invalid_values in ([1, 128], [1, True], [1.0]):
+        with pytest.raises(ScadeOneException):
+            e_int.append_values_sequence(invalid_values)
+    with pytest.raises(ScadeOneException, match="invalid value: 3 from"):
+        f.add_element("struct", struct_type).append_values_sequence([3])
+    f.close()
+
+    f2 = sd.open_file(file_path)
+    for i, (sd_type, py_values, expected) in enumerate(cases):
+        values = list(f2.find_element(f"e{i}").read_values())
+        # same values as the generic conversion
+        assert [str(v) for v in values][1] == expected
+    assert str(next(f2.find_element("e9").read_values())) == "(On,((1,2),(3,4)),Some{1})"
+    f2.close()
+    remove(file_path)
+
+
+def test_read_values_raw():
+    file_path: str = "test_read_values_raw.sd"
+
+    enum_type = sd.create_enum_type(["Off", "On"], "Mode")
+    variant_type = sd.create_variant_type([("Some", sd.Int8), ("Nothing", None)], "Opt")
+    struct_type = sd.create_struct_type(
+        [("mode", enum_type), ("v", sd.create_array_type(sd.Float32, [2, 2])), ("o", variant_type)]
+    )
+    cases = [
+        (sd.Bool, [True, None, False]),
+        (sd.Char, ["a", "b"]),
+        (sd.Int32, [-3, 0, 7]),
+        (sd.UInt64, [(1 << 64) - 1]),
+        (sd.Float64, [0.5, None, -2.25]),
+        (enum_type, ["Off", "On"]),
+        (variant_type, [("Some", 3), "Nothing"]),
+        (struct_type, [("On", ((1.0, 2.0), (3.0, 4.0)), ("Some", 1)), None]),
+    ]
+    f = sd.create_file(file_path)
+    for i, (sd_type, py_values) in enumerate(cases):
+        elem = f.add_element(f"e{i}", sd_type)
+        for py_value in py_values:
+            elem.append_value(py_value)
+    f.add_element("imported", sd.create_imported_type(2)).append_value(
+        (sd.core.sd_byte_t * 2)(1, 2)
+    )
+    f.close()
+
+    f2 = sd.open_file(file_path)
+    for i, (_, py_values) in enumerate(cases):
+        elem = f2.find_element(f"e{i}")
+        raw_values = list(elem.read_values(raw=True))
+        assert raw_values == py_values
+        assert raw_values == [v.to_python() for v in elem.read_values()]
+    assert list(f2.find_element("e2").read_values(start=1, n=1, raw=True)) == [0]
+    assert list(f2.find_element("imported").read_values(raw=True)) == [b"\x01\x02"]
+    f2.close()
+    remove(file_path)
+
+    value = sd.PredefinedInt32Value(sd.core.sd_int32_t(1))
+    with pytest.raises(AttributeError):
+        value.other = 2
+
+
+def test_append_array_compress():
+    np = pytest.importorskip("numpy")
+    file_path: str = "test_append_array_compress.sd"
+
+    def get_repeat_factors(elem):
+        repeat_factors = []
+        sequence_iter = dll_wrap.sdd_sequence_iter_create(elem.elem_id)
+        while sequence := dll_wrap.sdd_sequence_iter_get_sequence(sequence_iter):
+            repeat_factors.append(dll_wrap.sdd_sequence_get_repeat_factor(sequence))
+            dll_wrap.sdd_sequence_close(sequence)
+        return repeat_factors
+
+    steps = np.repeat(np.array([0.0, 1.5, -0.0, 0.0]), [100, 3, 50, 50])
+    masked = np.ma.MaskedArray(
+        [1, 1, 1, 1, 1, 2, 2, 3, 3, 3, 3, 3], mask=[0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 1]
+    )
+    f = sd.create_file(file_path)
+    e_steps = f.add_element("steps", sd.Float32)
+    e_steps.append_array(steps, compress=True)
+    assert get_repeat_factors(e_steps) == [100, 1, 50, 50]
+    e_masked = f.add_element("masked", sd.Int16)
+    e_masked.append_array(masked, compress=True)
+    assert get_repeat_factors(e_masked) == [1, 1, 1, 4, 1]
+    e_uncompressed = f.add_element("uncompressed", sd.Int16)
+    e_uncompressed.append_array(masked)
+    e_uncompressed.append_array(np.ones(5, dtype=np.int16), compress=True)
+    e_mode = f.add_element("mode", sd.create_enum_type(["Off", "On"]))
+    e_mode.append_array(np.array([1] * 6 + [0]), compress=True)
+    e_arrays = f.add_element("arrays", sd.create_array_type(sd.Int8, [2]))
+    e_arrays.append_array(
+        np.ma.MaskedArray(np.ones((4, 2), dtype=np.int8), mask=[[0, 0], [1, 1], [1, 1], [0, 0]]),
+        compress=True,  # only the nones
+    )
+    with pytest.raises(ScadeOneException):
+        e_arrays.append_array(np.ma.MaskedArray(np.ones((1, 2)), mask=[[0, 1]]))  # partial
+    f.close()
+
+    f2 = sd.open_file(file_path)
+    values = f2.find_element("steps").read_array()
+    assert (values.data.view(np.uint32) == steps.astype(np.float32).view(np.uint32)).all()
+    expected = [1, 1, None, None, 1, 2, 2, 3, 3, 3, 3, None]
+    assert f2.find_element("masked").read_array().tolist() == expected
+    assert f2.find_element("uncompressed").read_array().tolist() == expected + [1] * 5
+    assert f2.find_element("mode").read_array().tolist() == [1] * 6 + [0]
+    assert [str(v) for v in f2.find_element("mode").read_values()] == ["On"] * 6 + ["Off"]
+    assert f2.find_element("arrays").read_array().tolist() == [
+        [1, 1],
+        [None, None],
+        [None, None],
+        [1, 1],
+    ]
+    f2.close()
+    remove(file_path)
+
+
+def test_read_array():
+    np = pytest.importorskip("numpy")
+    file_path: str = "test_read_array.sd"
+
+    f = sd.create_file(file_path)
+    e_scalars = f.add_element("scalars", sd.UInt8)
+    e_scalars.append_values_sequence([1, 2])
+    e_scalars.append_nones_sequence(2)
+    e_scalars.append_values_sequence([3], 3)
+    e_arrays = f.add_element("arrays", sd.create_array_type(sd.Float32, [2]))
+    e_arrays.append_value([1.5, 2.5])
+    e_arrays.append_nones_sequence(1)
+    e_arrays.append_value([3.5, 4.5])
+    e_long = f.add_element("long", sd.Int64)
+    e_long.append_array(np.arange(10000))
+    f.add_element("chars", sd.Char)
+    f.close()
+
+    f2 = sd.open_file(file_path)
+    values = f2.find_element("scalars").read_array()
+    assert values.dtype == np.uint8
+    assert values.tolist() == [1, 2, None, None, 3, 3, 3]
+    assert f2.find_element("scalars").read_array(1, 2).tolist() == [2, None]
+    arrays = f2.find_element("arrays").read_array()
+    assert arrays.shape == (3, 2)
+    assert arrays.tolist() == [[1.5, 2.5], [None, None], [3.5, 4.5]]
+    assert (f2.find_element("long").read_array(start=5000) == np.arange(5000, 10000)).all()
+    assert f2.find_element("long").read_array(9990, 100).shape == (10,)
+    with pytest.raises(ScadeOneException):
+        f2.find_element("chars").read_array()  # unsupported type
+    f2.close()
+    remove(file_path)
+
+
+def test_struct_array():
+    np = pytest.importorskip("numpy")
+    file_path: str = "test_struct_array.sd"
+
+    enum_type = sd.create_enum_type(["Off", "On", "Fault"], "Mode")
+    inner_type = sd.create_struct_type(
+        [("x", sd.Int16), ("v", sd.create_array_type(sd.Float32, [3]))], "Inner"
+    )
+    struct_type = sd.create_struct_type(
+        [("b", sd.Bool), ("inner", inner_type), ("mode", enum_type), ("d", sd.Float64)], "S"
+    )
+    dtype = sd.numpy_dtype(struct_type)
+    assert dtype.names == ("b", "inner", "mode", "d")
+    assert dtype["inner"]["v"].shape == (3,)
+    assert dtype.itemsize == 31  # packed, as the native memory
+    assert sd.numpy_enum_tables(struct_type) == {"mode": {0: "Off", 1: "On", 2: "Fault"}}
+    with pytest.raises(ScadeOneException):
+        sd.numpy_dtype(sd.Char)
+
+    values = np.zeros(4, dtype)
+    values["b"] = [True, False, True, False]
+    values["inner"]["x"] = np.arange(4)
+    values["inner"]["v"] = np.arange(12).reshape(4, 3)
+    values["mode"] = [0, 1, 2, 1]
+    values["d"] = np.linspace(0.0, 1.0, 4)
+
+    f = sd.create_file(file_path)
+    e_struct = f.add_element("struct", struct_type)
+    e_struct.append_array(values)
+    e_struct.append_nones_sequence(1)
+    # converted field by field
+    other_dtype = np.dtype(
+        [("b", "?"), ("inner", [("x", "i8"), ("v", "f8", (3,))]), ("mode", "i4"), ("d", "f4")],
+        align=True,
+    )
+    e_struct.append_array(values[:1].astype(other_dtype))
+    with pytest.raises(ScadeOneException):
+        e_struct.append_array(np.zeros(1, [("b", "?"), ("x", "f8")]))  # other fields
+    with pytest.raises(ScadeOneException):
+        e_struct.append_array(values, 2)  # no repeat factor
+    e_arrays = f.add_element("arrays", sd.create_array_type(struct_type, [2]))
+    e_arrays.append_array(values.reshape(2, 2))
+    e_mode = f.add_element("mode", enum_type)
+    e_mode.append_array(np.array([1]), 3)
+    e_mode.append_array(np.array([2, 0]))
+    # checked field by field, nothing appended
+    with pytest.raises(ScadeOneException, match="invalid enumeration code 5"):
+        e_mode.append_array(np.array([0, 1, 5, 7]))
+    invalid = values[:1].astype(other_dtype)
+    invalid["inner"]["x"] = 70000
+    with pytest.raises(ScadeOneException, match="out of int16 range for field inner.x"):
+        e_struct.append_array(invalid)
+    invalid = values[:1].astype(other_dtype)
+    invalid["mode"] = 7
+    with pytest.raises(ScadeOneException, match="code 7 for field mode"):
+        e_struct.append_array(invalid)
+    float_dtype = np.dtype(
+        [("b", "?"), ("inner", [("x", "f8"), ("v", "f8", (3,))]), ("mode", "i4"), ("d", "f4")]
+    )
+    with pytest.raises(ScadeOneException, match="field inner.x"):
+        e_struct.append_array(values[:1].astype(float_dtype))  # lossy float to int16
+    f.close()
+
+    f2 = sd.open_file(file_path)
+    structs = f2.find_element("struct").read_array()
+    assert structs.dtype == dtype
+    assert (structs[:4].data == values).all()
+    assert structs.mask["d"].tolist() == [False] * 4 + [True, False]
+    assert structs[5]["b"] and structs[5]["d"] == 0.0
+    # same values as read_values()
+    py_values = list(f2.find_element("struct").read_values())
+    assert str(py_values[2]) == "(true,(2,(6,7,8)),Fault,0.66667)"
+    assert (f2.find_element("arrays").read_array().data == values.reshape(2, 2)).all()
+    modes = f2.find_element("mode").read_array()
+    names = sd.numpy_enum_tables(enum_type)[""]
+    assert [names[code] for code in modes] == ["On"] * 3 + ["Fault", "Off"]
+    assert [str(value) for value in f2.find_element("mode").read_values()] == [
+        "On",
+        "On",
+        "On",
+        "Fault",
+        "Off",
+    ]
+    f2.close()
+    remove(file_path)
+
+
+def test_scan():
+    np = pytest.importorskip("numpy")
+    file_path: str = "test_scan.sd"
+
+    f = sd.create_file(file_path)
+    f.add_element("long", sd.Int32).append_array(np.arange(10000))
+    e_short = f.add_element("short", sd.create_array_type(sd.Float64, [2]))
+    e_short.append_array(np.ones((2500, 2)))
+    e_short.append_nones_sequence(10)
+    f.add_element("chars", sd.Char).append_value("a")  # unsupported type
+    f.add_element("group", group_expr="m::g").add_child_element("item", sd.Int8)
+    f.close()
+
+    f2 = sd.open_file(file_path)
+    chunks = list(f2.find_element("long").iter_chunks(3000))
+    assert [len(chunk) for chunk in chunks] == [3000, 3000, 3000, 1000]
+    assert (np.concatenate(chunks) == np.arange(10000)).all()
+    chunks = list(f2.find_element("long").iter_chunks(1000, start=9500, n=600))
+    assert [len(chunk) for chunk in chunks] == [500]
+    assert list(f2.find_element("group").children_elements[0].iter_chunks()) == []
+    with pytest.raises(ScadeOneException):
+        next(f2.find_element("long").iter_chunks(0))
+    f2.close()
+
+    chunks = list(sd.scan(file_path, chunk_size=4096))
+    assert [sorted(chunk) for chunk in chunks] == [["long", "short"], ["long"], ["long"]]
+    assert chunks[0]["short"].shape == (2510, 2)
+    assert chunks[0]["short"].mask.sum() == 20
+    assert sum(len(chunk["long"]) for chunk in chunks) == 10000
+    chunks = sd.scan(file_path, ["short"], chunk_size=2000)
+    assert len(next(chunks)["short"]) == 2000
+    chunks.close()  # closes the file
+    with pytest.raises(ScadeOneException):
+        next(sd.scan(file_path, ["unknown"]))
+    remove(file_path)
+
+
+def test_lazy_loading():
+    file_path: str = "test_lazy_loading.sd"
+
+    vector_type = sd.create_array_type(sd.Float64, [3])
+    struct_type = sd.create_struct_type([("p", vector_type), ("v", vector_type)], "State")
+    f = sd.create_file(file_path)
+    for i in range(10):
+        f.add_element(f"state{i}", struct_type).append_value([[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+    f.add_element("group", group_expr="m::g").add_child_element("item", struct_type)
+    f.close()
+
+    f2 = sd.open_file(file_path)
+    states = [f2.find_element(f"state{i}") for i in range(10)]
+    # types are loaded once per file
+    assert all(state.sd_type is states[0].sd_type for state in states)
+    assert states[0].sd_type.fields[0].sd_type is states[0].sd_type.fields[1].sd_type
+    assert str(states[0].sd_type) == "struct{p:float64^3,v:float64^3}"
+    item = f2.find_element("group").children_elements[0]
+    assert item.name == "item" and item.sd_type is states[0].sd_type
+    assert str(next(states[9].read_values())) == "((0,1,2),(3,4,5))"
+    f2.close()
+    # elements and types read before closing the file are kept
+    assert states[0].sd_type is item.sd_type and f2.elements[0] is states[0]
+    with pytest.raises(ScadeOneException, match="file is closed"):
+        states[0].children_elements
+
+    f3 = sd.open_file(file_path)
+    f3.close()
+    with pytest.raises(ScadeOneException, match="file is closed"):
+        f3.elements
+
+    # elements added before loading the existing ones are listed once
+    f4 = sd.edit_file(file_path)
+    group = f4.find_element("group")
+    group.add_child_element("item2", sd.Int8)
+    f4.add_element("new", sd.Int8)
+    assert [e.name for e in f4.elements].count("new") == 1
+    assert [e.name for e in group.children_elements] == ["item", "item2"]
+    with pytest.raises(ScadeOneException, match='cannot create element "new"'):
+        f4.add_element("new", sd.Int8)
+    with pytest.raises(ScadeOneException, match='cannot create child element "item"'):
+        group.add_child_element("item", sd.Int8)
+    assert len(f4.elements) == 12 and len(group.children_elements) == 2
+    f4.close()
+    remove(file_path)
+
+
+def test_find_element_by_path():
+    file_path: str = "test_find_element_by_path.sd"
+
+    f = sd.create_file(file_path)
+    e_op = f.add_element("op")
+    e_in1 = e_op.add_child_element("in1")
+    e_field = e_in1.add_child_element("field", sd.Int32)
+    assert e_field.path == "op/in1/field"
+    assert f.elements == [e_op] and e_in1.children_elements == [e_field]
+    assert f.find_element_by_path("op/in1/field") is e_field
+    assert f.find_element_by_path("op/in1/other") is None
+    # index kept up to date
+    e_other = e_in1.add_child_element("other", sd.Bool)
+    assert f.find_element_by_path("op/in1/other") is e_other
+    e_in1.name = "in2"
+    assert f.find_element_by_path("op/in1/field") is None
+    assert f.find_element_by_path("op/in2/field") is e_field
+    e_in1.remove_child_element(e_other)
+    assert f.find_element_by_path("op/in2/other") is None
+    e_out = f.add_element("out", sd.Int8)
+    assert f.find_element_by_path("out") is e_out
+    f.remove_element(e_op)
+    assert f.find_element_by_path("op/in2/field") is None
+    assert f.find_element_by_path("op") is None
+    # names with '/': the element with the fewest parents is found
+    e_a = f.add_element("a")
+    e_b = e_a.add_child_element("b", sd.Int8)
+    e_ab = f.add_element("a/b", sd.Int8)
+    assert e_b.path == e_ab.path == "a/b"
+    assert f.find_element_by_path("a/b") is e_ab
+    f.remove_element(e_ab)
+    assert f.find_element_by_path("a/b") is e_b
+    e_ab = f.add_element("a/b", sd.Int8)
+    f.remove_element(e_a)
+    assert f.find_element_by_path("a/b") is e_ab
+    f.close()
+    remove(file_path)
+
+    f = sd.create_file(file_path)
+    f.add_element("op").add_child_element("in1").add_child_element("field", sd.Int32)
+    f.add_element("out", sd.Int8)
+    f.close()
+    f2 = sd.open_file(file_path)
+    assert f2.find_element_by_path("op/in1/field").sd_type == sd.Int32
+    assert f2.find_element_by_path("out").path == "out"
+    f2.close()
+    remove(file_path)
+
+
 def test_group():
     file_path: str = "test_group.sd"
 
@@ -296,3 +296,76 @@ class TestDiagramCreator:
         assert len(diag.objects) == 4
         assert isinstance(diag.objects[3], swan.Block)
         assert swan.swan_to_str(diag.objects[3]) == "(#21 block operator1)"
+
+    def test_create_wire_in_existing_diagram(self, parser):
+        code = tools.versioned_swan_str(
+            """
+                node operator0 (i0: int32)
+                  returns (o0: int32; o1: int32)
+                  {
+                    diagram
+                      (#0 expr i0)
+                      (#1 def o0)
+                      (#2 def o1)
+                      (#5 wire #0 .(1) => #1)
+                  }
+                """,
+            "module0",
+        )
+        body = parser.module_body(code)
+        diag = body.operator_definitions[0].diagrams[0]
+        i0, o0, o1 = diag.objects[0:3]
+        # the existing wire is found from its source and its positional adaptation
+        wire = diag.connect((i0, "1"), o1)
+        assert wire is diag.objects[3]
+        assert swan.swan_to_str(wire) == "(#5 wire #0 .(1) => #1, #2)"
+        wire = diag.connect(i0, [o0, o1])
+        assert swan.swan_to_str(wire) == "(#6 wire #0 => #1, #2)"
+        assert diag.connect(i0, [o1, o0]) is wire
+        assert len(diag.objects) == 5
+
+    def test_build_diagram(self, parser, diagram_factory):
+        code = tools.versioned_swan_str(
+            """
+                node operator0 (i0: int32)
+                  returns (o0: int32; o1: int32)
+                  {
+                    diagram
+                      (#0 expr i0)
+                      (#1 def o0)
+                      (#5 wire #0 => #1)
+                  }
+                """,
+            "module0",
+        )
+        body = parser.module_body(code)
+        operator = body.operator_definitions[0]
+        diag = operator.diagrams[0]
+        i0, o0 = diag.objects[0:2]
+        o1 = diagram_factory.create_def_block(operator.outputs[1])
+        bar = diagram_factory.create_bar()
+        wires = diag.build(
+            blocks=[o1, bar],
+            wires=[(i0, [o0, o1]), (i0, o1), ((i0, "1"), bar), (bar, (o1, "a"))],
+        )
+        assert swan.swan_to_str(o1) == "(#6 def o1)"
+        assert swan.swan_to_str(bar) == "(#7 group)"
+        assert wires[0] is diag.objects[2]
+        assert wires[1] is wires[0]
+        assert swan.swan_to_str(wires[0]) == "(#5 wire #0 => #1, #6)"
+        assert swan.swan_to_str(wires[2]) == "(#8 wire #0 .(1) => #7)"
+        assert swan.swan_to_str(wires[3]) == "(#9 wire #7 => #6 .(a))"
+        assert len(diag.objects) == 7
+        assert all(obj.owner is diag for obj in diag.objects)
+        assert diag.get_block_sources(o1)[0][0] is i0
+
+        # an invalid wire end leaves the diagram and its wire index unchanged
+        o2 = diagram_factory.create_def_block(operator.outputs[1])
+        other = diagram_factory.create_def_block(operator.outputs[0])
+        with pytest.raises(ScadeOneException, match="not in a diagram"):
+            diag.build(blocks=[o2], wires=[(i0, o2), ((i0, "2"), o0), (i0, other)])
+        assert len(diag.objects) == 7 and o2.lunum is None
+        assert swan.swan_to_str(wires[0]) == "(#5 wire #0 => #1, #6)"
+        wire = diag.connect((i0, "2"), o0)
+        assert wire is diag.objects[7]
+        assert swan.swan_to_str(wire) == "(#10 wire #0 .(2) => #1)"
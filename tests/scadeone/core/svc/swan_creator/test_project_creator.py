@@ -30,6 +30,7 @@ from ansys.scadeone.core import ProjectFile, ScadeOne
 from ansys.scadeone.core.common.exception import ScadeOneException
 from ansys.scadeone.core.project import Project
 from ansys.scadeone.core.svc.swan_creator.project_creator import ProjectFactory
+from ansys.scadeone.core.svc.swan_hash import record_module_state
 from ansys.scadeone.core import swan
 from ansys.scadeone.core.common.versioning import FormatVersions
 
@@ -107,7 +108,7 @@ class TestProjectCreator:
         assert len(os.listdir(assets_dir)) == 1
         project.save()
         assert len(os.listdir(assets_dir)) == 4
-        assert os.listdir(assets_dir) == [
+        assert sorted(os.listdir(assets_dir)) == [
             "OneModule.swan",
             "SameName.swan",
             "SameName.swani",
@@ -136,7 +137,105 @@ class TestProjectCreator:
         project2 = app2.load_project(project_path)
         assert not app2.model.is_all_modules_loaded
         project2.save()
-        assert app2.model.is_all_modules_loaded
+        assert not app2.model.is_all_modules_loaded
+
+    def test_save_modified_modules(self, tmp_path: Path):
+        app = ScadeOne()
+        project_path = tmp_path / "ProjectSaveTest1" / "ProjectSaveTest1.sproj"
+        project = ProjectFactory.create_project(app, ProjectFile(project_path))
+        project.add_module_body("Changed").add_constant("c0", "int32", "0")
+        project.add_module_body("Loaded")
+        project.add_module_body("NotLoaded")
+        project.save()
+        assert not any(module.is_modified for module in app.model.modules)
+        assets_dir = project_path.parent / "assets"
+        # formatting which is not the printer one, kept if the module is not saved
+        for name in ("Loaded", "NotLoaded"):
+            path = assets_dir / f"{name}.swan"
+            path.write_text(path.read_text() + "\n\n")
+
+        app2 = ScadeOne()
+        project2 = app2.load_project(project_path)
+        changed = app2.model.get_module_body("Changed")
+        loaded = app2.model.get_module_body("Loaded")
+        assert not changed.is_modified and not loaded.is_modified
+        changed.add_constant("c1", "int32", "1")
+        assert changed.is_modified and not loaded.is_modified
+        project2.save()
+        assert not changed.is_modified
+        assert not app2.model.is_all_modules_loaded
+        assert (assets_dir / "Changed.swan").read_text().endswith("const c1: int32 = 1;\n")
+        for name in ("Loaded", "NotLoaded"):
+            assert (assets_dir / f"{name}.swan").read_text().endswith("\n\n\n")
+        assert sorted(os.listdir(assets_dir)) == ["Changed.swan", "Loaded.swan", "NotLoaded.swan"]
+
+    def test_save_direct_modifications(self, tmp_path: Path):
+        app = ScadeOne()
+        project_path = tmp_path / "ProjectSaveTest2" / "ProjectSaveTest2.sproj"
+        project = ProjectFactory.create_project(app, ProjectFile(project_path))
+        project.add_module_body("Direct")
+        project.save()
+        path = project_path.parent / "assets" / "Direct.swan"
+        path.write_text(
+            path.read_text()
+            + "node Op (i: int32) returns (o: int32) { let o = i; }\n\n"
+            + "node Other (i: int32) returns (o: int32) { let o = i; }\n"
+        )
+
+        # not tracked: a direct modification is not saved
+        app2 = ScadeOne()
+        project2 = app2.load_project(project_path)
+        module = app2.model.get_module_body("Direct")
+        op, other = module.declarations
+        pragma = swan.PragmaParser().parse("#pragma cg name:foo #end")
+        op.inputs[0].pragmas.append(pragma)
+        project2.save()
+        assert "#pragma" not in path.read_text()
+        op.inputs[0].pragmas.clear()
+
+        # tracked: no modification, nothing written
+        record_module_state(module)
+        path.write_text(path.read_text() + "\n")
+        project2.save()
+        assert path.read_text().endswith("}\n\n")
+
+        # interface modified without set_modified()
+        op.inputs[0].pragmas.append(pragma)
+        project2.save()
+        text = path.read_text()
+        assert "#pragma cg name:foo #end" in text
+        assert text.count("node Op") == 1 and text.count("node Other") == 1
+
+        # lazily loaded body modified without set_modified()
+        other.body.sections.clear()
+        project2.save()
+        assert path.read_text().count("let o = i;") == 1
+        # the saved state is the new reference
+        path.write_text(path.read_text() + "\n")
+        project2.save()
+        assert path.read_text().endswith("\n\n")
+
+    def test_save_all_modules(self, tmp_path: Path):
+        app = ScadeOne()
+        project_path = tmp_path / "ProjectSaveTest3" / "ProjectSaveTest3.sproj"
+        project = ProjectFactory.create_project(app, ProjectFile(project_path))
+        project.add_module_body("All")
+        project.save()
+        path = project_path.parent / "assets" / "All.swan"
+        path.write_text(
+            path.read_text() + "node Op (i: int32) returns (o: int32) { let o = i; }\n\n"
+        )
+
+        app2 = ScadeOne()
+        project2 = app2.load_project(project_path)
+        module = app2.model.get_module_body("All")
+        # modified without set_modified(), written with the other loaded modules
+        op = module.declarations[0]
+        op.inputs[0].pragmas.append(swan.PragmaParser().parse("#pragma cg name:foo #end"))
+        project2.save(only_modified=False)
+        text = path.read_text()
+        assert "#pragma cg name:foo #end" in text and not text.endswith("\n\n")
+        assert module.source_text is None and not module.is_modified
 
     def test_add_dependency(self, tmp_path: Path):
         """Test adding project dependencies."""
@@ -0,0 +1,160 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+
+from ansys.scadeone.core import ScadeOne
+from ansys.scadeone.core.common.exception import ScadeOneException
+from ansys.scadeone.core.common.storage import SwanString
+from ansys.scadeone.core.common.versioning import gen_swan_version
+from ansys.scadeone.core.model.loader import SwanParser
+from ansys.scadeone.core.svc.clone_detector import CloneDetector
+
+MODULE = """
+node op1 (a: int32; b: int32) returns (c: int32; d: int32)
+{
+  let c = (a + b) * (a - b) + 1;
+  diagram
+    (#0 expr a)
+    (#1 expr b)
+    (#2 block f)
+    (#3 def d)
+    (#4 wire #0 => #2 .(1))
+    (#5 wire #1 => #2 .(2))
+    (#6 wire #2 => #3)
+}
+
+node op2 (x: int32; y: int32) returns (z: int32; t: int32)
+{
+  let z = (x + y) * (x - y) + 1;
+  diagram
+    (#10 expr x)
+    (#11 expr y)
+    (#12 block f)
+    (#13 def t)
+    (#14 wire #10 => #12 .(1))
+    (#15 wire #11 => #12 .(2))
+    (#16 wire #12 => #13)
+}
+
+node op3 (x: int32; y: int32) returns (z: int32; t: int32)
+{
+  let z = (x + y) * (x - y) + 1;
+  diagram
+    (#10 expr x)
+    (#11 expr y)
+    (#12 block f)
+    (#13 def t)
+    (#14 wire #10 => #12 .(1))
+    (#15 wire #11 => #12 .(2))
+    (#16 wire #12 => #13)
+    (#17 expr x)
+    (#18 block op1)
+    (#19 wire #17 => #18 .(1))
+}
+
+function f (i: bool) returns (o: bool) o = not i;
+"""
+
+
+# same body as op1, with another interface
+OTHER_INTERFACE = """
+node op4 (a: int64; b: int64) returns (c: int64; d: int64)
+{
+  let c = (a + b) * (a - b) + 1;
+  diagram
+    (#0 expr a)
+    (#1 expr b)
+    (#2 block f)
+    (#3 def d)
+    (#4 wire #0 => #2 .(1))
+    (#5 wire #1 => #2 .(2))
+    (#6 wire #2 => #3)
+}
+"""
+
+
+def make_model(logger, swan_code):
+    code = SwanString(gen_swan_version() + swan_code, "module0")
+    model = ScadeOne().model
+    model.add_body(SwanParser(logger).module_body(code))
+    return model
+
+
+@pytest.fixture
+def model(unit_test_logger):
+    return make_model(unit_test_logger, MODULE)
+
+
+def names(group):
+    return sorted(str(item[0].id) for item in group.items)
+
+
+class TestCloneDetector:
+    def test_exact_clones(self, model):
+        detector = CloneDetector(model, min_size=5)
+        operators = detector.exact_clones("operator")
+        assert [names(group) for group in operators] == [["op1", "op2"]]
+        assert operators[0].is_exact
+        equations = detector.exact_clones("equation")
+        assert len(equations) == 1
+        assert len(equations[0].items) == 3
+        diagrams = detector.exact_clones("diagram")
+        assert len(diagrams) == 1
+        assert [len(part) for part in diagrams[0].items] == [7, 7, 7]
+
+    def test_min_size(self, model):
+        detector = CloneDetector(model, min_size=1000)
+        assert detector.exact_clones("operator") == []
+        assert detector.exact_clones("equation") == []
+        assert detector.exact_clones("diagram") == []
+        assert detector.near_duplicates(threshold=0.5) == []
+
+    def test_near_duplicates(self, model):
+        detector = CloneDetector(model)
+        groups = detector.near_duplicates(threshold=0.5)
+        assert len(groups) == 1
+        # op1 and op2 are exact clones, only one of them is kept
+        assert names(groups[0]) == ["op1", "op3"]
+        assert 0.5 <= groups[0].similarity < 1.0
+        assert detector.near_duplicates(threshold=0.9) == []
+
+    def test_near_duplicates_not_exact(self, unit_test_logger):
+        detector = CloneDetector(make_model(unit_test_logger, MODULE + OTHER_INTERFACE))
+        # same equations and diagram objects, but not exact clones
+        groups = detector.near_duplicates(threshold=0.9)
+        assert [names(group) for group in groups] == [["op1", "op4"]]
+        assert groups[0].similarity == 1.0
+        assert not groups[0].is_exact
+        # op3 is linked to op1 and op4: the similarity is the lowest of the linking pairs
+        groups = detector.near_duplicates(threshold=0.5)
+        assert [names(group) for group in groups] == [["op1", "op3", "op4"]]
+        assert 0.5 <= groups[0].similarity < 1.0
+        assert not groups[0].is_exact
+        # each operator compared with the next one of its buckets only
+        groups = detector.near_duplicates(threshold=0.5, max_bucket_size=1)
+        assert [names(group) for group in groups] == [["op1", "op3", "op4"]]
+
+    def test_bands(self, model):
+        with pytest.raises(ScadeOneException):
+            CloneDetector(model, num_perm=10, bands=3)
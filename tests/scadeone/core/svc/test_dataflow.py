@@ -0,0 +1,136 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.scadeone.core import ScadeOne
+from ansys.scadeone.core.common.storage import SwanString
+from ansys.scadeone.core.common.versioning import gen_swan_version
+from ansys.scadeone.core.model.loader import SwanParser
+from ansys.scadeone.core.svc.dataflow import DataflowGraph, EdgeKind, NodeKind
+
+
+@pytest.fixture
+def parser(unit_test_logger):
+    return SwanParser(unit_test_logger)
+
+
+@pytest.fixture
+def operator(parser):
+    code = SwanString(
+        gen_swan_version()
+        + """
+        node op (a: int32; b: int32; c: bool)
+          returns (o: int32; p: int32; q: int32)
+        {
+          var l: int32;
+          let
+            l = a + b;
+            o = l * 2;
+          diagram
+            (#0 expr l)
+            (#1 block g)
+            (#2 def p)
+            (#3 wire #0 => #1 .(x))
+            (#4 wire #1 .(y) => #2)
+          let
+            q : activate if c then q = a; else q = last 'q;;
+        }
+        """,
+        "module0",
+    )
+    body = parser.module_body(code)
+    return body.operator_definitions[0]
+
+
+def edges(graph: DataflowGraph, node: int):
+    return [
+        (graph.node_name(graph.indices[edge]), EdgeKind(graph.edge_kind[edge]))
+        for edge in range(graph.indptr[node], graph.indptr[node + 1])
+    ]
+
+
+class TestDataflowGraph:
+    def test_operator(self, operator):
+        graph = DataflowGraph.from_operator(operator)
+        names = [graph.node_name(node) for node in range(graph.node_count)]
+        kinds = [NodeKind(kind) for kind in graph.node_kind]
+        assert names == ["a", "b", "c", "o", "p", "q", "l", "l", "o", "#0", "#1", "#2"] + ["q"] * 3
+        assert kinds[:6] == [NodeKind.INPUT] * 3 + [NodeKind.OUTPUT] * 3
+        assert kinds[6:] == [
+            NodeKind.LOCAL,
+            NodeKind.EQUATION,
+            NodeKind.EQUATION,
+            NodeKind.EXPR_BLOCK,
+            NodeKind.BLOCK,
+            NodeKind.DEF_BLOCK,
+            NodeKind.DEF_BY_CASE,
+            NodeKind.EQUATION,
+            NodeKind.EQUATION,
+        ]
+        assert list(graph.operator_indptr) == [0, graph.node_count]
+        assert set(graph.node_operator) == {0}
+
+        # textual equations
+        assert edges(graph, 0) == [("l", EdgeKind.READ), ("q", EdgeKind.READ)]
+        assert edges(graph, 7) == [("l", EdgeKind.DEFINE)]
+        assert edges(graph, 6) == [("o", EdgeKind.READ), ("#0", EdgeKind.READ)]
+        # diagram
+        assert edges(graph, 9) == [("#1", EdgeKind.WIRE)]
+        assert edges(graph, 10) == [("#2", EdgeKind.WIRE)]
+        assert edges(graph, 11) == [("p", EdgeKind.DEFINE)]
+        x, y = graph.indptr[9], graph.indptr[10]
+        assert graph.edge_source_adaptation[x] == -1
+        assert graph.adaptations[graph.edge_target_adaptation[x]] == ".(x)"
+        assert graph.adaptations[graph.edge_source_adaptation[y]] == ".(y)"
+        assert graph.edge_target_adaptation[y] == -1
+        # def-by-case
+        assert edges(graph, 2) == [("q", EdgeKind.READ)]
+        assert edges(graph, 12) == [
+            ("q", EdgeKind.DEFINE),
+            ("q", EdgeKind.CONTROL),
+            ("q", EdgeKind.CONTROL),
+        ]
+        assert edges(graph, 5) == [("q", EdgeKind.READ)]
+
+    def test_csr_buffers(self, operator):
+        graph = DataflowGraph.from_operator(operator)
+        assert memoryview(graph.indptr).format == "q"
+        assert memoryview(graph.indices).itemsize == 4
+        assert len(graph.indptr) == graph.node_count + 1
+        assert graph.indptr[-1] == graph.edge_count
+        assert len(graph.edge_kind) == graph.edge_count
+        assert list(graph.successors(9)) == [10]
+
+    def test_model(self, cc_project):
+        app = ScadeOne()
+        app.load_project(cc_project)
+        model = app.model
+        graph = DataflowGraph.from_model(model)
+        assert len(graph.operators) == len(model.operator_definitions)
+        for index, operator in enumerate(graph.operators):
+            nodes = graph.operator_nodes(index)
+            assert all(graph.node_operator[node] == index for node in nodes)
+            # edges stay within operators
+            for node in nodes:
+                assert all(target in nodes for target in graph.successors(node))
+        assert graph.operator_indptr[-1] == graph.node_count
@@ -0,0 +1,127 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import xml.dom.minidom
+
+import pytest
+
+from ansys.scadeone.core import ScadeOne
+from ansys.scadeone.core.common.storage import SwanString
+from ansys.scadeone.core.common.versioning import gen_swan_version
+from ansys.scadeone.core.model.loader import SwanParser
+from ansys.scadeone.core.svc.graph_export import GraphExporter, GraphFormat
+
+
+@pytest.fixture
+def parser(unit_test_logger):
+    return SwanParser(unit_test_logger)
+
+
+@pytest.fixture
+def operator(parser):
+    code = SwanString(
+        gen_swan_version()
+        + """
+        node op (a: bool; b: bool) returns (o: int32; p: int32)
+        {
+          let automaton
+            initial state A :
+              unless if (a) if (b) restart B else restart C end;
+              let o = 0;
+            state B :
+              let o = 1;
+              until if (a) resume A;
+            state C :
+              let o = 2;
+            :2: C unless if (b) restart A;
+          ;
+          diagram
+            (#0 expr a)
+            (#1 block g)
+            (#2 def p)
+            (#3 wire #0 => #1 .(x))
+            (#4 wire #1 .(y) => #2)
+        }
+        """,
+        "module0",
+    )
+    body = parser.module_body(code)
+    return body.operator_definitions[0]
+
+
+class TestGraphExport:
+    def test_diagram(self, operator):
+        stream = io.StringIO()
+        GraphExporter(stream).export_diagram(operator.diagrams[0])
+        assert stream.getvalue() == (
+            'digraph "diagram" {\n'
+            '  "c1_0" [label="a", shape=box];\n'
+            '  "c1_1" [label="g", shape=box];\n'
+            '  "c1_2" [label="p", shape=box];\n'
+            '  "c1_0" -> "c1_1" [label=".(x)"];\n'
+            '  "c1_1" -> "c1_2" [label=".(y)"];\n'
+            "}\n"
+        )
+
+    def test_state_machine(self, operator):
+        stream = io.StringIO()
+        GraphExporter(stream).export_state_machines([operator])
+        lines = stream.getvalue().splitlines()
+        assert lines[:6] == [
+            'digraph "state_machines" {',
+            '  subgraph "cluster_c1" {',
+            '    label="module0::op";',
+            '    "c1_s0" [label="A", shape=doublecircle];',
+            '    "c1_s1" [label="B", shape=ellipse];',
+            '    "c1_s2" [label="C", shape=ellipse];',
+        ]
+        assert lines[6:-2] == [
+            '    "c1_f1" [label="", shape=diamond];',
+            '    "c1_s0" -> "c1_f1" [label="1: a"];',
+            '    "c1_s1" -> "c1_s0" [label="1: a", style=dashed];',
+            '    "c1_s2" -> "c1_s0" [label="2: b"];',
+            '    "c1_f1" -> "c1_s1" [label="1: b"];',
+            '    "c1_f1" -> "c1_s2" [label="2: else"];',
+        ]
+
+    def test_graphml(self, operator):
+        stream = io.StringIO()
+        exporter = GraphExporter(stream, GraphFormat.GRAPHML)
+        exporter.export_state_machine(operator.body.sections[0].equations[0])
+        document = xml.dom.minidom.parseString(stream.getvalue())
+        assert len(document.getElementsByTagName("node")) == 5
+        assert len(document.getElementsByTagName("edge")) == 5
+
+    def test_model(self, cc_project):
+        app = ScadeOne()
+        app.load_project(cc_project)
+        stream = io.StringIO()
+        GraphExporter(stream).export_call_graph(app.model)
+        text = stream.getvalue()
+        assert '"CC::CruiseControl" -> "CC::CruiseSpeedManagement"' in text
+        assert '"CC::CruiseSpeedManagement" -> "Utils::Limiter"' in text
+        stream = io.StringIO()
+        GraphExporter(stream, GraphFormat.GRAPHML).export_state_machines(app.model)
+        document = xml.dom.minidom.parseString(stream.getvalue())
+        assert len(document.getElementsByTagName("graph")) == 4
@@ -22,13 +22,18 @@
 
 # Flake8: noqa
 import logging
+import os
+from io import StringIO
 
 import pytest
 
 from ansys.scadeone.core.common.versioning import gen_swan_version
 from ansys.scadeone.core.common.storage import SwanString
 from ansys.scadeone.core.model.loader import SwanParser
-from ansys.scadeone.core.svc.swan_printer import swan_to_str
+from ansys.scadeone.core.svc.swan_hash import record_module_state
+from ansys.scadeone.core.svc.swan_printer import PPrinter, swan_to_files, swan_to_str
+from ansys.scadeone.core.swan import PragmaParser
+import ansys.scadeone.core.svc.common.renderer as R
 from tools import log_diff # type: ignore
 
 logging.basicConfig(level=logging.DEBUG)
@@ -2162,6 +2167,207 @@ node {syntax%operator 6%syntax} <<{syntax%N 0%syntax}>> (i0: int32;)
         res = swan_to_str(swan_obj)
         assert res == gen_swan_version() + "\n" + expected
 
+    @pytest.mark.parametrize("normalize", [True, False])
+    def test_streaming(self, normalize):
+        body = """\
+use A::B;
+use C as D;
+const C1: int32 = 1; C2: bool;
+type T = int32;
+function f (i: int32) returns (o: int32) o = i + C1;
+node g (i: int32) returns (o: int32)
+{
+  diagram
+    (#0 expr i)
+    (#1 def o)
+    (#2 wire #0 => #1)
+}
+"""
+        swan_obj = parser.module_body(SwanString(gen_swan_version() + "\n" + body))
+        expected = StringIO()
+        PPrinter(normalize).print(expected, swan_obj)
+        res = StringIO()
+        PPrinter(normalize, streaming=True).print(res, swan_obj)
+        assert res.getvalue() == expected.getvalue()
+
+    @pytest.mark.parametrize("normalize", [True, False])
+    def test_fast_renderer(self, normalize):
+        body = """\
+const C1: int32 = 1; C2: bool;
+function f (i: int32) returns (o: int32) o = (i + C1) * (i - C1);
+node g (i: int32) returns (o: int32)
+{
+  diagram
+    (#0 expr i)
+    (#1 def o)
+    (#2 wire #0 => #1)
+}
+"""
+        swan_obj = parser.module_body(SwanString(gen_swan_version() + "\n" + body))
+        expected = StringIO()
+        PPrinter(normalize).print(expected, swan_obj, R.Renderer(expected))
+        res = StringIO()
+        PPrinter(normalize).print(res, swan_obj, R.Renderer(res, fast=True))
+        assert res.getvalue() == expected.getvalue()
+
+    def test_fast_renderer_flush(self, monkeypatch):
+        class Stream(StringIO):
+            def __init__(self):
+                super().__init__()
+                self.sizes = []
+
+            def write(self, text):
+                self.sizes.append(len(text))
+                return super().write(text)
+
+        monkeypatch.setattr(R.Renderer, "FlushSize", 10)
+        doc = R.Document()
+        for _ in range(100):
+            # line breaks without indentation only
+            doc << "x" << R.DLineBreak(False)
+        res = Stream()
+        R.Renderer(res, fast=True).render(doc)
+        assert res.getvalue() == "x\n" * 100
+        assert len(res.sizes) > 1 and max(res.sizes) <= 11
+
+    def test_print_cache(self):
+        body = """\
+const C1: int32 = 1; C2: bool;
+node g (i: int32) returns (o: int32)
+{
+  diagram
+    (#0 expr i)
+    (#1 def o)
+    (#2 wire #0 => #1)
+}
+"""
+        swan_obj = parser.module_body(SwanString(gen_swan_version() + "\n" + body))
+        operator = swan_obj.operator_definitions[0]
+        diagram = operator.diagrams[0]
+        res = swan_to_str(operator, cache=True)
+        assert swan_to_str(operator, cache=True) is res
+        assert swan_to_str(operator, normalize=True, cache=True) == swan_to_str(operator, True)
+        module_res = swan_to_str(swan_obj, cache=True)
+        expr_res = swan_to_str(diagram.objects[0], cache=True)
+        # a modification of a descendant invalidates the cache of its owners only
+        diagram.add_bar()
+        assert swan_to_str(operator, cache=True) == swan_to_str(operator)
+        assert swan_to_str(operator, cache=True) != res
+        assert swan_to_str(swan_obj, cache=True) != module_res
+        assert swan_to_str(diagram.objects[0], cache=True) is expr_res
+
+    def test_keep_source(self):
+        body = """\
+use A;   -- comment
+const C1: int32 = 1;  C2: bool;
+
+-- f comment
+function f (i: int32) returns (o: int32) o = i+C1;
+type T = int32;
+"""
+        swan_obj = parser.module_body(SwanString(gen_swan_version() + "\n" + body))
+        assert swan_obj.source_text == body
+        assert [body[slice(*item.source_span)] for item in swan_obj.declarations] == [
+            "const C1: int32 = 1;  C2: bool;",
+            "function f (i: int32) returns (o: int32) o = i+C1;",
+            "type T = int32;",
+        ]
+        printer = PPrinter(False, streaming=True, keep_source=True)
+        res = StringIO()
+        printer.print(res, swan_obj)
+        assert res.getvalue() == gen_swan_version() + "\n" + body
+
+        # modified, removed and new items
+        const_decls, operator, _ = swan_obj.declarations
+        operator.add_input("j", "int32")
+        assert operator.is_modified and not const_decls.is_modified
+        del swan_obj.declarations[2]
+        swan_obj.add_declaration("sensor S: int8")
+        res = StringIO()
+        printer.print(res, swan_obj)
+        assert (
+            res.getvalue()
+            == gen_swan_version()
+            + "\n"
+            + """\
+use A;   -- comment
+const C1: int32 = 1;  C2: bool;
+
+-- f comment
+function f (i: int32;
+            j: int32;)
+  returns (o: int32;) o = i + C1;
+
+sensor S: int8;
+"""
+        )
+
+    def test_keep_source_direct_modification(self):
+        body = """\
+const C1: int32 = 1;  -- comment
+function f (i: int32) returns (o: int32) o = i+C1;
+type T = int32;
+"""
+        swan_obj = parser.module_body(SwanString(gen_swan_version() + "\n" + body))
+        record_module_state(swan_obj)
+        operator = swan_obj.declarations[1]
+        # modified without set_modified()
+        operator.inputs[0].pragmas.append(PragmaParser().parse("#pragma cg name:j #end"))
+        printer = PPrinter(False, streaming=True, keep_source=True)
+        res = StringIO()
+        printer.print(res, swan_obj)
+        # printing does not change the modification flags
+        assert not operator.is_modified
+        assert (
+            res.getvalue()
+            == gen_swan_version()
+            + "\n"
+            + """\
+const C1: int32 = 1;  -- comment
+function f (#pragma cg name:j #end i: int32;)
+  returns (o: int32;) o = i + C1;
+type T = int32;
+"""
+        )
+
+    def test_keep_source_other_version(self):
+        body = "const C1: int32 = 1;  -- comment\n"
+        swan_obj = parser.module_body(SwanString("-- version swan: 2025.0 graph: 2.0\n" + body))
+        assert swan_obj.source_version == "-- version swan: 2025.0 graph: 2.0"
+        # the source is not copied under the current version line
+        res = StringIO()
+        PPrinter(False, streaming=True, keep_source=True).print(res, swan_obj)
+        assert res.getvalue() == gen_swan_version() + "\nconst C1: int32 = 1;\n"
+
+    def test_keep_source_protected(self):
+        body = """\
+{text%node Op (i: int32) returns (o: int32) { let o = i; }%text}
+-- comment
+type T = int32;
+"""
+        swan_obj = parser.module_body(SwanString(gen_swan_version() + "\n" + body))
+        assert not swan_obj.has_source_spans
+        # the source of the removed protected item is not copied
+        del swan_obj.declarations[0]
+        res = StringIO()
+        PPrinter(False, streaming=True, keep_source=True).print(res, swan_obj)
+        assert res.getvalue() == gen_swan_version() + "\ntype T = int32;\n"
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_swan_to_files(self, workers, tmp_path):
+        modules = []
+        for idx in range(3):
+            body = f"function f{idx} (i: int32) returns (o: int32) o = i + {idx};\n"
+            module = parser.module_body(SwanString(gen_swan_version() + "\n" + body, f"M{idx}"))
+            module.source = str(tmp_path / f"M{idx}.swan")
+            modules.append(module)
+        timings = swan_to_files(modules, workers=workers)
+        assert list(timings) == [module.source for module in modules]
+        for module in modules:
+            with open(module.source, newline="") as fd:
+                assert fd.read() == swan_to_str(module)
+        assert sorted(os.listdir(tmp_path)) == ["M0.swan", "M1.swan", "M2.swan"]
+
 
 class TestDiagram_Scope_DefByCase:
     """
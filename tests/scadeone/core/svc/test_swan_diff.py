@@ -0,0 +1,150 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+
+import pytest
+
+from ansys.scadeone.core import ScadeOne, swan
+from ansys.scadeone.core.common.storage import SwanString
+from ansys.scadeone.core.common.versioning import gen_swan_version
+from ansys.scadeone.core.model.loader import SwanParser
+from ansys.scadeone.core.svc.swan_diff import ChangeKind
+
+MODULE = """
+const C: int32 = {const_value};
+
+node op (i0: int32) returns (o0: int32; o1: int32)
+{{
+  let o0 = i0 + {equation_value};
+  diagram
+    (#0 expr i0)
+    (#1 def o1)
+    (#2 wire #0 => #1)
+    {block}
+}}
+{operator}
+"""
+
+
+@pytest.fixture
+def parser(unit_test_logger):
+    return SwanParser(unit_test_logger)
+
+
+def make_model(parser, **values):
+    code = SwanString(gen_swan_version() + MODULE.format(**values), "module0")
+    model = ScadeOne().model
+    model.add_body(parser.module_body(code))
+    return model
+
+
+class TestSwanDiff:
+    def test_changes(self, parser):
+        model_a = make_model(
+            parser,
+            const_value=1,
+            equation_value=1,
+            block="",
+            operator="function f (i: bool) returns (o: bool);",
+        )
+        model_b = make_model(
+            parser,
+            const_value=1,
+            equation_value=2,
+            block="(#3 block f)",
+            operator="function g (i: bool) returns (o: bool);",
+        )
+        changes = [
+            (change.kind, change.category, change.path) for change in swan.diff(model_a, model_b)
+        ]
+        assert changes == [
+            (ChangeKind.CHANGED, "module", "module0.swan"),
+            (ChangeKind.CHANGED, "operator", "module0.swan/operator op"),
+            (ChangeKind.CHANGED, "equation", "module0.swan/operator op/equation o0"),
+            (ChangeKind.CHANGED, "diagram", "module0.swan/operator op/diagram 1"),
+            (ChangeKind.ADDED, "block", "module0.swan/operator op/diagram 1/block #3"),
+            (ChangeKind.REMOVED, "operator", "module0.swan/operator f"),
+            (ChangeKind.ADDED, "operator", "module0.swan/operator g"),
+        ]
+
+    def test_json(self, parser):
+        model_a = make_model(parser, const_value=1, equation_value=1, block="", operator="")
+        model_b = make_model(parser, const_value=2, equation_value=1, block="", operator="")
+        expected = [
+            {"kind": "changed", "category": "module", "path": "module0.swan"},
+            {"kind": "changed", "category": "constant", "path": "module0.swan/const C"},
+        ]
+        assert json.loads(swan.diff(model_a, model_b).to_json()) == expected
+        stream = io.StringIO()
+        swan.diff(model_a, model_b).to_json(stream)
+        assert json.loads(stream.getvalue()) == expected
+        stream = io.StringIO()
+        swan.diff(model_a, model_a).to_json(stream)
+        assert json.loads(stream.getvalue()) == []
+
+    def test_luid_change(self, parser):
+        code = """
+node op (i: bool) returns (o: int32; p: int32)
+{{
+  let p = {p_value};
+  let
+    automaton {luid}
+      initial state St1:
+        let o = {o_value};
+    ;
+}}
+"""
+
+        def make(**values):
+            source = SwanString(gen_swan_version() + code.format(**values), "m")
+            model = ScadeOne().model
+            model.add_body(parser.module_body(source))
+            return model
+
+        def changes(luid, o_value, ignore_layout=True):
+            model_a = make(luid="$sm0", o_value=1, p_value=1)
+            model_b = make(luid=luid, o_value=o_value, p_value=2)
+            return [
+                (change.kind, change.category)
+                for change in swan.diff(model_a, model_b, ignore_layout=ignore_layout)
+            ]
+
+        # luids are layout: the state machine is unchanged
+        assert changes("$sm1", 1) == [
+            (ChangeKind.CHANGED, "module"),
+            (ChangeKind.CHANGED, "operator"),
+            (ChangeKind.CHANGED, "equation"),
+        ]
+        assert (ChangeKind.REMOVED, "state_machine") in changes("$sm1", 1, ignore_layout=False)
+        assert (ChangeKind.ADDED, "state_machine") in changes("$sm0", 2)
+
+    def test_same_project(self, cc_project):
+        app_a = ScadeOne()
+        app_a.load_project(cc_project)
+        app_b = ScadeOne()
+        app_b.load_project(cc_project)
+        assert list(swan.diff(app_a.model, app_b.model)) == []
+        # identical files are not loaded
+        assert not app_a.model.modules
@@ -348,3 +348,34 @@ class TestDiagNav:
             print("Targets:", target_adaptations)
         assert source_adaptation == ".(typeField)"
         assert {".(typeField_in1)", ".(typeField_in2)"}.issubset(target_adaptations)
+
+    def test_navigation_after_edit(self):
+        m0 = ScadeOneFactory().module.create_module_body("m0")
+        op0 = m0.add_operator_definition("op0")
+        op0_in0 = op0.add_input("in0", "int32")
+        op1 = m0.add_operator_definition("op1")
+        diag = op0.add_diagram()
+        in_block = diag.add_expr_block(op0_in0)
+        op1_block = diag.add_block(op1)
+        diag.connect(in_block, op1_block)
+        # Navigation is built by the first query
+        assert [blk for (blk, _, _) in op1_block.sources] == [in_block]
+        # and then kept up to date by edits
+        bar = diag.add_bar()
+        diag.connect(in_block, bar)
+        diag.connect((op1_block, "x"), [(bar, "a"), (bar, "b")])
+        targets = in_block.targets
+        assert [blk for (blk, _, _) in targets] == [op1_block, bar]
+        sources = bar.sources
+        assert len(sources) == 2
+        (blk, conn_from, conn_to) = sources[0]
+        assert blk is in_block
+        assert conn_from is None and conn_to is None
+        (blk, conn_from, conn_to) = sources[1]
+        assert blk is op1_block
+        TestDiagNav._check(conn_from, ".(x)")
+        assert [swan.swan_to_str(adp) for adp in conn_to] == [".(a)", ".(b)"]
+        # same result as a navigation rebuilt from scratch
+        diag._consolidate()
+        assert [blk for (blk, _, _) in bar.sources] == [in_block, op1_block]
+        assert [blk for (blk, _, _) in in_block.targets] == [op1_block, bar]
@@ -0,0 +1,106 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+
+from ansys.scadeone.core.common.storage import SwanString
+from ansys.scadeone.core.common.versioning import gen_swan_version
+from ansys.scadeone.core.model.loader import SwanParser
+import ansys.scadeone.core.swan as swan
+
+
+@pytest.fixture
+def parser(unit_test_logger):
+    return SwanParser(unit_test_logger)
+
+
+def parse_operator(parser, swan_code: str):
+    code = SwanString(gen_swan_version() + "\n" + swan_code, "module0")
+    return parser.module_body(code).operator_definitions[0]
+
+
+DIAGRAM = """
+node op (i0: int32) returns (o0: int32)
+{{
+  diagram
+    (#0 expr i0 {pragma})
+    (#1 {luid} block {operator})
+    (#2 def o0)
+    (#3 wire #0 => #1)
+    (#4 wire #1 => #2)
+}}
+"""
+
+
+class TestStructuralHash:
+    def test_equal_structures(self, parser):
+        op1 = parse_operator(parser, DIAGRAM.format(pragma="", operator="f", luid=""))
+        op2 = parse_operator(parser, DIAGRAM.format(pragma="", operator="f", luid=""))
+        op3 = parse_operator(parser, DIAGRAM.format(pragma="", operator="g", luid=""))
+        assert op1.structural_hash() == op2.structural_hash()
+        assert op1.structural_hash() != op3.structural_hash()
+        # subtrees are compared whatever their owner
+        objects1, objects3 = op1.diagrams[0].objects, op3.diagrams[0].objects
+        assert objects1[0].structural_hash() == objects3[0].structural_hash()
+        assert objects1[1].structural_hash() != objects3[1].structural_hash()
+
+    def test_ignore_layout(self, parser):
+        op1 = parse_operator(parser, DIAGRAM.format(pragma="", operator="f", luid=""))
+        op2 = parse_operator(
+            parser,
+            DIAGRAM.format(
+                pragma='#pragma diagram {"xy":"H0;V0"} #end', operator="f", luid="$Block1"
+            ),
+        )
+        assert op1.structural_hash() != op2.structural_hash()
+        assert op1.structural_hash(ignore_layout=True) == op2.structural_hash(ignore_layout=True)
+
+    @pytest.mark.parametrize(
+        "pragma",
+        [
+            swan.PragmaParser().parse('#pragma diagram {"xy":"H0;V0"} #end'),
+            swan.Pragma(swan.PragmaKey.DIAGRAM, "detached"),
+            swan.Pragma('#pragma diagram {"xy":"H0;V0"} #end'),
+        ],
+    )
+    def test_add_layout_pragma(self, parser, pragma):
+        op = parse_operator(parser, DIAGRAM.format(pragma="", operator="f", luid=""))
+        op_hash = op.structural_hash()
+        layout_hash = op.structural_hash(ignore_layout=True)
+        block = op.diagrams[0].objects[1]
+        block.pragmas.append(pragma)
+        block.set_modified()
+        assert op.structural_hash() != op_hash
+        assert op.structural_hash(ignore_layout=True) == layout_hash
+
+    def test_invalidation(self, parser):
+        op = parse_operator(parser, DIAGRAM.format(pragma="", operator="f", luid=""))
+        diagram = op.diagrams[0]
+        op_hash = op.structural_hash()
+        diagram_hash = diagram.structural_hash()
+        bar = diagram.add_bar()
+        assert op.structural_hash() != op_hash
+        assert diagram.structural_hash() != diagram_hash
+        wire_hash = diagram.objects[3].structural_hash()
+        diagram.connect(diagram.objects[0], bar)
+        assert diagram.objects[3].structural_hash() != wire_hash
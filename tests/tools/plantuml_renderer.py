@@ -49,6 +49,7 @@ class PumlRenderer:
         self._content: StringIO = StringIO()
         self._rendered = {}
         self._links = []
+        self._docs = []
         self.note = note
 
     def render(self, doc: R.DElt) -> str:
@@ -110,9 +111,12 @@ class PumlRenderer:
 
     def _render_DBlock(self, doc: R.DBlock) -> None:
         self._render_DElt(doc)
-        self._add_field(doc, "doc", id(doc.doc))
-        self._links.append(f"{id(doc)} --> {id(doc.doc)} : doc")
-        self._render(doc.doc)
+        # keep the documents of the items, so that their ids are unique
+        docs = doc.docs
+        self._docs.extend(docs)
+        for item in docs:
+            self._links.append(f"{id(doc)} --> {id(item)} : doc")
+            self._render(item)
 
 
 def to_puml(doc: R.DElt, out_dir: Optional[str] = None, note: Optional[str] = None) -> None:
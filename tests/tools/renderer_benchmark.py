@@ -0,0 +1,76 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Benchmark of the standard and fast rendering paths of the document renderer.
+# A large module is built by repeating the declarations of the CruiseControl
+# example module, and its document is rendered by both paths.
+# Usage, from the tests directory:
+# python -m tools.renderer_benchmark [repeat]
+
+import logging
+import sys
+import timeit
+from io import StringIO
+from pathlib import Path
+
+from ansys.scadeone.core.common.storage import SwanFile
+from ansys.scadeone.core.model.loader import SwanParser
+from ansys.scadeone.core.svc.swan_printer import PPrinter
+import ansys.scadeone.core.svc.common.renderer as R
+
+CC_MODULE = Path(__file__).parents[2] / "examples/models/CC/CruiseControl/assets/CC.swan"
+
+
+def module_doc(repeat: int) -> R.Document:
+    """Return the document of the CC module, with its declarations repeated."""
+    module = SwanParser(logging.getLogger("benchmark")).module_body(SwanFile(CC_MODULE))
+    printer = PPrinter()
+    data = printer._push_and_get_doc_data({"visitor": None})
+    printer.visit(module)
+    doc = R.Document()
+    for _ in range(repeat):
+        doc << R.DBlock(data["visitor"])
+    return doc
+
+
+def render(doc: R.Document, fast: bool) -> str:
+    """Render the document and return the text."""
+    stream = StringIO()
+    R.Renderer(stream, fast=fast).render(doc)
+    return stream.getvalue()
+
+
+def main(repeat: int = 100, number: int = 5) -> None:
+    doc = module_doc(repeat)
+    text = render(doc, False)
+    assert text == render(doc, True)
+    print(f"Module of {len(text)} characters, {text.count(chr(10))} lines")
+    timings = {}
+    for fast in (False, True):
+        timings[fast] = min(timeit.repeat(lambda: render(doc, fast), number=1, repeat=number))
+        print(f"{'fast' if fast else 'standard'}: {timings[fast]:.3f} s")
+    print(f"Speed-up: {timings[False] / timings[True]:.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,132 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Benchmark of Element.append_value: appends scalar values one by one to an
+# element of a new simulation data file, and prints the time per value, which
+# shall not depend on the number of values. The values are appended to a single
+# sequence, or alternate with 'none' values, so that each value is in its own
+# sequence. Then compares Element.append_values_sequence and Element.append_array
+# for scalar values and for arrays of 10 floats, and Element.read_values and
+# Element.read_array when reading these values back (requires NumPy). Finally
+# appends step values with Element.append_array, with and without compression.
+# Usage, from the tests directory:
+# python -m tools.simdata_benchmark [count]
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import ansys.scadeone.core.svc.simdata as sd
+
+
+def append_values(count: int, with_nones: bool) -> float:
+    """Append *count* values to an element, alternating with 'none' values if
+    *with_nones*, and return the duration in seconds."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        f = sd.create_file(str(Path(tmp_dir) / "benchmark.sd"))
+        elem = f.add_element("e", sd.Int32)
+        start = time.perf_counter()
+        for value in range(count):
+            elem.append_value(value % 1000)
+            if with_nones:
+                elem.append_nones_sequence(1)
+        duration = time.perf_counter() - start
+        f.close()
+    return duration
+
+
+def append_sequence(count: int, dims: List[int], with_numpy: bool) -> Tuple[float, float]:
+    """Append *count* float64 values (arrays if *dims*) from a NumPy array, with
+    append_array or append_values_sequence, read them with read_array or read_values,
+    and return the write and read durations in seconds."""
+    import numpy as np
+
+    values = np.random.default_rng(1).random((count, *dims))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        f = sd.create_file(str(Path(tmp_dir) / "benchmark.sd"))
+        elem = f.add_element("e", sd.create_array_type(sd.Float64, dims) if dims else sd.Float64)
+        start = time.perf_counter()
+        if with_numpy:
+            elem.append_array(values)
+        else:
+            elem.append_values_sequence(values.tolist())
+        duration = time.perf_counter() - start
+        f.close()
+        f = sd.open_file(str(Path(tmp_dir) / "benchmark.sd"))
+        elem = f.find_element("e")
+        start = time.perf_counter()
+        if with_numpy:
+            assert elem.read_array().shape == values.shape
+        else:
+            assert sum(1 for _ in elem.read_values()) == count
+        read_duration = time.perf_counter() - start
+        f.close()
+    return duration, read_duration
+
+
+def append_steps(count: int, compress: bool) -> Tuple[float, int]:
+    """Append *count* float64 values made of 100 steps with append_array, and return
+    the duration in seconds and the file size in bytes."""
+    import numpy as np
+
+    values = np.repeat(np.arange(100, dtype=np.float64), max(count // 100, 1))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "benchmark.sd"
+        f = sd.create_file(str(file_path))
+        elem = f.add_element("e", sd.Float64)
+        start = time.perf_counter()
+        elem.append_array(values, compress=compress)
+        duration = time.perf_counter() - start
+        f.close()
+        size = file_path.stat().st_size
+    return duration, size
+
+
+def main(count: int = 1_000_000) -> None:
+    for with_nones in (False, True):
+        print("values alternating with nones:" if with_nones else "values:")
+        for n in (count // 100, count // 10, count):
+            duration = append_values(n, with_nones)
+            print(f"{n} values: {duration:.2f} s, {duration / n * 1e6:.2f} us per value")
+    for dims in ([], [10]):
+        n = count if not dims else count // 10
+        print(f"{n} float64{''.join(f'^{d}' for d in dims)} values from NumPy:")
+        for with_numpy in (False, True):
+            durations = append_sequence(n, dims, with_numpy)
+            names = (
+                ("append_array", "read_array")
+                if with_numpy
+                else ("append_values_sequence", "read_values")
+            )
+            for name, duration in zip(names, durations):
+                print(f"{name}: {duration:.2f} s, {duration / n * 1e6:.2f} us per value")
+    print(f"{count} float64 values in 100 steps:")
+    for compress in (False, True):
+        duration, size = append_steps(count, compress)
+        print(f"append_array(compress={compress}): {duration:.3f} s, {size} bytes")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
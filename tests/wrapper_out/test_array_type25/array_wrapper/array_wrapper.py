@@ -0,0 +1,63 @@
+# generated by PyScadeOne Wrapper 1.0
+
+from pathlib import Path
+import ctypes
+
+# load the SCADE executable code
+_lib_path = Path(__file__).parent / "libarray_wrapper.so"
+_lib = ctypes.cdll.LoadLibrary(str(_lib_path))
+
+
+def _ctypes_array2tuple(value: ctypes.Array) -> tuple:
+    if not isinstance(value, ctypes.Array):
+        raise TypeError("Expected a ctypes.Array")
+    return tuple(_ctypes_array2tuple(item) if isinstance(item, ctypes.Array) else item for item in value)
+
+
+# operator inputs
+class arrayOp_module0_Inputs:
+    def __init__(self) -> None:
+        self._i0 = (ctypes.c_int32 * 2 * 3)()
+
+    @property
+    def i0(self) -> tuple:
+        return self._i0
+
+    @i0.setter
+    def i0(self, value: tuple) -> None:
+        self._i0 = (ctypes.c_int32 * 2 * 3)(*value)
+
+
+# operator outputs
+class arrayOp_module0_Outputs:
+    def __init__(self) -> None:
+        self._o0 = (ctypes.c_int32 * 2 * 3)()
+
+    @property
+    def o0(self) -> tuple:
+        return _ctypes_array2tuple(self._o0)
+
+
+class arrayOp_module0:
+    def __init__(self) -> None:
+        self.cycle_fct = _lib.arrayOp_module0
+        self.cycle_fct.argtypes = [
+            ctypes.POINTER(ctypes.c_int32 * 2 * 3),
+            ctypes.POINTER(ctypes.c_int32 * 2 * 3),
+        ]
+        self.cycle_fct.restype = ctypes.c_void_p
+        self.inputs = arrayOp_module0_Inputs()
+        self.outputs = arrayOp_module0_Outputs()
+
+    def reset(self) -> None:
+        # no reset function
+        pass
+
+    def cycle(self, cycles: int = 1) -> None:
+        for i in range(cycles):
+            self.cycle_fct(
+                self.inputs._i0,
+                ctypes.byref(self.outputs._o0),
+            )
+
+# end of file
\ No newline at end of file
@@ -0,0 +1,21 @@
+/* generated by PyScadeOne Wrapper 1.0 */
+
+#include <stdlib.h>
+    
+#include "arrayOp_module0.h"
+
+
+
+/* module0::arrayOp */
+__attribute__ ((visibility("default"))) void* py_alloc_arrayOp_module0()
+{
+    return 0;
+}
+
+__attribute__ ((visibility("default"))) void py_free_arrayOp_module0(void *ctx)
+{
+    if (ctx != 0)
+        free(ctx);
+}
+
+/* end of file */
\ No newline at end of file
@@ -0,0 +1,21 @@
+/* generated by PyScadeOne Wrapper 1.0 */
+
+#include <stdlib.h>
+    
+#include "operator0_module0.h"
+
+
+
+/* module0::operator0 */
+__attribute__ ((visibility("default"))) void* py_alloc_operator0_module0()
+{
+    return 0;
+}
+
+__attribute__ ((visibility("default"))) void py_free_operator0_module0(void *ctx)
+{
+    if (ctx != 0)
+        free(ctx);
+}
+
+/* end of file */
\ No newline at end of file
@@ -0,0 +1,76 @@
+# generated by PyScadeOne Wrapper 1.0
+
+from pathlib import Path
+import ctypes
+from enum import Enum
+
+# load the SCADE executable code
+_lib_path = Path(__file__).parent / "libelab_wrapper.so"
+_lib = ctypes.cdll.LoadLibrary(str(_lib_path))
+elaboration_fct = _lib.swan_elaboration
+elaboration_fct.argtypes = []
+elaboration_fct.restype = ctypes.c_void_p
+elaboration_fct()
+
+class EnumType(Enum):
+    def __str__(self) -> str:
+        return self.name
+
+
+class kind_T_Variant_module0(Enum):
+    T_int = 0
+    T_bool_box = 1
+
+
+
+def _ctypes_array2tuple(value: ctypes.Array) -> tuple:
+    if not isinstance(value, ctypes.Array):
+        raise TypeError("Expected a ctypes.Array")
+    return tuple(_ctypes_array2tuple(item) if isinstance(item, ctypes.Array) else item for item in value)
+
+
+# operator inputs
+class operator0_module0_Inputs:
+    def __init__(self) -> None:
+        self._i0: bool = False
+
+    @property
+    def i0(self) -> bool:
+        return bool(self._i0)
+
+    @i0.setter
+    def i0(self, value: bool) -> None:
+        self._i0 = True if value else False
+
+
+# operator outputs
+class operator0_module0_Outputs:
+    def __init__(self) -> None:
+        self._o0 = ctypes.c_int32(0)
+
+    @property
+    def o0(self) -> int:
+        return self._o0
+
+
+class operator0_module0:
+    def __init__(self) -> None:
+        self.cycle_fct = _lib.operator0_module0
+        self.cycle_fct.argtypes = [
+            ctypes.c_uint8,
+        ]
+        self.cycle_fct.restype = ctypes.c_int32
+        self.inputs = operator0_module0_Inputs()
+        self.outputs = operator0_module0_Outputs()
+
+    def reset(self) -> None:
+        # no reset function
+        pass
+
+    def cycle(self, cycles: int = 1) -> None:
+        for i in range(cycles):
+            self.outputs._o0 = self.cycle_fct(
+                self.inputs._i0,
+            )
+
+# end of file
\ No newline at end of file
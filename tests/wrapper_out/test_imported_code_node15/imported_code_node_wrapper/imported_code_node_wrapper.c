@@ -0,0 +1,23 @@
+/* generated by PyScadeOne Wrapper 1.0 */
+
+#include <stdlib.h>
+    
+#include "test_node_module0.h"
+
+
+
+/* module0::test_node */
+__attribute__ ((visibility("default"))) void* py_alloc_test_node_module0()
+{
+    outC_test_node_module0 *ctx = (outC_test_node_module0*)malloc(sizeof(outC_test_node_module0));
+    test_node_init_module0(ctx);
+    return (void*)ctx;
+}
+
+__attribute__ ((visibility("default"))) void py_free_test_node_module0(void *ctx)
+{
+    if (ctx != 0)
+        free(ctx);
+}
+
+/* end of file */
\ No newline at end of file
@@ -0,0 +1,37 @@
+/* generated by PyScadeOne Wrapper 1.0 */
+
+#include <stdlib.h>
+    
+#include "function0_module0.h"
+    
+#include "node0_module0.h"
+
+
+
+/* module0::function0 */
+__attribute__ ((visibility("default"))) void* py_alloc_function0_module0()
+{
+    return 0;
+}
+
+__attribute__ ((visibility("default"))) void py_free_function0_module0(void *ctx)
+{
+    if (ctx != 0)
+        free(ctx);
+}
+
+/* module0::node0 */
+__attribute__ ((visibility("default"))) void* py_alloc_node0_module0()
+{
+    outC_node0_module0 *ctx = (outC_node0_module0*)malloc(sizeof(outC_node0_module0));
+    node0_init_module0(ctx);
+    return (void*)ctx;
+}
+
+__attribute__ ((visibility("default"))) void py_free_node0_module0(void *ctx)
+{
+    if (ctx != 0)
+        free(ctx);
+}
+
+/* end of file */
\ No newline at end of file
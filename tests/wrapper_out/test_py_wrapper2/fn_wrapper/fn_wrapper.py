@@ -0,0 +1,82 @@
+# generated by PyScadeOne Wrapper 1.0
+
+from pathlib import Path
+import ctypes
+
+# load the SCADE executable code
+_lib_path = Path(__file__).parent / "libfn_wrapper.so"
+_lib = ctypes.cdll.LoadLibrary(str(_lib_path))
+
+
+def _ctypes_array2tuple(value: ctypes.Array) -> tuple:
+    if not isinstance(value, ctypes.Array):
+        raise TypeError("Expected a ctypes.Array")
+    return tuple(_ctypes_array2tuple(item) if isinstance(item, ctypes.Array) else item for item in value)
+
+
+# operator inputs
+class function0_module0_Inputs:
+    def __init__(self) -> None:
+        self._i0: int = 0
+        self._i1: float = 0.0
+
+    @property
+    def i0(self) -> int:
+        return self._i0
+
+    @i0.setter
+    def i0(self, value: int) -> None:
+        self._i0 = value
+
+
+    @property
+    def i1(self) -> float:
+        return self._i1
+
+    @i1.setter
+    def i1(self, value: float) -> None:
+        self._i1 = value
+
+
+# operator outputs
+class function0_module0_Outputs:
+    def __init__(self) -> None:
+        self._o0 = ctypes.c_int32(0)
+        self._o1 = ctypes.c_float(0.0)
+
+    @property
+    def o0(self) -> int:
+        return self._o0.value
+
+    @property
+    def o1(self) -> float:
+        return self._o1.value
+
+
+class function0_module0:
+    def __init__(self) -> None:
+        self.cycle_fct = _lib.function0_module0
+        self.cycle_fct.argtypes = [
+            ctypes.c_int32,
+            ctypes.c_float,
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_float),
+        ]
+        self.cycle_fct.restype = ctypes.c_void_p
+        self.inputs = function0_module0_Inputs()
+        self.outputs = function0_module0_Outputs()
+
+    def reset(self) -> None:
+        # no reset function
+        pass
+
+    def cycle(self, cycles: int = 1) -> None:
+        for i in range(cycles):
+            self.cycle_fct(
+                self.inputs._i0,
+                self.inputs._i1,
+                ctypes.byref(self.outputs._o0),
+                ctypes.byref(self.outputs._o1),
+            )
+
+# end of file
\ No newline at end of file
@@ -0,0 +1,73 @@
+# generated by PyScadeOne Wrapper 1.0
+
+from pathlib import Path
+import ctypes
+
+# load the SCADE executable code
+_lib_path = Path(__file__).parent / "libsensor_wrapper.so"
+_lib = ctypes.cdll.LoadLibrary(str(_lib_path))
+# sensors
+class _Sensors:
+    def __init__(self) -> None:
+        self._sensor0 = ctypes.c_int32.in_dll(_lib, "sensor0_module0")
+        self._sensor1 = ctypes.c_float.in_dll(_lib, "sensor1_module0")
+
+    @property
+    def sensor0(self) -> int:
+        return self._sensor0.value
+
+    @sensor0.setter
+    def sensor0(self, value: int) -> None:
+        self._sensor0.value = value
+    @property
+    def sensor1(self) -> float:
+        return self._sensor1.value
+
+    @sensor1.setter
+    def sensor1(self, value: float) -> None:
+        self._sensor1.value = value
+
+# unique instance
+sensors = _Sensors()
+
+
+def _ctypes_array2tuple(value: ctypes.Array) -> tuple:
+    if not isinstance(value, ctypes.Array):
+        raise TypeError("Expected a ctypes.Array")
+    return tuple(_ctypes_array2tuple(item) if isinstance(item, ctypes.Array) else item for item in value)
+
+
+# operator inputs
+class opSensor0_module0_Inputs:
+    def __init__(self) -> None:
+        pass
+
+# operator outputs
+class opSensor0_module0_Outputs:
+    def __init__(self) -> None:
+        self._o0 = ctypes.c_int32(0)
+
+    @property
+    def o0(self) -> int:
+        return self._o0
+
+
+class opSensor0_module0:
+    def __init__(self) -> None:
+        self.cycle_fct = _lib.opSensor0_module0
+        self.cycle_fct.argtypes = [
+        ]
+        self.cycle_fct.restype = ctypes.c_int32
+        self.inputs = opSensor0_module0_Inputs()
+        self.outputs = opSensor0_module0_Outputs()
+
+    def reset(self) -> None:
+        # no reset function
+        pass
+
+    def cycle(self, cycles: int = 1) -> None:
+        for i in range(cycles):
+            self.outputs._o0 = self.cycle_fct(
+            )
+
+# end of file
\ No newline at end of file
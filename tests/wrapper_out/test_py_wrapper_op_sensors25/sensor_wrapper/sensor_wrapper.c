@@ -0,0 +1,29 @@
+/* generated by PyScadeOne Wrapper 1.0 */
+
+#include <stdlib.h>
+    
+#include "opSensor0_module0.h"
+
+#include "swan_sensors.h"
+
+/* module0::sensor0 */
+swan_int32 sensor0_module0;
+
+/* module0::sensor1 */
+swan_float32 sensor1_module0;
+
+
+
+/* module0::opSensor0 */
+__attribute__ ((visibility("default"))) void* py_alloc_opSensor0_module0()
+{
+    return 0;
+}
+
+__attribute__ ((visibility("default"))) void py_free_opSensor0_module0(void *ctx)
+{
+    if (ctx != 0)
+        free(ctx);
+}
+
+/* end of file */
\ No newline at end of file
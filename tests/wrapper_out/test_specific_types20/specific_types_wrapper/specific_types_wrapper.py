@@ -0,0 +1,280 @@
+# generated by PyScadeOne Wrapper 1.0
+
+from pathlib import Path
+from typing import Union
+import ctypes
+from enum import Enum
+
+# load the SCADE executable code
+_lib_path = Path(__file__).parent / "libspecific_types_wrapper.so"
+_lib = ctypes.cdll.LoadLibrary(str(_lib_path))
+
+def make_value(value, type_: type):
+    """Return a ctypes value from a Python literal."""
+    return type_(*value) if isinstance(value, tuple) else value
+
+
+class SequencedStructure(ctypes.Structure):
+    def __getitem__(self, key):
+        field = self._fields_[key][0]
+        return eval(f'self.{field}')
+
+    def __setitem__(self, key, value):
+        field = self._fields_[key][0]
+        exec(f'self.{field} = {value}')
+
+    def __str__(self) -> str:
+        fields_str = ", ".join(
+            [f"{field[0]}={getattr(self, field[0])}" for field in self._fields_]
+        )
+        return fields_str
+
+    def __eq__(self, other: "SequencedStructure") -> bool:
+        if not isinstance(other, SequencedStructure):
+            return False
+        return all(getattr(self, field[0]) == getattr(other, field[0]) for field in self._fields_)
+
+
+class tStruct_module0(SequencedStructure):
+    _fields_ = [
+        ('x', ctypes.c_int32),
+        ('y', ctypes.c_float),
+    ]
+
+    def __eq__(self, other: Union["tStruct_module0", tuple]) -> bool:
+        if isinstance(other, tuple):
+            if len(other) != len(self._fields_):
+                return False
+            return self == tStruct_module0(*other)
+        return super().__eq__(other)
+
+class EnumType(Enum):
+    def __str__(self) -> str:
+        return self.name
+
+
+class tSize_TypesModule(Enum):
+    Small = 0
+    High = 1
+
+
+class tColor_module0(Enum):
+    GREEN = 0
+    BLUE = 1
+    ORANGE = 2
+    RED = 3
+
+
+
+def _ctypes_array2tuple(value: ctypes.Array) -> tuple:
+    if not isinstance(value, ctypes.Array):
+        raise TypeError("Expected a ctypes.Array")
+    return tuple(_ctypes_array2tuple(item) if isinstance(item, ctypes.Array) else item for item in value)
+
+
+# operator inputs
+class operator0_module0_Inputs:
+    def __init__(self) -> None:
+        self._i0: int = 0
+        self._i1: int = 0
+        self._i3: float = 0.0
+        self._i4: int = 0
+        self._i5: int = 0
+        self._i6: bool = False
+        self._i7: tStruct_module0 = tStruct_module0()
+        self._i8 = (ctypes.c_float * 2)()
+
+    @property
+    def i0(self) -> int:
+        return self._i0
+
+    @i0.setter
+    def i0(self, value: int) -> None:
+        self._i0 = value
+
+
+    @property
+    def i1(self) -> int:
+        return self._i1
+
+    @i1.setter
+    def i1(self, value: int) -> None:
+        self._i1 = value
+
+
+    @property
+    def i3(self) -> float:
+        return self._i3
+
+    @i3.setter
+    def i3(self, value: float) -> None:
+        self._i3 = value
+
+
+    @property
+    def i4(self) -> tColor_module0:
+        if isinstance(self._i4, int):
+            return tColor_module0(self._i4)
+        return tColor_module0(self._i4.value)
+
+    @i4.setter
+    def i4(self, value: tColor_module0) -> None:
+        if not isinstance(value, tColor_module0):
+            raise TypeError(f"i4 expected a tColor_module0, but {type(value).__name__} was given.")
+        self._i4 = value.value
+
+
+    @property
+    def i5(self) -> tSize_TypesModule:
+        if isinstance(self._i5, int):
+            return tSize_TypesModule(self._i5)
+        return tSize_TypesModule(self._i5.value)
+
+    @i5.setter
+    def i5(self, value: tSize_TypesModule) -> None:
+        if not isinstance(value, tSize_TypesModule):
+            raise TypeError(f"i5 expected a tSize_TypesModule, but {type(value).__name__} was given.")
+        self._i5 = value.value
+
+
+    @property
+    def i6(self) -> bool:
+        return bool(self._i6)
+
+    @i6.setter
+    def i6(self, value: bool) -> None:
+        self._i6 = True if value else False
+
+
+    @property
+    def i7(self) -> tStruct_module0:
+        return self._i7
+
+    @i7.setter
+    def i7(self, value: tStruct_module0) -> None:
+        self._i7 = make_value(value, tStruct_module0)
+
+
+    @property
+    def i8(self) -> tuple:
+        return self._i8
+
+    @i8.setter
+    def i8(self, value: tuple) -> None:
+        self._i8 = (ctypes.c_float * 2)(*value)
+
+
+# operator outputs
+class operator0_module0_Outputs:
+    def __init__(self) -> None:
+        self._o0 = ctypes.c_int32(0)
+        self._o1 = ctypes.c_int32(0)
+        self._o3 = ctypes.c_float(0.0)
+        self._o4 = ctypes.c_int32(0)
+        self._o5 = ctypes.c_int32(0)
+        self._o6 = ctypes.c_uint8(False)
+        self._o7 = tStruct_module0()
+        self._o8 = (ctypes.c_float * 2)()
+
+    @property
+    def o0(self) -> int:
+        return self._o0.value
+
+    @property
+    def o1(self) -> int:
+        return self._o1.value
+
+    @property
+    def o3(self) -> float:
+        return self._o3.value
+
+    @property
+    def o4(self) -> tColor_module0:
+        if isinstance(self._o4, int):
+            return tColor_module0(self._o4)
+        return tColor_module0(self._o4.value)
+
+    @property
+    def o5(self) -> tSize_TypesModule:
+        if isinstance(self._o5, int):
+            return tSize_TypesModule(self._o5)
+        return tSize_TypesModule(self._o5.value)
+
+    @property
+    def o6(self) -> bool:
+        return bool(self._o6)
+
+    @property
+    def o7(self) -> tStruct_module0:
+        return self._o7
+
+    @property
+    def o8(self) -> tuple:
+        return _ctypes_array2tuple(self._o8)
+
+
+class operator0_module0:
+    def __init__(self) -> None:
+        alloc_fct = _lib.py_alloc_operator0_module0
+        alloc_fct.argtypes = []
+        alloc_fct.restype = ctypes.c_void_p
+        context = alloc_fct()
+        self._out_c = ctypes.c_void_p.from_address(context)
+        self.reset_fct = _lib.operator0_reset_module0
+        self.reset_fct.restype = ctypes.c_void_p
+        self.cycle_fct = _lib.operator0_module0
+        self.cycle_fct.argtypes = [
+            ctypes.c_int32,
+            ctypes.c_int32,
+            ctypes.c_float,
+            ctypes.c_int32,
+            ctypes.c_int32,
+            ctypes.c_uint8,
+            ctypes.POINTER(tStruct_module0),
+            ctypes.POINTER(ctypes.c_float * 2),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_float),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_uint8),
+            ctypes.POINTER(tStruct_module0),
+            ctypes.POINTER(ctypes.c_float * 2),
+            ctypes.POINTER(ctypes.c_void_p),
+        ]
+        self.cycle_fct.restype = ctypes.c_void_p
+        self.inputs = operator0_module0_Inputs()
+        self.outputs = operator0_module0_Outputs()
+
+    def __del__(self):
+        free_fct = _lib.py_free_operator0_module0
+        free_fct.argtypes = [ctypes.c_void_p]
+        free_fct.restype = None
+        free_fct(ctypes.byref(self._out_c))
+
+    def reset(self) -> None:
+        self.reset_fct(ctypes.byref(self._out_c))
+
+    def cycle(self, cycles: int = 1) -> None:
+        for i in range(cycles):
+            self.cycle_fct(
+                self.inputs._i0,
+                self.inputs._i1,
+                self.inputs._i3,
+                self.inputs._i4,
+                self.inputs._i5,
+                self.inputs._i6,
+                self.inputs._i7,
+                self.inputs._i8,
+                ctypes.byref(self.outputs._o0),
+                ctypes.byref(self.outputs._o1),
+                ctypes.byref(self.outputs._o3),
+                ctypes.byref(self.outputs._o4),
+                ctypes.byref(self.outputs._o5),
+                ctypes.byref(self.outputs._o6),
+                ctypes.byref(self.outputs._o7),
+                ctypes.byref(self.outputs._o8),
+                ctypes.byref(self._out_c),
+            )
+
+# end of file
\ No newline at end of file
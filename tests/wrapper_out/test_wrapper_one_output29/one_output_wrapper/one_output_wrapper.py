@@ -0,0 +1,61 @@
+# generated by PyScadeOne Wrapper 1.0
+
+from pathlib import Path
+import ctypes
+
+# load the SCADE executable code
+_lib_path = Path(__file__).parent / "libone_output_wrapper.so"
+_lib = ctypes.cdll.LoadLibrary(str(_lib_path))
+
+
+def _ctypes_array2tuple(value: ctypes.Array) -> tuple:
+    if not isinstance(value, ctypes.Array):
+        raise TypeError("Expected a ctypes.Array")
+    return tuple(_ctypes_array2tuple(item) if isinstance(item, ctypes.Array) else item for item in value)
+
+
+# operator inputs
+class oneOutput_module0_Inputs:
+    def __init__(self) -> None:
+        self._i0: int = 0
+
+    @property
+    def i0(self) -> int:
+        return self._i0
+
+    @i0.setter
+    def i0(self, value: int) -> None:
+        self._i0 = value
+
+
+# operator outputs
+class oneOutput_module0_Outputs:
+    def __init__(self) -> None:
+        self._o0 = ctypes.c_int32(0)
+
+    @property
+    def o0(self) -> int:
+        return self._o0
+
+
+class oneOutput_module0:
+    def __init__(self) -> None:
+        self.cycle_fct = _lib.oneOutput_module0
+        self.cycle_fct.argtypes = [
+            ctypes.c_int32,
+        ]
+        self.cycle_fct.restype = ctypes.c_int32
+        self.inputs = oneOutput_module0_Inputs()
+        self.outputs = oneOutput_module0_Outputs()
+
+    def reset(self) -> None:
+        # no reset function
+        pass
+
+    def cycle(self, cycles: int = 1) -> None:
+        for i in range(cycles):
+            self.outputs._o0 = self.cycle_fct(
+                self.inputs._i0,
+            )
+
+# end of file
\ No newline at end of file